@@ -7,9 +7,10 @@ const APPLICATIONS_ENDPOINT = 'applications/';
  */
 const createApplicationService = (executeApiCall) => {
     /**
-     * Retrieves a list of applications with optional filtering
-     * @param {Object} params - Query parameters for filtering and pagination
-     * @returns {Promise<Array>} List of application objects
+     * Retrieves a page of applications with optional filtering
+     * @param {Object} params - Query parameters for filtering, pagination (cursor, page_size)
+     *     and sparse fieldsets (fields, expand), e.g. { fields: 'id,name,status' } for a table
+     * @returns {Promise<Object>} Page of applications: { next, previous, results }
      */
     const listApplications = (params = {}) => {
         return executeApiCall({
@@ -1,17 +1,36 @@
+from django import forms
 from django.contrib import admin
+from django.contrib.admin.helpers import ActionForm
+from django.contrib.admin.utils import model_ngettext
+from django.db.models import Exists, OuterRef
 from django.urls import path
-from django.http import HttpResponseRedirect, HttpResponse
+from django.http import Http404, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.urls import reverse
 from django.utils import timezone
+from django.utils.cache import add_never_cache_headers
 from django.utils.html import format_html
 from .models import (
     Application, 
     ApplicationCompanyInfo,
     ApplicationSupplyChainPartner,
     ApplicationProduct,
+    ApplicationProductMaterial,
+    ApplicationCertificate,
+    CertificateVerification,
     BulkSubmission
 )
 from application import utils
+from product.models import ProductCategory
+from core.utils import (
+    LargeTableAdminMixin,
+    PaginatedInlineMixin,
+    get_user_roles,
+    inline_page_data,
+    is_customer_service,
+    is_reviewer
+)
+from application.utils.bulk_complete_applications import annotate_review_counts
+from application.utils.review_application import ReviewResult
 
 
 class ApplicationCompanyInfoInline(admin.StackedInline):
@@ -46,20 +65,23 @@ class ApplicationCompanyInfoInline(admin.StackedInline):
     def get_readonly_fields(self, request, obj=None):
         readonly_fields = list(super().get_readonly_fields(request, obj) or [])
         
-        if request.user.groups.filter(name='Customer Service').exists():
+        if is_customer_service(request.user):
             readonly_fields.extend(['is_approved', 'rejection_reason'])
-        elif request.user.groups.filter(name='Reviewer').exists():
+        elif is_reviewer(request.user):
             readonly_fields.extend(['name', 'address', 'city', 'state', 'zip_code', 'country'])
         
         return readonly_fields
 
 
-class ApplicationSupplyChainPartnerInline(admin.StackedInline):
+class ApplicationSupplyChainPartnerInline(PaginatedInlineMixin, admin.StackedInline):
     """
     Inline admin for supply chain partners with role-based permissions.
     Follows same permission pattern as company info inline.
+    Paginated so large applications keep a small change form.
     """
     model = ApplicationSupplyChainPartner
+    overview_fields = ('name', 'country', 'is_approved')
+    data_url_name = 'admin:application_application_inline_page'
     fieldsets = (
         ('Partner Information', {
             'fields': (
@@ -83,24 +105,28 @@ class ApplicationSupplyChainPartnerInline(admin.StackedInline):
     def get_readonly_fields(self, request, obj=None):
         readonly_fields = list(super().get_readonly_fields(request, obj) or [])
         
-        if request.user.groups.filter(name='Customer Service').exists():
+        if is_customer_service(request.user):
             readonly_fields.extend(['is_approved', 'rejection_reason'])
-        elif request.user.groups.filter(name='Reviewer').exists():
+        elif is_reviewer(request.user):
             readonly_fields.extend(['name', 'address', 'city', 'state', 'zip_code', 'country'])
         
         return readonly_fields
 
 
-class ApplicationProductInline(admin.StackedInline):
+class ApplicationProductInline(PaginatedInlineMixin, admin.StackedInline):
     """
     Inline admin for product information and composition details.
     Customer Service can edit product details but not approval decisions.
     Reviewer can only approve/reject products when application is in review.
+    Paginated so large applications keep a small change form.
     """
     model = ApplicationProduct
+    overview_fields = ('product_name', 'product_category', 'supply_chain_partner_name_raw', 'is_approved')
+    data_url_name = 'admin:application_application_inline_page'
     fieldsets = (
         ('Product Information', {
             'fields': (
+                'supply_chain_partner',
                 'supply_chain_partner_name_raw',
                 'product_name', 
                 'product_category'
@@ -126,23 +152,42 @@ class ApplicationProductInline(admin.StackedInline):
     def get_readonly_fields(self, request, obj=None):
         readonly_fields = list(super().get_readonly_fields(request, obj) or [])
         
-        if request.user.groups.filter(name='Customer Service').exists():
+        if is_customer_service(request.user):
             readonly_fields.extend(['is_approved', 'rejection_reason'])
-        elif request.user.groups.filter(name='Reviewer').exists():
-            readonly_fields.extend(['supply_chain_partner_name_raw', 'product_name', 'product_category', 'raw_materials_list'])
+        elif is_reviewer(request.user):
+            readonly_fields.extend(['supply_chain_partner', 'supply_chain_partner_name_raw', 'product_name', 'product_category', 'raw_materials_list'])
         
         return readonly_fields
 
+    def get_queryset(self, request):
+        """Load each product's partner (rendered read-only through its __str__) with the product."""
+        return super().get_queryset(request).select_related('supply_chain_partner__application')
+
+    def get_formset(self, request, obj=None, **kwargs):
+        """Limit the partner choices to the partners of this application."""
+        formset = super().get_formset(request, obj, **kwargs)
+        partner_field = formset.form.base_fields.get('supply_chain_partner')
+        if partner_field:
+            partner_field.queryset = (
+                obj.supply_chain_partners.all() if obj
+                else ApplicationSupplyChainPartner.objects.none()
+            )
+        return formset
+
 
-class ApplicationAdmin(admin.ModelAdmin):
+class ApplicationAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """
     Custom admin interface for managing sustainability certification applications.
     Provides role-based workflows for Customer Service and Reviewer groups.
     """
-    list_display = ('name', 'status', 'submission_date', 'submission_actions', 'completion_actions', 'download_actions')
+    list_display = (
+        'name', 'status', 'submission_date', 'partners_reviewed', 'products_reviewed',
+        'submission_actions', 'completion_actions', 'download_actions'
+    )
     list_filter = ('status',)
     search_fields = ('name',)
-    readonly_fields = ('submission_date',)
+    # Status only changes through the review actions (Application.transition)
+    readonly_fields = ('submission_date', 'status')
     
     fieldsets = (
         ('Application Details', {
@@ -168,14 +213,16 @@ class ApplicationAdmin(admin.ModelAdmin):
         ApplicationProductInline,
     ]
 
+    actions = ['complete_selected_applications', 'download_certificates_zip']
+
     def get_readonly_fields(self, request, obj=None):
         """Apply role-based field permissions for main application model."""
         readonly_fields = list(super().get_readonly_fields(request, obj) or [])
         
-        if request.user.groups.filter(name='Customer Service').exists():
-            readonly_fields.extend(['status', 'rejection_reason'])
-        elif request.user.groups.filter(name='Reviewer').exists():
-            readonly_fields.extend(['name', 'description', 'file', 'status'])
+        if is_customer_service(request.user):
+            readonly_fields.append('rejection_reason')
+        elif is_reviewer(request.user):
+            readonly_fields.extend(['name', 'description', 'file'])
         
         return readonly_fields
 
@@ -186,12 +233,12 @@ class ApplicationAdmin(admin.ModelAdmin):
             inline = inline_class(self.model, self.admin_site)
             
             if obj:
-                if request.user.groups.filter(name='Customer Service').exists():
+                if is_customer_service(request.user):
                     if hasattr(inline, 'readonly_fields'):
                         inline.readonly_fields = list(inline.readonly_fields) + ['is_approved', 'rejection_reason']
                     else:
                         inline.readonly_fields = ['is_approved', 'rejection_reason']
-                elif request.user.groups.filter(name='Reviewer').exists():
+                elif is_reviewer(request.user):
                     if obj.status != 'in_review':
                         if hasattr(inline, 'readonly_fields'):
                             inline.readonly_fields = list(inline.readonly_fields) + ['is_approved', 'rejection_reason']
@@ -202,11 +249,30 @@ class ApplicationAdmin(admin.ModelAdmin):
         
         return inline_instances
 
+    def get_queryset(self, request):
+        """Annotate partner and product review counts for the changelist columns."""
+        return annotate_review_counts(super().get_queryset(request))
+
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Search the full-text index: application, company, partner, product and material names.
+        Never returns duplicates, so no distinct() is needed.
+        """
+        return utils.search_applications(queryset, search_term), False
+
+    @admin.display(description='Partners approved', ordering='partner_count')
+    def partners_reviewed(self, obj):
+        return f"{obj.approved_partner_count} / {obj.partner_count}"
+
+    @admin.display(description='Products approved', ordering='product_count')
+    def products_reviewed(self, obj):
+        return f"{obj.approved_product_count} / {obj.product_count}"
+
     def submission_actions(self, obj):
         """Display submit button for Customer Service on pending applications."""
         if (obj.status == 'pending' and 
             hasattr(self, 'request') and 
-            self.request.user.groups.filter(name='Customer Service').exists()):
+            is_customer_service(self.request.user)):
             return format_html(
                 '<a class="button" href="{}" style="background: #4CAF50;">Submit Application</a>',
                 reverse('admin:application_application_submit', args=[obj.pk])
@@ -219,7 +285,7 @@ class ApplicationAdmin(admin.ModelAdmin):
         """Display complete/reject actions for Reviewer and show final status."""
         if (obj.status == 'in_review' and 
             hasattr(self, 'request') and 
-            self.request.user.groups.filter(name='Reviewer').exists()):
+            is_reviewer(self.request.user)):
             return format_html(
                 '<a class="button" href="{}">Complete Application</a>',
                 reverse('admin:application_application_complete', args=[obj.pk])
@@ -247,6 +313,8 @@ class ApplicationAdmin(admin.ModelAdmin):
     def changelist_view(self, request, extra_context=None):
         """Store request object for use in list display action methods."""
         self.request = request
+        # Resolve roles once up front; every row's action buttons reuse them
+        get_user_roles(request.user)
         return super().changelist_view(request, extra_context=extra_context)
 
     def get_urls(self):
@@ -265,24 +333,30 @@ class ApplicationAdmin(admin.ModelAdmin):
             ),
             path(
                 '<path:object_id>/download-pdf/',
-                self.admin_site.admin_view(self.download_pdf),
+                # Cacheable so browsers can revalidate with the certificate's ETag
+                self.admin_site.admin_view(self.download_pdf, cacheable=True),
                 name='application_application_download_pdf',
             ),
+            path(
+                '<path:object_id>/inline/<str:prefix>/',
+                self.admin_site.admin_view(self.inline_page),
+                name='application_application_inline_page',
+            ),
         ]
         return custom_urls + urls
 
     def submit_application(self, request, object_id):
         """Handle application submission - moves from pending to in_review status."""
-        if not request.user.groups.filter(name='Customer Service').exists():
+        if not is_customer_service(request.user):
             self.message_user(request, "You don't have permission to submit applications", level='ERROR')
             return HttpResponseRedirect(reverse('admin:application_application_changelist'))
         
         obj = self.get_object(request, object_id)  
-        if obj and obj.status == 'pending':
-            obj.status = 'in_review'
-            obj.submission_date = timezone.now()
-            obj.save()
+        result = utils.submit_application(obj) if obj else ReviewResult.INVALID
+        if result == ReviewResult.SUBMITTED:
             self.message_user(request, f"Application '{obj.name}' submitted for review")
+        elif result == ReviewResult.CONFLICT:
+            self.message_user(request, f"Application '{obj.name}' was changed by someone else. Please try again.", level='ERROR')
         else:
             self.message_user(request, "Application cannot be submitted", level='ERROR')
         
@@ -293,61 +367,104 @@ class ApplicationAdmin(admin.ModelAdmin):
         Handle application completion - approves or rejects based on component approvals.
         Application is completed only if all company info, partners, and products are approved.
         """
-        if not request.user.groups.filter(name='Reviewer').exists():
+        if not is_reviewer(request.user):
             self.message_user(request, "You don't have permission to complete applications", level='ERROR')
             return HttpResponseRedirect(reverse('admin:application_application_changelist'))
         
         obj = self.get_object(request, object_id)  
-        if obj and obj.status == 'in_review':
-            all_approved = (
-                obj.company_info.is_approved and
-                obj.supply_chain_partners.filter(is_approved=False).count() == 0 and
-                obj.products.filter(is_approved=False).count() == 0
+        result = utils.finalize_application(obj) if obj else ReviewResult.INVALID
+        if result == ReviewResult.COMPLETED:
+            self.message_user(request, f"Application '{obj.name}' approved and completed")
+        elif result == ReviewResult.REJECTED:
+            self.message_user(request, f"Application '{obj.name}' rejected - not all components approved", level='WARNING')
+        elif result == ReviewResult.FAILED:
+            self.message_user(
+                request, 
+                f"Application '{obj.name}' approved but failed to create permanent records. Please try again.", 
+                level='ERROR'
             )
-            
-            if all_approved:
-                success = utils.complete_application(obj)
-                if not success:
-                    self.message_user(
-                        request, 
-                        f"Application '{obj.name}' approved but failed to create permanent records. Please try again.", 
-                        level='ERROR'
-                    )
-                    return HttpResponseRedirect(reverse('admin:application_application_changelist'))
-                
-                obj.status = 'completed'
-                self.message_user(request, f"Application '{obj.name}' approved and completed")
-            else:
-                obj.status = 'rejected'
-                self.message_user(request, f"Application '{obj.name}' rejected - not all components approved", level='WARNING')
-            
-            obj.save()
+        elif result == ReviewResult.CONFLICT:
+            self.message_user(request, f"Application '{obj.name}' was already completed by someone else", level='ERROR')
         else:
             self.message_user(request, "Application cannot be completed", level='ERROR')
         
         return HttpResponseRedirect(reverse('admin:application_application_changelist'))
 
+    @admin.action(description="Complete selected in-review applications")
+    def complete_selected_applications(self, request, queryset):
+        """
+        Bulk completion - approves or rejects every selected in-review application.
+        Approval summaries and permanent records are processed in bulk.
+        """
+        if not is_reviewer(request.user):
+            self.message_user(request, "You don't have permission to complete applications", level='ERROR')
+            return
+        
+        outcomes = utils.bulk_complete_applications(queryset.values_list('pk', flat=True))
+        
+        counts = {}
+        for outcome in outcomes:
+            counts[outcome['outcome']] = counts.get(outcome['outcome'], 0) + 1
+        summary = ", ".join(f"{count} {outcome}" for outcome, count in counts.items())
+        
+        level = 'ERROR' if counts.get('failed') else 'INFO'
+        self.message_user(request, f"Bulk completion finished: {summary}", level=level)
+
+    @admin.action(description="Download certificates of selected applications (ZIP)")
+    def download_certificates_zip(self, request, queryset):
+        """
+        Stream a ZIP of the certificates of the selected completed or rejected applications.
+        Stored certificates are reused and missing ones rendered while the archive streams.
+        """
+        response = StreamingHttpResponse(utils.stream_certificates_zip(queryset), content_type='application/zip')
+        filename = f"certificates_{timezone.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
     def download_pdf(self, request, object_id):
-        """Handle PDF certificate generation and download for completed applications."""
+        """
+        Serve the pre-rendered PDF certificate for completed or rejected applications.
+        Never renders in the request; reports progress while a certificate is being rendered.
+        Supports conditional requests (ETag/Last-Modified) and byte ranges.
+        """
         obj = self.get_object(request, object_id)
         if obj and (obj.status == 'completed' or obj.status == 'rejected'):
-            pdf_content = utils.generate_pdf_certificate(obj)
-            if pdf_content:
-                response = HttpResponse(pdf_content, content_type='application/pdf')
+            certificate = utils.request_certificate(obj)
+            if certificate.status == ApplicationCertificate.Status.READY:
                 filename = f"sustainability_certificate_{obj.name.replace(' ', '_')}.pdf"
-                response['Content-Disposition'] = f'attachment; filename="{filename}"'
-                
-                return response
-            else:
+                return utils.serve_certificate(request, certificate, filename)
+            elif certificate.status == ApplicationCertificate.Status.FAILED:
                 self.message_user(
                     request, 
-                    f"Failed to generate PDF for '{obj.name}'", 
+                    f"Failed to generate PDF for '{obj.name}': {certificate.error_message}", 
                     level='ERROR'
                 )
+            else:
+                self.message_user(
+                    request,
+                    f"Certificate for '{obj.name}' is rendering ({certificate.progress}%). Please try again in a moment.",
+                    level='WARNING'
+                )
         else:
             self.message_user(request, "Certificate only available for completed or rejected applications", level='ERROR')
         
-        return HttpResponseRedirect(reverse('admin:application_application_changelist'))
+        response = HttpResponseRedirect(reverse('admin:application_application_changelist'))
+        add_never_cache_headers(response)
+        return response
+
+    def inline_page(self, request, object_id, prefix):
+        """
+        Return one page of a paginated inline's rows as JSON.
+        Lets the change form list large inlines lazily instead of rendering every row.
+        """
+        obj = self.get_object(request, object_id)
+        if obj is None or not self.has_view_or_change_permission(request, obj):
+            raise Http404
+
+        for inline in self.get_inline_instances(request, obj):
+            if isinstance(inline, PaginatedInlineMixin) and inline.get_formset(request, obj).get_default_prefix() == prefix:
+                return JsonResponse(inline_page_data(inline, request, obj, request.GET.get('page', 1)))
+        raise Http404
 
     def has_change_permission(self, request, obj=None):
         """
@@ -356,11 +473,11 @@ class ApplicationAdmin(admin.ModelAdmin):
         Reviewer can only edit applications in review.
         """
         if obj:
-            if (request.user.groups.filter(name='Customer Service').exists() and 
+            if (is_customer_service(request.user) and 
                 obj.status != 'pending'):
                 return False
             
-            if (request.user.groups.filter(name='Reviewer').exists() and 
+            if (is_reviewer(request.user) and 
                 obj.status != 'in_review'):
                 return False
         
@@ -381,8 +498,131 @@ class ApplicationAdmin(admin.ModelAdmin):
                 self.message_user(request, f"Failed to process Excel file for application: {obj.name}. Error: {e}", level='ERROR')
 
         return obj
-    
-class ApplicationInline(admin.StackedInline):
+
+
+class InReviewApplicationFilter(admin.SimpleListFilter):
+    """Filter staged rows by one of the applications currently in review."""
+    title = 'application in review'
+    parameter_name = 'application'
+
+    def lookups(self, request, model_admin):
+        return Application.objects.filter(
+            status=Application.Status.IN_REVIEW
+        ).order_by('name').values_list('pk', 'name')
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(application_id=self.value())
+        return queryset
+
+
+class SupplyChainPartnerFilter(admin.SimpleListFilter):
+    """Filter products by partner; lists the partners of the selected application only."""
+    title = 'supply chain partner'
+    parameter_name = 'partner'
+
+    def lookups(self, request, model_admin):
+        application_id = request.GET.get(InReviewApplicationFilter.parameter_name, '')
+        if not application_id.isdigit():
+            return ()
+        return ApplicationSupplyChainPartner.objects.filter(
+            application_id=application_id
+        ).order_by('name').values_list('pk', 'name')
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(supply_chain_partner_id=self.value())
+        return queryset
+
+
+class CatalogCategoryFilter(admin.SimpleListFilter):
+    """Filter products by whether their category matches an active catalog category."""
+    title = 'category in catalog'
+    parameter_name = 'in_catalog'
+
+    def lookups(self, request, model_admin):
+        return (('yes', 'Yes'), ('no', 'No'))
+
+    def queryset(self, request, queryset):
+        in_catalog = Exists(ProductCategory.objects.filter(
+            description__iexact=OuterRef('product_category'),
+            is_active=True
+        ))
+        if self.value() == 'yes':
+            return queryset.filter(in_catalog)
+        if self.value() == 'no':
+            return queryset.exclude(in_catalog)
+        return queryset
+
+
+class ReviewActionForm(ActionForm):
+    """Action form with the rejection reason shared by all rejected rows."""
+    rejection_reason = forms.CharField(
+        required=False,
+        label='Rejection reason',
+        widget=forms.TextInput(attrs={'size': 40})
+    )
+
+
+class ComponentReviewAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """
+    Base admin for staged partners and products with bulk review actions.
+    Reviewers approve or reject a filtered selection in a single UPDATE
+    instead of ticking inlines one at a time. Only rows of applications in
+    review are changed.
+    """
+    action_form = ReviewActionForm
+    actions = ['approve_selected', 'reject_selected']
+    list_select_related = ('application',)
+
+    def has_review_permission(self, request):
+        return is_reviewer(request.user) and self.has_change_permission(request)
+
+    @admin.action(description="Approve selected %(verbose_name_plural)s", permissions=['review'])
+    def approve_selected(self, request, queryset):
+        updated = utils.bulk_review_components(queryset, approve=True)
+        self.message_user(request, f"Approved {updated} {model_ngettext(self.opts, updated)} of applications in review")
+
+    @admin.action(description="Reject selected %(verbose_name_plural)s", permissions=['review'])
+    def reject_selected(self, request, queryset):
+        rejection_reason = request.POST.get('rejection_reason', '').strip()
+        if not rejection_reason:
+            self.message_user(request, "Enter a rejection reason to reject the selected rows", level='ERROR')
+            return
+
+        updated = utils.bulk_review_components(queryset, approve=False, rejection_reason=rejection_reason)
+        self.message_user(request, f"Rejected {updated} {model_ngettext(self.opts, updated)} of applications in review", level='WARNING')
+
+
+class ApplicationSupplyChainPartnerAdmin(ComponentReviewAdmin):
+    """Staged supply chain partners with bulk review actions."""
+    list_display = ('name', 'application', 'country', 'is_approved', 'rejection_reason')
+    list_filter = (InReviewApplicationFilter, 'is_approved', 'application__status')
+    search_fields = ('name', 'application__name')
+
+
+class ApplicationProductAdmin(ComponentReviewAdmin):
+    """Staged products with bulk review actions, filterable by partner and catalog category."""
+    list_display = (
+        'product_name', 'product_category', 'supply_chain_partner_name_raw',
+        'application', 'is_approved', 'rejection_reason'
+    )
+    list_filter = (
+        InReviewApplicationFilter, SupplyChainPartnerFilter, CatalogCategoryFilter,
+        'is_approved', 'application__status'
+    )
+    search_fields = ('product_name', 'product_category', 'supply_chain_partner_name_raw', 'application__name')
+
+
+class StagingAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """Plain admin for large staging tables, with estimated counts and keyset paging."""
+
+
+class ApplicationInline(PaginatedInlineMixin, admin.StackedInline):
+    """
+    Inline admin for the applications of a bulk submission.
+    Paginated; the outcome of every item is listed by the summary view.
+    """
     model = Application
     extra = 1
     readonly_fields = ['submission_date']
@@ -398,10 +638,13 @@ class ApplicationInline(admin.StackedInline):
     )
 
 class BulkSubmissionAdmin(admin.ModelAdmin):
-    list_display = ['name', 'status', 'created_at']
+    list_display = [
+        'name', 'status', 'created_at', 'item_count', 'imported_count', 'not_imported_count',
+        'in_review_count', 'completed_count', 'rejected_count', 'summary_link'
+    ]
     list_filter = ['status', 'created_at']
     search_fields = ['name', 'description']
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['created_at', 'updated_at', 'summary_link']
     inlines = [ApplicationInline]
     
     fieldsets = (
@@ -409,7 +652,7 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
             'fields': ('name', 'description')
         }),
         ('Status & Timing', {
-            'fields': ('status', ('created_at', 'updated_at'))
+            'fields': ('status', ('created_at', 'updated_at'), 'summary_link')
         }),
         ('Errors', {
             'fields': ('error_message', 'error_details'),
@@ -417,14 +660,73 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
         })
     )
 
+    def get_queryset(self, request):
+        """Annotate the item outcome counts, one subquery per count."""
+        return utils.annotate_bulk_submission_outcomes(super().get_queryset(request))
+
+    def get_urls(self):
+        """Add the per-item summary view."""
+        urls = super().get_urls()
+        custom_urls = [
+            path(
+                '<path:object_id>/summary/',
+                self.admin_site.admin_view(self.summary_view),
+                name='application_bulksubmission_summary',
+            ),
+        ]
+        return custom_urls + urls
+
+    def summary_view(self, request, object_id):
+        """
+        Stream the outcome of every item of a bulk submission as CSV.
+        Read-only, and never renders the applications as an inline formset.
+        """
+        obj = self.get_object(request, object_id)
+        if obj is None or not self.has_view_permission(request, obj):
+            raise Http404
+        response = StreamingHttpResponse(utils.stream_bulk_submission_summary(obj), content_type='text/csv')
+        response['Content-Disposition'] = f'attachment; filename="bulk_submission_{obj.pk}_summary.csv"'
+        return response
+
+    @admin.display(description='Items', ordering='item_count')
+    def item_count(self, obj):
+        return obj.item_count
+
+    @admin.display(description='Imported', ordering='imported_count')
+    def imported_count(self, obj):
+        return obj.imported_count
+
+    @admin.display(description='Not imported', ordering='not_imported_count')
+    def not_imported_count(self, obj):
+        return obj.not_imported_count
+
+    @admin.display(description='In review', ordering='in_review_count')
+    def in_review_count(self, obj):
+        return obj.in_review_count
+
+    @admin.display(description='Completed', ordering='completed_count')
+    def completed_count(self, obj):
+        return obj.completed_count
+
+    @admin.display(description='Rejected', ordering='rejected_count')
+    def rejected_count(self, obj):
+        return obj.rejected_count
+
+    @admin.display(description='Summary')
+    def summary_link(self, obj):
+        if obj is None or obj.pk is None:
+            return '-'
+        url = reverse('admin:application_bulksubmission_summary', args=[obj.pk])
+        return format_html('<a href="{}">Download CSV</a>', url)
+
     def get_readonly_fields(self, request, obj=None):
         """Apply role-based field permissions"""
         readonly_fields = list(super().get_readonly_fields(request, obj) or [])
         
-        if request.user.groups.filter(name='Reviewer').exists():
+        if is_reviewer(request.user):
             # Reviewer can only read, not edit
             readonly_fields.extend(['name', 'description', 'status', 'error_message', 'error_details'])
-        elif request.user.groups.filter(name='Customer Service').exists():
+        elif is_customer_service(request.user):
             # Customer Service can only edit when status is DRAFT
             if obj and obj.status != BulkSubmission.Status.DRAFT:
                 readonly_fields.extend(['name', 'description', 'status', 'error_message', 'error_details'])
@@ -437,14 +739,14 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
         for inline_class in self.inlines:
             inline = inline_class(self.model, self.admin_site)
             
-            if request.user.groups.filter(name='Reviewer').exists():
+            if is_reviewer(request.user):
                 # Reviewer - read only
                 inline.readonly_fields = list(getattr(inline, 'readonly_fields', [])) + [
                     'name', 'description', 'file', 'status', 'submission_date'
                 ]
                 inline.can_delete = False
                 inline.max_num = 0
-            elif request.user.groups.filter(name='Customer Service').exists():
+            elif is_customer_service(request.user):
                 # Customer Service - only editable when status is DRAFT
                 if obj and obj.status != BulkSubmission.Status.DRAFT:
                     inline.readonly_fields = list(getattr(inline, 'readonly_fields', [])) + [
@@ -459,10 +761,10 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         """Role-based change permissions"""
-        if request.user.groups.filter(name='Reviewer').exists():
+        if is_reviewer(request.user):
             return False
         
-        if (request.user.groups.filter(name='Customer Service').exists() and 
+        if (is_customer_service(request.user) and 
             obj and obj.status != BulkSubmission.Status.DRAFT):
             return False
             
@@ -470,16 +772,16 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
 
     def has_add_permission(self, request):
         """Role-based add permissions"""
-        if request.user.groups.filter(name='Reviewer').exists():
+        if is_reviewer(request.user):
             return False
         return super().has_add_permission(request)
 
     def has_delete_permission(self, request, obj=None):
         """Role-based delete permissions"""
-        if request.user.groups.filter(name='Reviewer').exists():
+        if is_reviewer(request.user):
             return False
         
-        if (request.user.groups.filter(name='Customer Service').exists() and 
+        if (is_customer_service(request.user) and 
             obj and obj.status != BulkSubmission.Status.DRAFT):
             return False
             
@@ -499,9 +801,12 @@ class BulkSubmissionAdmin(admin.ModelAdmin):
 
 # Register models with custom admin interface
 admin.site.register(Application, ApplicationAdmin)
-admin.site.register(ApplicationCompanyInfo)
-admin.site.register(ApplicationSupplyChainPartner)
-admin.site.register(ApplicationProduct)
+admin.site.register(ApplicationCompanyInfo, StagingAdmin)
+admin.site.register(ApplicationSupplyChainPartner, ApplicationSupplyChainPartnerAdmin)
+admin.site.register(ApplicationProduct, ApplicationProductAdmin)
+admin.site.register(ApplicationProductMaterial, StagingAdmin)
+admin.site.register(ApplicationCertificate)
+admin.site.register(CertificateVerification)
 admin.site.register(BulkSubmission, BulkSubmissionAdmin)
 
 
@@ -1,4 +1,6 @@
 from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+from application.utils.create_applications import create_applications
 from application.models import (
     Application, 
     ApplicationCompanyInfo, 
@@ -7,7 +9,88 @@ from application.models import (
 )
 
 
-class ApplicationProductSerializer(serializers.ModelSerializer):
+def parse_field_paths(value):
+    """Parse comma-separated dotted paths (``a,b.c``) into a tree: ``{'a': {}, 'b': {'c': {}}}``."""
+    tree = {}
+    for path in value.split(','):
+        node = tree
+        for name in path.strip().split('.'):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+class SparseFieldsetMixin:
+    """
+    Serializer mixin for sparse fieldsets (``?fields=``) and depth control (``?expand=``).
+    
+    ``fields`` lists the fields to render, with dotted paths reaching into
+    nested serializers (``fields=id,name,company_info.name``). ``expand``
+    lists the nested relations to render (``expand=supply_chain_partners.products``);
+    once it is given, relations that are not listed in either parameter
+    are left out. Without either parameter the full tree is rendered.
+    
+    Only read (GET) requests are trimmed, so writes always validate the
+    full input. Nested serializers receive their part of the fieldset from
+    their parent.
+    """
+    
+    def get_fields(self):
+        fields = super().get_fields()
+        fieldset = self.get_fieldset()
+        if fieldset is None:
+            return fields
+        
+        only, expand = fieldset
+        for name, field in list(fields.items()):
+            nested = getattr(field, 'child', field)
+            if isinstance(nested, SparseFieldsetMixin):
+                if (only is None and expand is None) or name in (only or {}) or name in (expand or {}):
+                    nested.fieldset = (
+                        (only or {}).get(name) or None,
+                        None if expand is None else expand.get(name, {})
+                    )
+                    continue
+                del fields[name]
+            elif only is not None and name not in only:
+                del fields[name]
+        return fields
+    
+    def get_fieldset(self):
+        """Return the ``(fields, expand)`` trees of this serializer, or None to render every field."""
+        if hasattr(self, 'fieldset'):
+            return self.fieldset
+        request = self.context.get('request')
+        if request is None or request.method not in SAFE_METHODS:
+            return None
+        only = request.query_params.get('fields')
+        expand = request.query_params.get('expand')
+        if only is None and expand is None:
+            return None
+        return (
+            parse_field_paths(only) if only is not None else None,
+            parse_field_paths(expand) if expand is not None else None
+        )
+
+
+def nested_relations(serializer, prefix='', many=False):
+    """
+    Yield ``(path, many)`` for every nested serializer ``serializer`` renders.
+    
+    ``path`` is the ORM lookup of the relation and ``many`` tells whether it
+    (or a relation above it) is to-many, i.e. needs prefetch_related rather
+    than select_related.
+    """
+    for field in serializer.fields.values():
+        nested = getattr(field, 'child', field)
+        if isinstance(nested, serializers.BaseSerializer):
+            path = prefix + field.source
+            nested_many = many or nested is not field
+            yield path, nested_many
+            yield from nested_relations(nested, path + '__', nested_many)
+
+
+class ApplicationProductSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for ApplicationProduct model.
     
@@ -19,6 +102,7 @@ class ApplicationProductSerializer(serializers.ModelSerializer):
         model = ApplicationProduct
         fields = [
             'id',
+            'supply_chain_partner',
             'supply_chain_partner_name_raw',
             'product_name', 
             'product_category',
@@ -26,10 +110,10 @@ class ApplicationProductSerializer(serializers.ModelSerializer):
             'is_approved',
             'rejection_reason'
         ]
-        read_only_fields = ['id', 'is_approved', 'rejection_reason']
+        read_only_fields = ['id', 'supply_chain_partner', 'is_approved', 'rejection_reason']
 
 
-class ApplicationSupplyChainPartnerSerializer(serializers.ModelSerializer):
+class ApplicationSupplyChainPartnerSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for ApplicationSupplyChainPartner model.
     
@@ -55,7 +139,7 @@ class ApplicationSupplyChainPartnerSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'is_approved', 'rejection_reason']
 
 
-class ApplicationCompanyInfoSerializer(serializers.ModelSerializer):
+class ApplicationCompanyInfoSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Serializer for ApplicationCompanyInfo model.
     
@@ -79,7 +163,7 @@ class ApplicationCompanyInfoSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'is_approved', 'rejection_reason']
 
 
-class ApplicationSerializer(serializers.ModelSerializer):
+class ApplicationSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     """
     Main Application serializer that handles complete application data.
     
@@ -98,6 +182,7 @@ class ApplicationSerializer(serializers.ModelSerializer):
             'description',
             'submission_date',
             'status',
+            'version',
             'file',
             'rejection_reason',
             'company_info',
@@ -107,35 +192,93 @@ class ApplicationSerializer(serializers.ModelSerializer):
             'id', 
             'submission_date', 
             'status', 
+            'version',
             'rejection_reason'
         ]
     
     def create(self, validated_data):
-        company_info_data = validated_data.pop('company_info')
-        supply_chain_partners_data = validated_data.pop('supply_chain_partners')
-        
-        application = Application.objects.create(
-            **validated_data,
-            status=Application.Status.IN_REVIEW
-        )
-        
-        ApplicationCompanyInfo.objects.create(
-            application=application,
-            **company_info_data
-        )
-        
-        for partner_data in supply_chain_partners_data:
-            products_data = partner_data.pop('products', [])
-            
-            partner = ApplicationSupplyChainPartner.objects.create(
-                application=application,
-                **partner_data
-            )
-            
-            for product_data in products_data:
-                ApplicationProduct.objects.create(
-                    application=application,
-                    **product_data
-                )
-
-        return application
\ No newline at end of file
+        return create_applications([validated_data])[0]
+
+class TransitionSerializer(serializers.Serializer):
+    """
+    Input serializer for application status transitions.
+    
+    The optional version makes the transition conditional on the client
+    having seen the latest state of the application.
+    """
+    version = serializers.IntegerField(
+        required=False,
+        min_value=0,
+        help_text="Expected application version; the transition fails with 409 if it changed."
+    )
+
+
+class BulkCreatedApplicationSerializer(serializers.ModelSerializer):
+    """
+    Application created by bulk create, listed in request order.
+    """
+    
+    class Meta:
+        model = Application
+        fields = ['id', 'name', 'status', 'version']
+
+
+class BulkCompleteSerializer(serializers.Serializer):
+    """
+    Input serializer for bulk completion of in-review applications.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        help_text="IDs of the in-review applications to complete."
+    )
+
+
+class BulkCompleteOutcomeSerializer(serializers.Serializer):
+    """
+    Per-application outcome returned by bulk completion.
+    """
+    id = serializers.IntegerField()
+    name = serializers.CharField(allow_null=True)
+    outcome = serializers.ChoiceField(choices=['completed', 'rejected', 'skipped', 'failed'])
+    message = serializers.CharField()
+
+
+class CertificateExportSerializer(serializers.Serializer):
+    """
+    Query parameters selecting the applications of a certificate export.
+    """
+    status = serializers.ChoiceField(
+        choices=['completed', 'rejected'],
+        required=False,
+        help_text="Only completed or only rejected applications (default both)."
+    )
+    submitted_after = serializers.DateTimeField(
+        required=False,
+        help_text="Only applications submitted at or after this time."
+    )
+    submitted_before = serializers.DateTimeField(
+        required=False,
+        help_text="Only applications submitted before this time."
+    )
+
+
+class VerifiedProductSerializer(serializers.Serializer):
+    """
+    Approved product listed on a verified certificate.
+    """
+    product_name = serializers.CharField(allow_null=True)
+    product_category = serializers.CharField(allow_null=True)
+    supply_chain_partner = serializers.CharField(allow_null=True)
+
+
+class CertificateVerificationSerializer(serializers.Serializer):
+    """
+    Public verification result for a certificate digest.
+    """
+    digest = serializers.CharField(help_text="SHA-256 of the certificate PDF.")
+    application_name = serializers.CharField()
+    status = serializers.CharField(help_text="Application status when the certificate was issued.")
+    approved_products = VerifiedProductSerializer(many=True)
+    is_current = serializers.BooleanField(help_text="False if a newer certificate replaced this one.")
+    issued_at = serializers.DateTimeField()
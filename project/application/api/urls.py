@@ -1,8 +1,11 @@
+from django.urls import path
 from rest_framework import routers
-from application.api.views import ApplicationViewSet
+from application.api.views import ApplicationViewSet, CertificateVerificationView
 
 
 router = routers.DefaultRouter()
 router.register('applications', ApplicationViewSet)
 
-urlpatterns = router.urls
\ No newline at end of file
+urlpatterns = router.urls + [
+    path('certificates/verify/<str:digest>/', CertificateVerificationView.as_view(), name='certificate-verify'),
+]
@@ -1,13 +1,70 @@
-from rest_framework import viewsets
-from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample
-from application.api.serializers import ApplicationSerializer
-from application.models import Application
+import re
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework import status, viewsets
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import AllowAny
+from rest_framework.views import APIView
+from rest_framework.decorators import action
+from rest_framework.generics import get_object_or_404
+from rest_framework.response import Response
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema, extend_schema_view, OpenApiExample, OpenApiParameter, OpenApiResponse
+from application.api.serializers import (
+    nested_relations,
+    ApplicationSerializer,
+    BulkCreatedApplicationSerializer,
+    TransitionSerializer,
+    BulkCompleteSerializer,
+    BulkCompleteOutcomeSerializer,
+    CertificateExportSerializer,
+    CertificateVerificationSerializer
+)
+from application.models import Application, ApplicationProductMaterial
+from application import utils
+from application.utils.response_cache import (
+    application_etag,
+    get_cached_application_payload,
+    response_variant
+)
+from core.utils import is_customer_service, is_reviewer
+from application.utils.review_application import ReviewResult
+
+DIGEST_RE = re.compile(r'^[0-9a-f]{64}$')
+BULK_CREATE_MAX_ITEMS = 1000
+
+FIELDSET_PARAMETERS = [
+    OpenApiParameter('fields', str, description="Comma-separated fields to return; dotted paths select nested fields (e.g. `id,name,status,company_info.name`)."),
+    OpenApiParameter('expand', str, description="Comma-separated nested relations to return (e.g. `company_info,supply_chain_partners.products`). When given, relations not listed here or in `fields` are neither queried nor returned."),
+]
+
+
+class ApplicationCursorPagination(CursorPagination):
+    """
+    Cursor pagination over the primary key, newest applications first.
+    
+    Pages are selected with an indexed ``id < cursor`` lookup, so every page
+    costs the same however deep the client pages, and rows inserted while
+    paging are never skipped or repeated.
+    """
+    
+    ordering = '-id'
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
 
 
 @extend_schema_view(
     list=extend_schema(
         summary="List all applications",
-        description="Retrieve a list of all certification applications with their nested data.",
+        description="Retrieve certification applications with their nested data, newest first. Results are cursor-paginated: follow the `next` and `previous` links.",
+        parameters=[
+            OpenApiParameter('material', str, description="Only applications using this raw material code (e.g. MAT-ORGANIC-COTTON)."),
+            OpenApiParameter('q', str, description="Full-text search over application, company, partner, product and material names."),
+            *FIELDSET_PARAMETERS
+        ],
         examples=[
             OpenApiExample(
                 'Success Response',
@@ -103,7 +160,8 @@ from application.models import Application
     ),
     retrieve=extend_schema(
         summary="Retrieve application",
-        description="Get detailed information about a specific application by ID."
+        description="Get detailed information about a specific application by ID. Responses carry a strong ETag; send it back in `If-None-Match` to get 304 Not Modified while the application and its staged data are unchanged.",
+        parameters=FIELDSET_PARAMETERS
     ),
     update=extend_schema(
         summary="Update application", 
@@ -116,6 +174,70 @@ from application.models import Application
     destroy=extend_schema(
         summary="Delete application",
         description="Remove an application from the system."
+    ),
+    submit=extend_schema(
+        summary="Submit application for review",
+        description="Move a pending application to review. Customer Service only. Fails with 409 if the application changed concurrently or the given version is stale.",
+        request=TransitionSerializer,
+        responses={200: ApplicationSerializer}
+    ),
+    complete=extend_schema(
+        summary="Complete application",
+        description="Complete or reject an in-review application based on its component approvals. Reviewers only. Fails with 409 if the application changed concurrently or the given version is stale.",
+        request=TransitionSerializer,
+        responses={200: ApplicationSerializer}
+    ),
+    certificates=extend_schema(
+        summary="Export certificates as ZIP",
+        description="Stream a ZIP archive with the certificates of completed and rejected applications, optionally filtered by status, submission period and raw material. Stored certificates are reused; missing ones are rendered while the archive streams and any that fail are listed in missing.txt.",
+        parameters=[
+            CertificateExportSerializer,
+            OpenApiParameter('material', str, description="Only applications using this raw material code (e.g. MAT-ORGANIC-COTTON).")
+        ],
+        responses={(200, 'application/zip'): OpenApiResponse(OpenApiTypes.BINARY, description="ZIP archive of certificates")}
+    ),
+    bulk_create=extend_schema(
+        summary="Bulk create applications",
+        description=f"Create up to {BULK_CREATE_MAX_ITEMS} applications, each with the same nested data as a single create. All items are validated before anything is written: if any item is invalid, nothing is created and the response lists one error object per item, in request order (empty for valid items). The applications are then created in a single transaction, so a request either creates all of them or none.",
+        request=ApplicationSerializer(many=True),
+        responses={
+            201: BulkCreatedApplicationSerializer(many=True),
+            400: OpenApiResponse(description="Per-item validation errors, in request order")
+        },
+        examples=[
+            OpenApiExample(
+                'Bulk Create Errors',
+                value=[
+                    {},
+                    {"company_info": ["This field is required."]},
+                    {"name": ["This field may not be blank."]}
+                ],
+                response_only=True,
+                status_codes=['400']
+            )
+        ]
+    ),
+    bulk_complete=extend_schema(
+        summary="Bulk complete applications",
+        description="Complete or reject many in-review applications at once. Reviewers only. Returns one outcome per requested ID, in request order.",
+        request=BulkCompleteSerializer,
+        responses={200: BulkCompleteOutcomeSerializer(many=True)},
+        examples=[
+            OpenApiExample(
+                'Bulk Complete Request',
+                value={"ids": [1, 2, 3]},
+                request_only=True
+            ),
+            OpenApiExample(
+                'Bulk Complete Response',
+                value=[
+                    {"id": 1, "name": "EcoFiber Textiles Application", "outcome": "completed", "message": "Application completed"},
+                    {"id": 2, "name": "BioTech Fabrics Application", "outcome": "rejected", "message": "Not all components approved"},
+                    {"id": 3, "name": "Draft Application", "outcome": "skipped", "message": "Application is not in review"}
+                ],
+                response_only=True
+            )
+        ]
     )
 )
 class ApplicationViewSet(viewsets.ModelViewSet):
@@ -127,4 +249,204 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     """
     
     queryset = Application.objects.all()
-    serializer_class = ApplicationSerializer
\ No newline at end of file
+    serializer_class = ApplicationSerializer
+    pagination_class = ApplicationCursorPagination
+
+    def get_queryset(self):
+        """
+        Optionally filter by raw material code (``?material=MAT-ORGANIC-COTTON``)
+        and by a full-text search query (``?q=organic cotton``).
+        
+        Reads load the nested data they render up front: company info is
+        joined and partners and their products are prefetched, so a page
+        costs a constant number of queries however many applications and
+        partners it holds. Relations left out with ``?fields=``/``?expand=``
+        are not queried at all.
+        """
+        queryset = super().get_queryset()
+        if self.action in ('list', 'retrieve'):
+            for path, many in nested_relations(self.get_serializer()):
+                queryset = queryset.prefetch_related(path) if many else queryset.select_related(path)
+        material = self.request.query_params.get('material')
+        if material:
+            queryset = queryset.filter(
+                pk__in=ApplicationProductMaterial.objects.filter(code=material).values('product__application_id')
+            )
+        query = self.request.query_params.get('q')
+        if query:
+            queryset = utils.search_applications(queryset, query)
+        return queryset
+
+    def get_revision_object(self):
+        """
+        Return the requested application with only its id and revision loaded.
+        
+        Uses the same lookup, filters and object permission checks as
+        ``get_object``, without loading the nested data.
+        """
+        queryset = self.filter_queryset(self.get_queryset()).select_related(None).prefetch_related(None)
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        obj = get_object_or_404(
+            queryset.only('pk', 'revision'), **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+        )
+        self.check_object_permissions(self.request, obj)
+        return obj
+
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serve the application by revision.
+        
+        The application and its revision are looked up, and access checked,
+        first; a matching ``If-None-Match`` gets 304 without serializing,
+        and otherwise the payload comes from the cache, keyed by
+        (id, revision, fieldset), unless it is the first request for this
+        revision.
+        """
+        application = self.get_revision_object()
+        application_id, revision = application.pk, application.revision
+        
+        variant = response_variant(
+            request.query_params.get('fields'),
+            request.query_params.get('expand'),
+            request.build_absolute_uri('/'),
+            request.accepted_renderer.format
+        )
+        etag = application_etag(application_id, revision, variant)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            data = get_cached_application_payload(
+                application_id, revision, variant, lambda: self.get_serializer(self.get_object()).data
+            )
+            response = Response(data)
+        response['ETag'] = etag
+        # Clients may keep the response but must revalidate it on every poll
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    @action(detail=False, methods=['get'])
+    def certificates(self, request):
+        serializer = CertificateExportSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        filters = serializer.validated_data
+        
+        queryset = self.filter_queryset(self.get_queryset())
+        if 'status' in filters:
+            queryset = queryset.filter(status=filters['status'])
+        if 'submitted_after' in filters:
+            queryset = queryset.filter(submission_date__gte=filters['submitted_after'])
+        if 'submitted_before' in filters:
+            queryset = queryset.filter(submission_date__lt=filters['submitted_before'])
+        
+        response = StreamingHttpResponse(utils.stream_certificates_zip(queryset), content_type='application/zip')
+        filename = f"certificates_{timezone.now().strftime('%Y%m%d_%H%M%S')}.zip"
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    @action(detail=False, methods=['post'], url_path='bulk')
+    def bulk_create(self, request):
+        serializer = self.get_serializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=BULK_CREATE_MAX_ITEMS
+        )
+        serializer.is_valid(raise_exception=True)
+        applications = utils.create_applications(serializer.validated_data)
+        return Response(
+            BulkCreatedApplicationSerializer(applications, many=True).data,
+            status=status.HTTP_201_CREATED
+        )
+
+    @action(detail=False, methods=['post'], url_path='bulk-complete')
+    def bulk_complete(self, request):
+        if not is_reviewer(request.user):
+            return Response(
+                {"detail": "You don't have permission to complete applications."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        serializer = BulkCompleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        outcomes = utils.bulk_complete_applications(serializer.validated_data['ids'])
+        return Response(BulkCompleteOutcomeSerializer(outcomes, many=True).data)
+
+    @action(detail=True, methods=['post'])
+    def submit(self, request, pk=None):
+        if not is_customer_service(request.user):
+            return Response(
+                {"detail": "You don't have permission to submit applications."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return self._transition(request, utils.submit_application)
+
+    @action(detail=True, methods=['post'])
+    def complete(self, request, pk=None):
+        if not is_reviewer(request.user):
+            return Response(
+                {"detail": "You don't have permission to complete applications."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        return self._transition(request, utils.finalize_application)
+
+    def _transition(self, request, transition):
+        """Run a review workflow step and map its result to a response."""
+        serializer = TransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        
+        application = self.get_object()
+        if 'version' in serializer.validated_data:
+            # The conditional UPDATE then checks against the version the client saw
+            application.version = serializer.validated_data['version']
+        
+        result = transition(application)
+        if result == ReviewResult.CONFLICT:
+            return Response(
+                {"detail": "Application was changed by someone else. Reload and try again."},
+                status=status.HTTP_409_CONFLICT
+            )
+        if result == ReviewResult.INVALID:
+            return Response(
+                {"detail": f"Application cannot be moved from status '{application.status}'."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if result == ReviewResult.FAILED:
+            return Response(
+                {"detail": "Failed to create permanent records. Please try again."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+        
+        application.refresh_from_db()
+        return Response(ApplicationSerializer(application, context=self.get_serializer_context()).data)
+
+
+class CertificateVerificationView(APIView):
+    """
+    Public endpoint confirming a certificate is genuine.
+    
+    Looks the SHA-256 digest of a certificate PDF up in the verification
+    table through the cache; no authentication, sessions or staging tables
+    are involved, so it can serve heavy third-party traffic.
+    """
+    
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    
+    @extend_schema(
+        summary="Verify certificate",
+        description="Confirm a certificate is genuine by the SHA-256 digest of its PDF file (e.g. `sha256sum certificate.pdf`). Returns the application name, its status and the approved products. No authentication required; responses are publicly cacheable.",
+        responses={
+            200: CertificateVerificationSerializer,
+            404: OpenApiResponse(description="No certificate with this digest was issued")
+        },
+        auth=[]
+    )
+    def get(self, request, digest):
+        digest = digest.lower()
+        verification = utils.get_certificate_verification(digest) if DIGEST_RE.match(digest) else None
+        if verification is None:
+            response = Response({"detail": "No certificate with this digest was issued."}, status=status.HTTP_404_NOT_FOUND)
+        else:
+            response = Response(CertificateVerificationSerializer(verification).data)
+        
+        patch_cache_control(response, public=True, max_age=getattr(settings, 'CERTIFICATE_VERIFICATION_CACHE_TIMEOUT', 300))
+        return response
@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ApplicationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'application'
+
+    def ready(self):
+        # Connect the search index signal receivers
+        from application import signals  # noqa: F401
@@ -0,0 +1,144 @@
+import resource
+import statistics
+import time
+import tracemalloc
+from itertools import cycle, islice
+from django.core.management.base import BaseCommand
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+from application import utils
+from application.models import Application
+from application.utils.generate_pdf_certificate import CERTIFICATE_TEMPLATE, render_certificate_html
+from application.utils.pdf_backends import get_pdf_backend_path
+
+BACKENDS = [
+    'application.utils.pdf_backends.PdfkitBackend',
+    'application.utils.pdf_backends.SimplePdfBackend',
+]
+
+
+class Command(BaseCommand):
+    """
+    Benchmark certificate rendering throughput.
+
+    Renders certificates for completed and rejected applications, first one
+    by one through ``generate_pdf_certificate`` and then in parallel through
+    ``generate_pdf_certificates_parallel``, and reports certificates per
+    second for each. With the pdfkit backend both runs start one
+    wkhtmltopdf process per certificate, so the speedup only measures how
+    well those processes overlap. Then compares PDF backends on the same
+    HTML: per-certificate latency, Python memory peak (tracemalloc) and the
+    peak RSS of renderer subprocesses. Nothing is stored. Applications are
+    repeated when there are fewer than --count.
+
+    Example usage:
+        python manage.py benchmark_certificates
+        python manage.py benchmark_certificates --count 200 --workers 8
+        python manage.py benchmark_certificates --backends application.utils.pdf_backends.SimplePdfBackend
+    """
+
+    help = 'Benchmark one-shot against parallel certificate rendering'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--count',
+            type=int,
+            default=50,
+            help='Number of certificates rendered per run'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=None,
+            help='Parallel renderer pool size (defaults to CERTIFICATE_RENDER_WORKERS)'
+        )
+        parser.add_argument(
+            '--backends',
+            nargs='*',
+            default=BACKENDS,
+            help='Dotted paths of the PDF backends to compare'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the benchmark command.
+        """
+        applications = list(
+            Application.objects.filter(
+                status__in=[Application.Status.COMPLETED, Application.Status.REJECTED],
+                company_info__isnull=False
+            ).select_related('company_info').order_by('pk')
+        )
+        if not applications:
+            self.stdout.write(self.style.WARNING("No completed or rejected applications to render"))
+            return
+
+        count = options['count']
+        self.stdout.write(f"Rendering {count} certificates with {get_pdf_backend_path()}...")
+
+        start = time.perf_counter()
+        one_shot_failed = sum(
+            1 for application in islice(cycle(applications), count)
+            if not utils.generate_pdf_certificate(application)
+        )
+        one_shot_seconds = time.perf_counter() - start
+        self._report('One-shot', count, one_shot_seconds, one_shot_failed)
+
+        # Parallel results are keyed by application id, so repeated
+        # applications are rendered in successive runs
+        start = time.perf_counter()
+        parallel_failed = 0
+        for offset in range(0, count, len(applications)):
+            run = applications[:count - offset]
+            pdfs = utils.generate_pdf_certificates_parallel(run, max_workers=options['workers'])
+            parallel_failed += sum(1 for pdf in pdfs.values() if not pdf)
+        parallel_seconds = time.perf_counter() - start
+        self._report('Parallel', count, parallel_seconds, parallel_failed)
+
+        if parallel_seconds:
+            self.stdout.write(self.style.SUCCESS(f"Speedup: {one_shot_seconds / parallel_seconds:.2f}x"))
+
+        template = get_template(CERTIFICATE_TEMPLATE)
+        html_contents = [render_certificate_html(application, template) for application in applications]
+        self.stdout.write(f"Comparing PDF backends over {count} renders...")
+        for path in options['backends']:
+            self._benchmark_backend(path, html_contents, count)
+
+    def _benchmark_backend(self, path, html_contents, count):
+        """Report latency and memory of one backend rendering the given HTML."""
+        try:
+            backend = import_string(path)()
+            backend.render(html_contents[0])
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"  - {path}: unavailable ({e})"))
+            return
+
+        children_before = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        latencies = []
+        for html_content in islice(cycle(html_contents), count):
+            start = time.perf_counter()
+            backend.render(html_content)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+        # Memory is measured in a separate pass since tracing slows rendering down
+        tracemalloc.start()
+        for html_content in html_contents:
+            backend.render(html_content)
+        _, python_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # ru_maxrss is the largest child ever (KiB on Linux); it only tells
+        # something about this backend if one of its subprocesses raised it
+        children_peak = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+        subprocess_peak = f"{children_peak / 1024:.1f}MiB" if children_peak > children_before else "n/a"
+
+        p95 = statistics.quantiles(latencies, n=20)[-1] if len(latencies) > 1 else latencies[0]
+        self.stdout.write(self.style.SUCCESS(
+            f"  - {path}: mean {statistics.mean(latencies):.1f}ms, p95 {p95:.1f}ms, "
+            f"python peak {python_peak / 1024 / 1024:.1f}MiB, "
+            f"subprocess peak RSS {subprocess_peak}"
+        ))
+
+    def _report(self, label, count, seconds, failed):
+        rate = count / seconds if seconds else 0
+        style = self.style.ERROR if failed else self.style.SUCCESS
+        self.stdout.write(style(f"  - {label}: {seconds:.2f}s, {rate:.1f} certificates/sec, {failed} failed"))
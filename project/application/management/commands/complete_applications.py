@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand
+from application import utils
+from application.models import Application
+from application.utils.bulk_complete_applications import DEFAULT_CHUNK_SIZE
+
+class Command(BaseCommand):
+    """
+    Complete or reject in-review applications in bulk.
+
+    Fully approved applications are completed and their permanent records
+    created; the rest are rejected. Prints one outcome line per application.
+
+    Example usage:
+        python manage.py complete_applications --all
+        python manage.py complete_applications 12 15 18 --chunk-size 100
+    """
+
+    help = 'Complete or reject in-review applications in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'ids',
+            nargs='*',
+            type=int,
+            help='IDs of the applications to complete'
+        )
+        parser.add_argument(
+            '--all',
+            action='store_true',
+            help='Complete every application currently in review'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help='Number of applications completed per transaction'
+        )
+
+    def handle(self, *args, **options):
+        """
+        Execute the bulk completion command.
+        """
+        if options['all']:
+            application_ids = list(
+                Application.objects.filter(status=Application.Status.IN_REVIEW)
+                .order_by('pk')
+                .values_list('pk', flat=True)
+            )
+        else:
+            application_ids = options['ids']
+
+        if not application_ids:
+            self.stdout.write(self.style.WARNING("No applications to complete"))
+            return
+
+        self.stdout.write(f"Completing {len(application_ids)} applications...")
+
+        try:
+            outcomes = utils.bulk_complete_applications(application_ids, chunk_size=options['chunk_size'])
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Failed to complete applications: {e}"))
+            return
+
+        styles = {
+            'completed': self.style.SUCCESS,
+            'rejected': self.style.WARNING,
+            'skipped': self.style.NOTICE,
+            'failed': self.style.ERROR,
+        }
+        for outcome in outcomes:
+            style = styles[outcome['outcome']]
+            self.stdout.write(style(
+                f"  - [{outcome['id']}] {outcome['name']}: {outcome['outcome']} ({outcome['message']})"
+            ))
+
+        self.stdout.write(self.style.SUCCESS('Bulk completion finished'))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from application import utils
+from application.models import Application
+
+
+class Command(BaseCommand):
+    """
+    Rebuild the application full-text search index from scratch.
+
+    The index is kept up to date on save; use this after writes that
+    bypass it (raw SQL, loaddata) or after changing the search backend.
+
+    Example usage:
+        python manage.py rebuild_search_index
+    """
+
+    help = 'Rebuild the application full-text search index'
+
+    def handle(self, *args, **options):
+        utils.rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS(
+            f"Search index rebuilt for {Application.objects.count()} applications"
+        ))
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def link_products_to_partners(apps, schema_editor):
+    """Backfill the partner FK by matching the raw partner name, in batches."""
+    ApplicationProduct = apps.get_model('application', 'ApplicationProduct')
+    ApplicationSupplyChainPartner = apps.get_model('application', 'ApplicationSupplyChainPartner')
+
+    products = ApplicationProduct.objects.filter(
+        supply_chain_partner__isnull=True,
+        supply_chain_partner_name_raw__isnull=False
+    ).order_by('pk')
+
+    last_pk = 0
+    while True:
+        batch = list(products.filter(pk__gt=last_pk).only(
+            'pk', 'application_id', 'supply_chain_partner_name_raw'
+        )[:BATCH_SIZE])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+
+        partner_ids = {}
+        for partner_id, application_id, name in ApplicationSupplyChainPartner.objects.filter(
+            application_id__in={product.application_id for product in batch}
+        ).order_by('-pk').values_list('pk', 'application_id', 'name'):
+            # Ordered by descending pk so the first partner with a name wins
+            partner_ids[(application_id, (name or '').strip())] = partner_id
+
+        linked = []
+        for product in batch:
+            key = (product.application_id, product.supply_chain_partner_name_raw.strip())
+            if key in partner_ids:
+                product.supply_chain_partner_id = partner_ids[key]
+                linked.append(product)
+        ApplicationProduct.objects.bulk_update(linked, ['supply_chain_partner'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0005_remove_application_bulk_submissions_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationproduct',
+            name='supply_chain_partner',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='products', to='application.applicationsupplychainpartner'),
+        ),
+        migrations.RunPython(link_products_to_partners, migrations.RunPython.noop),
+    ]
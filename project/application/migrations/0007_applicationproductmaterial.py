@@ -0,0 +1,63 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:56
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def split_raw_materials(apps, schema_editor):
+    """Backfill staged material rows from raw_materials_list, in batches."""
+    ApplicationProduct = apps.get_model('application', 'ApplicationProduct')
+    ApplicationProductMaterial = apps.get_model('application', 'ApplicationProductMaterial')
+
+    products = ApplicationProduct.objects.exclude(raw_materials_list__isnull=True).exclude(
+        raw_materials_list=''
+    ).order_by('pk')
+
+    last_pk = 0
+    while True:
+        batch = list(products.filter(pk__gt=last_pk).only('pk', 'raw_materials_list')[:BATCH_SIZE])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+
+        materials = []
+        for product in batch:
+            names = [name.strip() for name in product.raw_materials_list.split(',')]
+            for position, name in enumerate(name for name in names if name):
+                code = name.upper().replace(' ', '-').replace("'", "")[:50]
+                materials.append(ApplicationProductMaterial(
+                    product_id=product.pk,
+                    name=name[:120],
+                    code=f"MAT-{code}",
+                    position=position
+                ))
+        ApplicationProductMaterial.objects.bulk_create(materials)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0006_applicationproduct_supply_chain_partner'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationProductMaterial',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=120)),
+                ('code', models.CharField(max_length=120)),
+                ('position', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='materials', to='application.applicationproduct')),
+            ],
+            options={
+                'verbose_name': 'Application Product Material (Staging)',
+                'verbose_name_plural': 'Application Product Materials (Staging)',
+                'ordering': ['product', 'position'],
+                'indexes': [models.Index(fields=['code', 'product'], name='app_material_code_idx')],
+            },
+        ),
+        migrations.RunPython(split_raw_materials, migrations.RunPython.noop),
+    ]
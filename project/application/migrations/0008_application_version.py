@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0007_applicationproductmaterial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Incremented on every status transition (optimistic concurrency).'),
+        ),
+        migrations.AlterField(
+            model_name='application',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('in_review', 'In Review'), ('approved', 'Approved'), ('completed', 'Completed'), ('rejected', 'Rejected')], default='pending', max_length=120),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.4 on 2026-10-19 18:59
+
+import application.models
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0008_application_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationCertificate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('content_key', models.CharField(max_length=64, unique=True)),
+                ('file', models.FileField(upload_to=application.models.certificate_file_path)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='certificates', to='application.application')),
+            ],
+            options={
+                'verbose_name': 'Application Certificate',
+                'verbose_name_plural': 'Application Certificates',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
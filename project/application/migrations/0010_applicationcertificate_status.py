@@ -0,0 +1,46 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:00
+
+import application.models
+from django.db import migrations, models
+
+
+def mark_stored_certificates_ready(apps, schema_editor):
+    """Certificates rendered before this migration already have a file; they are not in-flight renders."""
+    ApplicationCertificate = apps.get_model('application', 'ApplicationCertificate')
+    ApplicationCertificate.objects.exclude(file='').update(status='ready', progress=100)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0009_applicationcertificate'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationcertificate',
+            name='error_message',
+            field=models.TextField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='applicationcertificate',
+            name='progress',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Rendering progress (0-100).'),
+        ),
+        migrations.AddField(
+            model_name='applicationcertificate',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('rendering', 'Rendering'), ('ready', 'Ready'), ('failed', 'Failed')], default='pending', max_length=20),
+        ),
+        migrations.AddField(
+            model_name='applicationcertificate',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='applicationcertificate',
+            name='file',
+            field=models.FileField(blank=True, upload_to=application.models.certificate_file_path),
+        ),
+        migrations.RunPython(mark_stored_certificates_ready, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:11
+
+import hashlib
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def record_stored_certificates(apps, schema_editor):
+    """Digest the stored certificates and create their verification records."""
+    ApplicationCertificate = apps.get_model('application', 'ApplicationCertificate')
+    ApplicationProduct = apps.get_model('application', 'ApplicationProduct')
+    CertificateVerification = apps.get_model('application', 'CertificateVerification')
+
+    for certificate in ApplicationCertificate.objects.filter(status='ready').select_related('application'):
+        try:
+            with certificate.file.open('rb') as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except (OSError, ValueError):
+            # File missing from storage; it is re-rendered on the next download
+            continue
+
+        certificate.digest = digest
+        certificate.save(update_fields=['digest'])
+        application = certificate.application
+        CertificateVerification.objects.update_or_create(
+            digest=digest,
+            defaults={
+                'application': application,
+                'application_name': application.name,
+                'status': application.status,
+                'approved_products': [
+                    {
+                        'product_name': product.product_name,
+                        'product_category': product.product_category,
+                        'supply_chain_partner': product.supply_chain_partner_name_raw,
+                    }
+                    for product in ApplicationProduct.objects.filter(
+                        application=application, is_approved=True
+                    ).order_by('id')
+                ],
+                'is_current': True,
+                'issued_at': certificate.updated_at,
+            }
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0010_applicationcertificate_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationcertificate',
+            name='digest',
+            field=models.CharField(blank=True, db_index=True, help_text='SHA-256 of the rendered PDF.', max_length=64),
+        ),
+        migrations.CreateModel(
+            name='CertificateVerification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(max_length=64, unique=True)),
+                ('application_name', models.CharField(max_length=120)),
+                ('status', models.CharField(max_length=20)),
+                ('approved_products', models.JSONField(blank=True, default=list)),
+                ('is_current', models.BooleanField(default=True)),
+                ('issued_at', models.DateTimeField()),
+                ('application', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='certificate_verifications', to='application.application')),
+            ],
+            options={
+                'verbose_name': 'Certificate Verification',
+                'verbose_name_plural': 'Certificate Verifications',
+                'ordering': ['-issued_at'],
+            },
+        ),
+        migrations.RunPython(record_stored_certificates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-19 21:02
+
+from django.db import migrations, OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    """Create and fill the SQLite FTS5 search index (other databases use the icontains fallback)."""
+    if schema_editor.connection.vendor != 'sqlite':
+        return
+
+    try:
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS application_search USING fts5("
+            "name, description, company, partners, products, materials, "
+            "tokenize = 'unicode61 remove_diacritics 2')"
+        )
+    except OperationalError:
+        # SQLite built without FTS5
+        return
+
+    schema_editor.execute("""
+        INSERT INTO application_search (rowid, name, description, company, partners, products, materials)
+        SELECT a.id, a.name, a.description,
+            (SELECT coalesce(c.name, '') || ' ' || coalesce(c.city, '') || ' ' ||
+                    coalesce(c.state, '') || ' ' || coalesce(c.country, '')
+             FROM application_applicationcompanyinfo c WHERE c.application_id = a.id),
+            (SELECT group_concat(p.name, ' ')
+             FROM application_applicationsupplychainpartner p WHERE p.application_id = a.id),
+            (SELECT group_concat(coalesce(p.product_name, '') || ' ' || coalesce(p.product_category, ''), ' ')
+             FROM application_applicationproduct p WHERE p.application_id = a.id),
+            (SELECT group_concat(m.name || ' ' || m.code, ' ')
+             FROM application_applicationproductmaterial m
+             INNER JOIN application_applicationproduct p ON m.product_id = p.id
+             WHERE p.application_id = a.id)
+        FROM application_application a
+    """)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS application_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0011_certificateverification'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 19:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('application', '0012_application_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='application',
+            name='revision',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Incremented on any change to the application or its staged data (response caching).'),
+        ),
+    ]
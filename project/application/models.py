@@ -5,6 +5,8 @@ import os
 # Constants
 APPLICATION_FOLDER = 'application_files'
 
+CERTIFICATE_FOLDER = 'certificates'
+
 def application_file_path(instance, filename):
     """
     Generate a unique file path for application files.
@@ -15,6 +17,13 @@ def application_file_path(instance, filename):
     return os.path.join('data', subdirectory, unique_filename)
 
 
+def certificate_file_path(instance, filename):
+    """
+    Generate the storage path for a certificate from its content key.
+    """
+    return os.path.join('data', CERTIFICATE_FOLDER, f"{instance.content_key}.pdf")
+
+
 class Application(models.Model):
     """Represents an application submission."""
     
@@ -22,8 +31,17 @@ class Application(models.Model):
         PENDING = 'pending', 'Pending'
         IN_REVIEW = 'in_review', 'In Review'
         APPROVED = 'approved', 'Approved'
+        COMPLETED = 'completed', 'Completed'
         REJECTED = 'rejected', 'Rejected'
     
+    # Status changes allowed through transition()
+    TRANSITIONS = {
+        Status.PENDING: {Status.IN_REVIEW},
+        Status.IN_REVIEW: {Status.COMPLETED, Status.REJECTED},
+    }
+    # Fields written only by transition(), never by save()
+    TRANSITION_FIELDS = {'status', 'version'}
+    
     name = models.CharField(max_length=120)
     description = models.TextField()
     submission_date = models.DateTimeField(null=True, blank=True)
@@ -37,9 +55,92 @@ class Application(models.Model):
         null=True,
         blank=True
     )    
+    version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Incremented on every status transition (optimistic concurrency)."
+    )
+    revision = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Incremented on any change to the application or its staged data (response caching)."
+    )
 
     def __str__(self):
         return f"{self.name} - {self.status}"
+
+    def save(self, *args, **kwargs):
+        """
+        Save the application and bump its revision.
+        
+        Updates never write ``status`` or ``version``: those only change
+        through ``transition()`` (or the bulk UPDATEs that follow the same
+        rules), so saving an instance loaded before a transition cannot
+        undo it or bypass the state machine.
+        
+        The revision is incremented in the database, in the same UPDATE as
+        the other fields, so saving a stale instance never moves it back.
+        The in-memory value is incremented too rather than read back; it
+        only differs from the stored one if another writer got in between.
+        """
+        if self._state.adding:
+            super().save(*args, **kwargs)
+            return
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None:
+            deferred = self.get_deferred_fields()
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.attname not in deferred
+            ]
+        kwargs['update_fields'] = {*update_fields, 'revision'} - self.TRANSITION_FIELDS
+        revision = self.revision
+        self.revision = models.F('revision') + 1
+        try:
+            super().save(*args, **kwargs)
+        finally:
+            self.revision = revision
+        self.revision += 1
+
+    def transition(self, from_status, to_status, **changes):
+        """
+        Move the application between statuses with a conditional UPDATE.
+        
+        The row is only updated if it still has the status and version this
+        instance was loaded with, so concurrent reviewers or retries cannot
+        apply the same transition twice. No locks are taken.
+        
+        Args:
+            from_status: Status the application must currently have
+            to_status: Status to move to
+            **changes: Extra fields to update in the same statement
+            
+        Returns:
+            bool: True if this call performed the transition
+            
+        Raises:
+            ValueError: If the transition is not allowed
+        """
+        if to_status not in self.TRANSITIONS.get(from_status, set()):
+            raise ValueError(f"Invalid status transition: {from_status} -> {to_status}")
+        
+        updated = Application.objects.filter(
+            pk=self.pk,
+            status=from_status,
+            version=self.version
+        ).update(
+            status=to_status,
+            version=models.F('version') + 1,
+            revision=models.F('revision') + 1,
+            **changes
+        )
+        
+        if updated:
+            self.status = to_status
+            self.version += 1
+            for field, value in changes.items():
+                setattr(self, field, value)
+        return bool(updated)
     
     class Meta:
         ordering = ['-submission_date'] 
@@ -110,6 +211,13 @@ class ApplicationProduct(models.Model):
         null=False, blank=False
     )
     
+    supply_chain_partner = models.ForeignKey(
+        'application.ApplicationSupplyChainPartner',
+        on_delete=models.SET_NULL,
+        related_name='products',
+        null=True,
+        blank=True
+    )
     supply_chain_partner_name_raw = models.CharField(
         max_length=120, 
         null=True, 
@@ -134,6 +242,87 @@ class ApplicationProduct(models.Model):
         app_name = getattr(self.application, 'name', 'N/A')
         partner_name = self.supply_chain_partner_name_raw or 'Unspecified Partner'
         return f"Product: {self.product_name} by {partner_name} for App: {app_name}"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Remember the loaded raw_materials_list, so saves can tell whether it changed."""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_raw_materials_list = instance.__dict__.get('raw_materials_list', models.DEFERRED)
+        return instance
+
+    def save(self, *args, **kwargs):
+        """
+        Keep the staged material rows in sync with raw_materials_list.
+        
+        The rows are only rewritten when the list differs from the one the
+        product was loaded with, so review saves (``is_approved``,
+        ``rejection_reason``) never touch them.
+        """
+        adding = self._state.adding
+        super().save(*args, **kwargs)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'raw_materials_list' not in update_fields:
+            return
+        loaded = getattr(self, '_loaded_raw_materials_list', models.DEFERRED)
+        if not adding and loaded is not models.DEFERRED and loaded == self.raw_materials_list:
+            return
+        if not adding:
+            self.materials.all().delete()
+        ApplicationProductMaterial.objects.bulk_create(
+            ApplicationProductMaterial.build_for(self)
+        )
+        self._loaded_raw_materials_list = self.raw_materials_list
+
+
+class ApplicationProductMaterial(models.Model):
+    """
+    Staging model for a raw material of a staged product.
+    
+    One row per material in the product's raw_materials_list, which is
+    kept as the comma-joined view of these rows for compatibility.
+    """
+    product = models.ForeignKey(
+        'application.ApplicationProduct',
+        on_delete=models.CASCADE,
+        related_name='materials',
+        null=False, blank=False
+    )
+    name = models.CharField(max_length=120)
+    code = models.CharField(max_length=120)
+    position = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['product', 'position']
+        indexes = [
+            models.Index(fields=['code', 'product'], name='app_material_code_idx'),
+        ]
+        verbose_name = "Application Product Material (Staging)"
+        verbose_name_plural = "Application Product Materials (Staging)"
+
+    def __str__(self):
+        return f"Material: {self.name} ({self.code})"
+
+    @staticmethod
+    def split(raw_materials_list):
+        """Split a comma-separated raw materials list into material names."""
+        if not raw_materials_list:
+            return []
+        names = [material.strip() for material in str(raw_materials_list).split(',')]
+        return [name for name in names if name]
+
+    @staticmethod
+    def code_for(name):
+        """Create the raw material catalog code for a material name."""
+        code = name.upper().replace(' ', '-').replace("'", "")[:50]
+        return f"MAT-{code}"
+
+    @classmethod
+    def build_for(cls, product):
+        """Build unsaved material rows for a saved product's raw_materials_list."""
+        return [
+            cls(product=product, name=name[:120], code=cls.code_for(name), position=position)
+            for position, name in enumerate(cls.split(product.raw_materials_list))
+        ]
     
 
 class BulkSubmission(models.Model):
@@ -168,4 +357,77 @@ class BulkSubmission(models.Model):
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Bulk Submission"
-        verbose_name_plural = "Bulk Submissions"
\ No newline at end of file
+        verbose_name_plural = "Bulk Submissions"
+
+
+class ApplicationCertificate(models.Model):
+    """
+    Stored PDF certificate for a reviewed application.
+    
+    The content key is derived from everything the certificate shows and
+    the template version, so any review change produces a new key and
+    the stored file is never served stale. Rows are created as soon as
+    rendering is requested and track its progress until the file is ready.
+    """
+    
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RENDERING = 'rendering', 'Rendering'
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'
+    
+    application = models.ForeignKey(
+        'application.Application',
+        on_delete=models.CASCADE,
+        related_name='certificates',
+        null=False, blank=False
+    )
+    content_key = models.CharField(max_length=64, unique=True)
+    file = models.FileField(upload_to=certificate_file_path, blank=True)
+    digest = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the rendered PDF.")
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    progress = models.PositiveSmallIntegerField(default=0, help_text="Rendering progress (0-100).")
+    error_message = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        verbose_name = "Application Certificate"
+        verbose_name_plural = "Application Certificates"
+
+    def __str__(self):
+        app_name = getattr(self.application, 'name', 'N/A')
+        return f"Certificate for App: {app_name} ({self.content_key[:12]})"
+
+
+class CertificateVerification(models.Model):
+    """
+    Public verification record of an issued certificate.
+    
+    Written when a certificate is rendered and keyed by the SHA-256 digest
+    of the PDF, with everything the verification endpoint returns
+    denormalized into the row, so lookups never touch the staging tables.
+    Rows outlive their certificate files; superseded certificates stay
+    verifiable with ``is_current`` cleared.
+    """
+    digest = models.CharField(max_length=64, unique=True)
+    application = models.ForeignKey(
+        'application.Application',
+        on_delete=models.SET_NULL,
+        related_name='certificate_verifications',
+        null=True, blank=True
+    )
+    application_name = models.CharField(max_length=120)
+    status = models.CharField(max_length=20)
+    approved_products = models.JSONField(default=list, blank=True)
+    is_current = models.BooleanField(default=True)
+    issued_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-issued_at']
+        verbose_name = "Certificate Verification"
+        verbose_name_plural = "Certificate Verifications"
+
+    def __str__(self):
+        return f"{self.application_name} ({self.digest[:12]})"
@@ -0,0 +1,65 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from application.models import (
+    Application,
+    ApplicationCompanyInfo,
+    ApplicationSupplyChainPartner,
+    ApplicationProduct
+)
+from application.utils.response_cache import bump_application_revisions
+from application.utils.search_index import queue_search_update
+
+
+@receiver(post_save, sender=Application)
+@receiver(post_delete, sender=Application)
+def update_application_search_index(sender, instance, **kwargs):
+    """Keep the search index in sync with the application's name and description."""
+    queue_search_update(instance.pk)
+
+
+def deleting_application(origin):
+    """Whether a delete cascades from deleting applications (``origin`` of post_delete)."""
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, Application)
+
+
+@receiver(post_save, sender=ApplicationCompanyInfo)
+@receiver(post_delete, sender=ApplicationCompanyInfo)
+@receiver(post_save, sender=ApplicationSupplyChainPartner)
+@receiver(post_delete, sender=ApplicationSupplyChainPartner)
+@receiver(post_save, sender=ApplicationProduct)
+@receiver(post_delete, sender=ApplicationProduct)
+def update_staged_data_search_index(sender, instance, **kwargs):
+    """
+    Re-index the application of a saved or deleted staged row.
+
+    Product materials are rewritten whenever the product is saved, so they
+    need no receiver of their own. Bulk writes (``bulk_create``,
+    ``update``) send no signals and call ``queue_search_update`` themselves.
+    Rows deleted along with their application are dropped by the
+    application's own receiver.
+    """
+    if deleting_application(kwargs.get('origin')):
+        return
+    queue_search_update(instance.application_id)
+
+
+@receiver(post_save, sender=ApplicationCompanyInfo)
+@receiver(post_delete, sender=ApplicationCompanyInfo)
+@receiver(post_save, sender=ApplicationSupplyChainPartner)
+@receiver(post_delete, sender=ApplicationSupplyChainPartner)
+@receiver(post_save, sender=ApplicationProduct)
+@receiver(post_delete, sender=ApplicationProduct)
+def bump_staged_data_revision(sender, instance, **kwargs):
+    """
+    Bump the revision of the application of a saved or deleted staged row.
+
+    The application itself bumps its revision in ``Application.save``.
+    Bulk writes call ``bump_application_revisions`` themselves. Nothing is
+    bumped for rows deleted along with their application, so deleting an
+    application does not run one UPDATE per staged row.
+    """
+    if deleting_application(kwargs.get('origin')):
+        return
+    bump_application_revisions([instance.application_id])
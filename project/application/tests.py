@@ -1,3 +1,682 @@
-from django.test import TestCase
+import re
+import zlib
+from unittest import mock
+from django.contrib.admin import site as admin_site
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.template.loader import get_template
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse, reverse_lazy
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.test import APIClient
+from application.api.serializers import ApplicationSerializer
+from application.api.views import BULK_CREATE_MAX_ITEMS, ApplicationViewSet
+from application.models import (
+    Application,
+    ApplicationCompanyInfo,
+    ApplicationSupplyChainPartner,
+    ApplicationProduct,
+    ApplicationProductMaterial
+)
+from application.utils.bulk_complete_applications import annotate_approval_summary, bulk_complete_applications
+from application.utils.certificate_verification import get_certificate_verification, record_certificate_verification
+from application.utils.create_applications import create_applications
+from application.utils.generate_pdf_certificate import CERTIFICATE_TEMPLATE, render_certificate_html
+from application.utils.search_index import Fts5SearchBackend, IcontainsSearchBackend
+from application.utils.pdf_backends import STYLES, UNSTYLED_CLASSES, PdfBackend, SimplePdfBackend
+from application.utils.review_application import ReviewResult, finalize_application
+from core.utils import setup_reviewer_role, is_customer_service, is_reviewer
+from customer.models import Company
+from product.models import Product
 
-# Create your tests here.
+
+def group_queries(queries):
+    """Queries that look up a user's groups (not Django's permission queries)."""
+    return [query for query in queries if 'FROM "auth_group" INNER JOIN "auth_user_groups"' in query['sql']]
+
+
+class RoleResolutionTests(TestCase):
+    """Role checks load the user's groups once per request."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.reviewer = User.objects.create_user('reviewer', password='reviewer', is_staff=True)
+        cls.reviewer.groups.add(setup_reviewer_role())
+
+        cls.application = Application.objects.create(
+            name='Review Application',
+            description='Application in review',
+            status=Application.Status.IN_REVIEW
+        )
+        ApplicationCompanyInfo.objects.create(application=cls.application, name='Company')
+        for i in range(3):
+            partner = ApplicationSupplyChainPartner.objects.create(application=cls.application, name=f'Partner {i}')
+            ApplicationProduct.objects.create(
+                application=cls.application,
+                supply_chain_partner=partner,
+                supply_chain_partner_name_raw=partner.name,
+                product_name=f'Product {i}'
+            )
+
+    def test_roles_are_loaded_once_per_user(self):
+        user = User.objects.get(pk=self.reviewer.pk)
+        with self.assertNumQueries(1):
+            for _ in range(10):
+                self.assertTrue(is_reviewer(user))
+                self.assertFalse(is_customer_service(user))
+
+    def test_change_form_runs_one_group_query(self):
+        self.client.force_login(self.reviewer)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                reverse('admin:application_application_change', args=[self.application.pk])
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(group_queries(queries.captured_queries)), 1)
+
+    def test_changelist_runs_one_group_query(self):
+        self.client.force_login(self.reviewer)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:application_application_changelist'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(group_queries(queries.captured_queries)), 1)
+
+    def test_change_form_query_count_does_not_grow_with_products(self):
+        self.client.force_login(self.reviewer)
+        url = reverse('admin:application_application_change', args=[self.application.pk])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        few = len(queries.captured_queries)
+
+        partner = self.application.supply_chain_partners.first()
+        ApplicationProduct.objects.bulk_create([
+            ApplicationProduct(
+                application=self.application,
+                supply_chain_partner=partner,
+                supply_chain_partner_name_raw=partner.name,
+                product_name=f'Extra product {i}'
+            )
+            for i in range(20)
+        ])
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries.captured_queries), few)
+
+
+class ApplicationChangelistTests(TestCase):
+    """The application changelist runs a constant number of queries."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.reviewer = User.objects.create_user('reviewer', password='reviewer', is_staff=True)
+        cls.reviewer.groups.add(setup_reviewer_role())
+        cls.create_application(0)
+
+    @staticmethod
+    def create_application(index):
+        application = Application.objects.create(
+            name=f'Application {index}',
+            description='Application in review',
+            status=Application.Status.IN_REVIEW
+        )
+        for i in range(3):
+            partner = ApplicationSupplyChainPartner.objects.create(
+                application=application,
+                name=f'Partner {i}',
+                is_approved=i > 0
+            )
+            ApplicationProduct.objects.create(
+                application=application,
+                supply_chain_partner=partner,
+                supply_chain_partner_name_raw=partner.name,
+                product_name=f'Product {i}',
+                is_approved=i == 0
+            )
+        return application
+
+    def get_changelist(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse('admin:application_application_changelist'))
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries.captured_queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        self.client.force_login(self.reviewer)
+        _, single = self.get_changelist()
+
+        for index in range(1, 10):
+            self.create_application(index)
+        response, many = self.get_changelist()
+
+        self.assertEqual(single, many)
+        self.assertContains(response, 'Application 9')
+
+    def test_review_counts_are_annotated(self):
+        self.client.force_login(self.reviewer)
+        response, _ = self.get_changelist()
+        self.assertContains(response, '2 / 3')
+        self.assertContains(response, '1 / 3')
+
+
+class ApplicationListApiTests(TestCase):
+    """The applications list endpoint runs a constant number of queries per page."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('customer', password='customer')
+        for index in range(12):
+            application = ApplicationChangelistTests.create_application(index)
+            ApplicationCompanyInfo.objects.create(application=application, name=f'Company {index}')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_query_count_does_not_grow_with_page_size(self):
+        for page_size in (1, 5, 12):
+            with self.assertNumQueries(3):
+                response = self.client.get(reverse('application-list'), {'page_size': page_size})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(len(response.data['results']), page_size)
+
+    def test_cursor_pages_cover_every_application_once(self):
+        ids = []
+        url = reverse('application-list') + '?page_size=5'
+        while url:
+            response = self.client.get(url)
+            ids.extend(application['id'] for application in response.data['results'])
+            url = response.data['next']
+        self.assertEqual(ids, sorted(Application.objects.values_list('pk', flat=True), reverse=True))
+
+    def test_nested_data_is_serialized(self):
+        response = self.client.get(reverse('application-list'), {'page_size': 1})
+        application = response.data['results'][0]
+        self.assertEqual(application['company_info']['name'], 'Company 11')
+        self.assertEqual(len(application['supply_chain_partners']), 3)
+        self.assertEqual(len(application['supply_chain_partners'][0]['products']), 1)
+
+
+def material_queries(queries):
+    """Queries on the staged product material table."""
+    return [query for query in queries if 'application_applicationproductmaterial' in query['sql']]
+
+
+def create_approved_application(index):
+    """An in-review application whose company info, partners and products are all approved."""
+    application = ApplicationChangelistTests.create_application(index)
+    ApplicationCompanyInfo.objects.create(
+        application=application,
+        name=f'Company {index}',
+        address='1 Main Street',
+        city='Porto',
+        zip_code='4000',
+        country='Portugal',
+        is_approved=True
+    )
+    application.supply_chain_partners.update(is_approved=True)
+    for product in application.products.all():
+        product.product_category = 'Apparel'
+        product.raw_materials_list = 'Organic cotton'
+        product.is_approved = True
+        product.save()
+    return Application.objects.get(pk=application.pk)
+
+
+class ConcurrentReviewTests(TestCase):
+    """Review transitions are applied once, however many reviewers race for them."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.reviewer = User.objects.create_user('reviewer', password='reviewer', is_staff=True)
+        cls.reviewer.groups.add(setup_reviewer_role())
+
+    def test_second_finalize_on_same_version_conflicts(self):
+        first = create_approved_application(0)
+        second = Application.objects.get(pk=first.pk)
+
+        self.assertEqual(finalize_application(first), ReviewResult.COMPLETED)
+        companies, products = Company.objects.count(), Product.objects.count()
+        self.assertEqual((companies, products), (1, 3))
+
+        self.assertEqual(finalize_application(second), ReviewResult.CONFLICT)
+        self.assertEqual(Company.objects.count(), companies)
+        self.assertEqual(Product.objects.count(), products)
+        self.assertEqual(Application.objects.get(pk=first.pk).version, first.version)
+
+    def test_stale_save_keeps_status_and_version(self):
+        stale = create_approved_application(0)
+        current = Application.objects.get(pk=stale.pk)
+        self.assertEqual(finalize_application(current), ReviewResult.COMPLETED)
+
+        stale.description = 'Edited from an old form'
+        stale.save()
+        application = Application.objects.get(pk=stale.pk)
+        self.assertEqual(application.status, Application.Status.COMPLETED)
+        self.assertEqual(application.version, current.version)
+        self.assertEqual(application.description, 'Edited from an old form')
+
+    def test_bulk_complete_claims_each_version(self):
+        applications = [create_approved_application(index) for index in range(3)]
+        Application.objects.filter(pk=applications[1].pk).update(version=5)
+
+        with CaptureQueriesContext(connection) as queries:
+            outcomes = bulk_complete_applications([application.pk for application in applications])
+
+        self.assertEqual([outcome['outcome'] for outcome in outcomes], ['completed'] * 3)
+        # The whole chunk is claimed with one UPDATE despite the different versions
+        self.assertEqual(len(application_updates(queries.captured_queries)), 1)
+        self.assertEqual(
+            list(Application.objects.order_by('pk').values_list('version', flat=True)), [1, 6, 1]
+        )
+        self.assertEqual(Company.objects.count(), 3)
+
+    def test_bulk_complete_skips_concurrently_changed(self):
+        applications = [create_approved_application(index) for index in range(3)]
+        changed = applications[2]
+
+        def load_then_change(queryset):
+            loaded = list(annotate_approval_summary(queryset))
+            Application.objects.get(pk=changed.pk).transition(
+                Application.Status.IN_REVIEW, Application.Status.REJECTED
+            )
+            return loaded
+
+        with mock.patch(
+            'application.utils.bulk_complete_applications.annotate_approval_summary', side_effect=load_then_change
+        ):
+            outcomes = bulk_complete_applications([application.pk for application in applications])
+
+        self.assertEqual([outcome['outcome'] for outcome in outcomes], ['completed', 'completed', 'skipped'])
+        self.assertEqual(Company.objects.count(), 2)
+        self.assertEqual(Product.objects.count(), 6)
+        self.assertEqual(Application.objects.get(pk=changed.pk).status, Application.Status.REJECTED)
+
+    def test_complete_with_stale_version_returns_conflict(self):
+        application = create_approved_application(0)
+        client = APIClient()
+        client.force_authenticate(self.reviewer)
+        url = reverse('application-complete', args=[application.pk])
+
+        response = client.post(url, {'version': application.version + 1}, format='json')
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Application.objects.get(pk=application.pk).status, Application.Status.IN_REVIEW)
+
+        response = client.post(url, {'version': application.version}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], Application.Status.COMPLETED)
+        self.assertEqual(Company.objects.count(), 1)
+
+    def test_status_is_read_only_in_admin(self):
+        admin_user = User.objects.create_superuser('admin', password='admin')
+        application = create_approved_application(0)
+        model_admin = admin_site._registry[Application]
+        request = RequestFactory().get('/')
+        request.user = admin_user
+        self.assertIn('status', model_admin.get_readonly_fields(request, application))
+
+
+class ApplicationProductMaterialTests(TestCase):
+    """Staged material rows follow a product's raw_materials_list."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('customer', password='customer')
+        cls.cotton = ApplicationChangelistTests.create_application(0)
+        cls.product = cls.cotton.products.first()
+        cls.product.raw_materials_list = 'Organic cotton, Natural dyes'
+        cls.product.save()
+        cls.other = ApplicationChangelistTests.create_application(1)
+
+    def codes(self, product):
+        return list(product.materials.values_list('code', flat=True))
+
+    def test_materials_are_built_from_list(self):
+        self.assertEqual(self.codes(self.product), ['MAT-ORGANIC-COTTON', 'MAT-NATURAL-DYES'])
+
+    def test_review_save_keeps_materials(self):
+        product = ApplicationProduct.objects.get(pk=self.product.pk)
+        materials = list(product.materials.values_list('pk', flat=True))
+        product.is_approved = True
+        product.rejection_reason = ''
+        with CaptureQueriesContext(connection) as queries:
+            product.save()
+        self.assertEqual(material_queries(queries.captured_queries), [])
+        self.assertEqual(list(product.materials.values_list('pk', flat=True)), materials)
+
+    def test_changed_list_resyncs_materials(self):
+        product = ApplicationProduct.objects.get(pk=self.product.pk)
+        product.raw_materials_list = 'Organic hemp'
+        product.save()
+        self.assertEqual(self.codes(product), ['MAT-ORGANIC-HEMP'])
+
+    def test_api_filters_applications_by_material_code(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get(reverse('application-list'), {'material': 'MAT-ORGANIC-COTTON'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([application['id'] for application in response.data['results']], [self.cotton.pk])
+
+        response = client.get(reverse('application-list'), {'material': 'MAT-MISSING'})
+        self.assertEqual(response.data['results'], [])
+
+
+class SearchBackendTests(TestCase):
+    """The FTS5 index and the icontains fallback search the same fields."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.matching = ApplicationChangelistTests.create_application(0)
+        ApplicationCompanyInfo.objects.create(
+            application=cls.matching,
+            name='Northwind Mills',
+            city='Portland',
+            state='Oregon',
+            country='United States'
+        )
+        ApplicationProductMaterial.objects.create(
+            product=cls.matching.products.first(),
+            name='Organic cotton',
+            code='MAT-HEMP'
+        )
+        cls.other = ApplicationChangelistTests.create_application(1)
+        ApplicationCompanyInfo.objects.create(application=cls.other, name='Southwind', country='Germany')
+        Fts5SearchBackend().rebuild()
+
+    def search(self, backend, query):
+        return set(backend.filter(Application.objects.all(), query).values_list('pk', flat=True))
+
+    def test_backends_return_the_same_applications(self):
+        fts = Fts5SearchBackend()
+        self.assertTrue(fts.is_available())
+        icontains = IcontainsSearchBackend()
+        queries = {
+            'Northwind': {self.matching.pk},
+            'Oregon': {self.matching.pk},
+            'Germany': {self.other.pk},
+            'Partner': {self.matching.pk, self.other.pk},
+            'Product 2': {self.matching.pk, self.other.pk},
+            'organic HEMP': {self.matching.pk},
+            'application southwind': {self.other.pk},
+            'Portland Germany': set(),
+            'missing': set(),
+        }
+        for query, expected in queries.items():
+            with self.subTest(query=query):
+                self.assertEqual(self.search(fts, query), expected)
+                self.assertEqual(self.search(icontains, query), expected)
+
+
+def application_updates(queries):
+    """UPDATE statements on the application table."""
+    return [query for query in queries if query['sql'].startswith('UPDATE "application_application"')]
+
+
+class ApplicationRevisionTests(TestCase):
+    """Every change to an application or its staged rows bumps its revision."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.application = ApplicationChangelistTests.create_application(0)
+
+    def revision(self):
+        return Application.objects.values_list('revision', flat=True).get(pk=self.application.pk)
+
+    def test_save_bumps_revision_in_one_update(self):
+        application = Application.objects.get(pk=self.application.pk)
+        revision = application.revision
+        with CaptureQueriesContext(connection) as queries:
+            application.save()
+        self.assertEqual(len(application_updates(queries.captured_queries)), 1)
+        self.assertEqual(application.revision, revision + 1)
+        self.assertEqual(self.revision(), revision + 1)
+
+    def test_stale_save_never_moves_revision_back(self):
+        first = Application.objects.get(pk=self.application.pk)
+        stale = Application.objects.get(pk=self.application.pk)
+        revision = first.revision
+        first.save()
+        stale.save()
+        self.assertEqual(self.revision(), revision + 2)
+
+    def test_staged_rows_bump_revision(self):
+        revision = self.revision()
+        partner = self.application.supply_chain_partners.first()
+        partner.name = 'Renamed Partner'
+        partner.save()
+        self.assertEqual(self.revision(), revision + 1)
+        partner.delete()
+        self.assertGreater(self.revision(), revision + 1)
+
+    def test_deleting_application_does_not_bump_staged_rows(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.application.delete()
+        self.assertEqual(application_updates(queries.captured_queries), [])
+        self.assertFalse(Application.objects.filter(pk=self.application.pk).exists())
+
+
+class ApplicationRetrieveApiTests(TestCase):
+    """Application detail responses carry a revision ETag and revalidate with 304."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('customer', password='customer')
+        cls.application = ApplicationChangelistTests.create_application(0)
+        cls.url = reverse('application-detail', args=[cls.application.pk])
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_application_is_not_modified(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response['ETag'], etag)
+
+    def test_changed_application_gets_new_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        partner = self.application.supply_chain_partners.first()
+        partner.name = 'Renamed Partner'
+        partner.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('Renamed Partner', [partner['name'] for partner in response.data['supply_chain_partners']])
+
+    def test_access_is_checked_before_not_modified(self):
+        etag = self.client.get(self.url)['ETag']
+        with mock.patch.object(ApplicationViewSet, 'check_object_permissions', side_effect=PermissionDenied):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 403)
+
+    def test_missing_application_is_not_found(self):
+        response = self.client.get(reverse('application-detail', args=[0]), HTTP_IF_NONE_MATCH='*')
+        self.assertEqual(response.status_code, 404)
+
+
+class ApplicationBulkCreateApiTests(TestCase):
+    """Bulk create writes every application of a request or none of them."""
+
+    url = reverse_lazy('application-bulk-create')
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('customer', password='customer')
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    @staticmethod
+    def item(index):
+        return {
+            'name': f'Bulk Application {index}',
+            'description': 'Created in bulk',
+            'company_info': {'name': f'Company {index}', 'country': 'Portugal'},
+            'supply_chain_partners': [
+                {
+                    'name': f'Partner {index}',
+                    'products': [
+                        {'product_name': f'Product {index}', 'raw_materials_list': 'MAT-A, MAT-B'}
+                    ]
+                }
+            ]
+        }
+
+    def test_creates_every_item(self):
+        response = self.client.post(self.url, [self.item(index) for index in range(3)], format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([item['name'] for item in response.data], [f'Bulk Application {index}' for index in range(3)])
+        applications = Application.objects.filter(pk__in=[item['id'] for item in response.data])
+        self.assertEqual(applications.filter(status=Application.Status.IN_REVIEW).count(), 3)
+        self.assertEqual(ApplicationCompanyInfo.objects.filter(application__in=applications).count(), 3)
+        self.assertEqual(ApplicationProduct.objects.filter(application__in=applications).count(), 3)
+        self.assertEqual(ApplicationProductMaterial.objects.filter(product__application__in=applications).count(), 6)
+
+    def test_invalid_item_creates_nothing(self):
+        items = [self.item(0), self.item(1)]
+        del items[1]['name']
+        response = self.client.post(self.url, items, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data[0], {})
+        self.assertIn('name', response.data[1])
+        self.assertFalse(Application.objects.exists())
+
+    def test_too_many_items_are_rejected(self):
+        items = [self.item(index) for index in range(BULK_CREATE_MAX_ITEMS + 1)]
+        response = self.client.post(self.url, items, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Application.objects.exists())
+
+    def test_empty_list_is_rejected(self):
+        response = self.client.post(self.url, [], format='json')
+        self.assertEqual(response.status_code, 400)
+
+    def test_failure_part_way_creates_nothing(self):
+        serializer = ApplicationSerializer(data=[self.item(index) for index in range(3)], many=True)
+        self.assertTrue(serializer.is_valid())
+        bulk_create = Application.objects.bulk_create
+        calls = []
+
+        def fail_second_chunk(objs, *args, **kwargs):
+            calls.append(objs)
+            if len(calls) == 2:
+                raise DatabaseError('connection lost')
+            return bulk_create(objs, *args, **kwargs)
+
+        with mock.patch.object(Application.objects, 'bulk_create', side_effect=fail_second_chunk):
+            with self.assertRaises(DatabaseError):
+                create_applications(serializer.validated_data, chunk_size=1)
+        self.assertEqual(len(calls), 2)
+        self.assertFalse(Application.objects.exists())
+        self.assertFalse(ApplicationCompanyInfo.objects.exists())
+
+
+class CertificateVerificationTests(TestCase):
+    """Public verifications are cached by digest and leave the application untouched."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.application = ApplicationChangelistTests.create_application(0)
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_recording_does_not_bump_revision(self):
+        revision = Application.objects.get(pk=self.application.pk).revision
+        record_certificate_verification(self.application, 'a' * 64)
+        self.assertEqual(Application.objects.get(pk=self.application.pk).revision, revision)
+
+    def test_lookup_is_cached_by_digest(self):
+        record_certificate_verification(self.application, 'a' * 64)
+        self.assertEqual(get_certificate_verification('a' * 64)['application_name'], self.application.name)
+        with CaptureQueriesContext(connection) as queries:
+            data = get_certificate_verification('a' * 64)
+        self.assertTrue(data['is_current'])
+        self.assertEqual(
+            [query for query in queries.captured_queries if 'application_certificateverification' in query['sql']], []
+        )
+
+    def test_unknown_digest_is_not_found(self):
+        self.assertIsNone(get_certificate_verification('b' * 64))
+        self.assertIsNone(cache.get(f"certificate_verification:{'b' * 64}"))
+
+
+class SimplePdfBackendTests(TestCase):
+    """The in-process PDF backend renders the real certificate template."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.application = Application.objects.create(
+            name='Łódź Textiles Application',
+            description='Application with non-Latin names',
+            status=Application.Status.REJECTED
+        )
+        ApplicationCompanyInfo.objects.create(application=cls.application, name='Zoë Coöperatie', is_approved=True)
+        partner = ApplicationSupplyChainPartner.objects.create(
+            application=cls.application, name='Текстиль Partner', is_approved=True
+        )
+        ApplicationProduct.objects.create(
+            application=cls.application,
+            supply_chain_partner=partner,
+            supply_chain_partner_name_raw=partner.name,
+            product_name='Organic Cotton T-Shirt',
+            rejection_reason='Missing certificate'
+        )
+
+    def render(self):
+        html = render_certificate_html(Application.objects.get(pk=self.application.pk))
+        return SimplePdfBackend().render(html)
+
+    def read_pdf(self, pdf):
+        """
+        Check the structure of a PDF and return the text drawn on its pages.
+
+        Every cross-reference entry must point at its object, and every
+        content stream must inflate; the strings shown with ``Tj`` are joined.
+        """
+        self.assertTrue(pdf.startswith(b'%PDF-'))
+        self.assertTrue(pdf.rstrip().endswith(b'%%EOF'))
+        xref = int(re.search(rb'startxref\s+(\d+)', pdf).group(1))
+        entries = re.findall(rb'(\d{10}) \d{5} n ', pdf[xref:])
+        self.assertTrue(entries)
+        for number, offset in enumerate(entries, start=1):
+            self.assertTrue(pdf[int(offset):].startswith(f"{number} 0 obj".encode()))
+
+        text = []
+        for stream in re.findall(rb'stream\n(.*?)\nendstream', pdf, re.S):
+            content = zlib.decompress(stream)
+            for string in re.findall(rb'\(((?:\\.|[^\\)])*)\) Tj', content):
+                text.append(re.sub(rb'\\(.)', rb'\1', string).decode('cp1252'))
+        return ''.join(text)
+
+    def test_renders_readable_pdf(self):
+        with self.assertLogs('application.utils.pdf_backends', 'WARNING'):
+            text = self.read_pdf(self.render())
+        self.assertIn('Zoë Coöperatie', text)
+        self.assertIn('Organic Cotton T-Shirt', text)
+        self.assertIn('Missing certificate', text)
+
+    def test_non_latin_characters_are_replaced_and_logged(self):
+        with self.assertLogs('application.utils.pdf_backends', 'WARNING') as logs:
+            text = self.read_pdf(self.render())
+        self.assertIn('?ódz Textiles Application', text)
+        self.assertIn('???????? Partner', text)
+        self.assertIn('Т', logs.output[0])
+
+    def test_template_classes_are_styled(self):
+        source = get_template(CERTIFICATE_TEMPLATE).template.source
+        classes = {name for value in re.findall(r'class="([^"]*)"', source) for name in value.split()}
+        self.assertEqual(classes - set(STYLES) - UNSTYLED_CLASSES, set())
+
+    def test_backend_must_implement_render(self):
+        with self.assertRaises(TypeError):
+            PdfBackend()
@@ -1,12 +1,44 @@
 from .complete_application import complete_application
-from .generate_pdf_certificate  import generate_pdf_certificate
+from .bulk_complete_applications import bulk_complete_applications
+from .review_application import submit_application, finalize_application
+from .review_components import bulk_review_components
+from .link_products_to_partners import link_products_to_partners
+from .generate_pdf_certificate  import generate_pdf_certificate, generate_pdf_certificates_parallel
+from .certificate_store import get_or_create_certificates
+from .certificate_verification import get_certificate_verification
+from .export_certificates import stream_certificates_zip
+from .serve_certificate import serve_certificate
+from .render_certificate_async import render_certificate_async, request_certificate
+from .search_index import search_applications, update_search_index, rebuild_search_index
+from .response_cache import bump_application_revisions
+from .create_applications import create_applications
+from .bulk_submission_summary import annotate_bulk_submission_outcomes, stream_bulk_submission_summary
 from .process_xlsx_application_form import process_xlsx_application_form
 from .process_bulk_submission import process_bulk_submission, process_bulk_submission_async
 
 __all__ = [
     'complete_application',
+    'bulk_complete_applications',
+    'submit_application',
+    'finalize_application',
+    'bulk_review_components',
+    'link_products_to_partners',
     'generate_pdf_certificate',
+    'generate_pdf_certificates_parallel',
+    'get_or_create_certificates',
+    'render_certificate_async',
+    'request_certificate',
+    'get_certificate_verification',
+    'stream_certificates_zip',
+    'serve_certificate',
+    'search_applications',
+    'update_search_index',
+    'rebuild_search_index',
+    'bump_application_revisions',
+    'create_applications',
+    'annotate_bulk_submission_outcomes',
+    'stream_bulk_submission_summary',
     'process_xlsx_application_form',
     'process_bulk_submission',
     'process_bulk_submission_async'
-]
\ No newline at end of file
+]
@@ -0,0 +1,252 @@
+import logging
+from django.db import transaction
+from django.db.models import Count, Exists, F, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from application.models import (
+    Application,
+    ApplicationSupplyChainPartner,
+    ApplicationProduct
+)
+from .complete_application import create_permanent_records
+from .render_certificate_async import render_certificate_async
+from .review_application import ReviewResult, finalize_application
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 200
+
+
+class ConcurrentChangeError(Exception):
+    """Raised when applications changed between loading and claiming them."""
+
+
+class Outcome:
+    """Per-application outcomes reported by bulk completion."""
+    COMPLETED = 'completed'
+    REJECTED = 'rejected'
+    SKIPPED = 'skipped'
+    FAILED = 'failed'
+
+
+def annotate_approval_summary(queryset):
+    """
+    Annotate applications with their approval summary in a single query.
+
+    Company info is joined with ``select_related`` and the queryset gains:
+        has_unapproved_partners: Any supply chain partner not approved
+        has_unapproved_products: Any product not approved
+    """
+    return queryset.annotate(
+        has_unapproved_partners=Exists(
+            ApplicationSupplyChainPartner.objects.filter(application=OuterRef('pk'), is_approved=False)
+        ),
+        has_unapproved_products=Exists(
+            ApplicationProduct.objects.filter(application=OuterRef('pk'), is_approved=False)
+        ),
+    ).select_related('company_info')
+
+
+def annotate_review_counts(queryset):
+    """
+    Annotate applications with partner and product review counts.
+    
+    Each count is a correlated subquery with a conditional aggregate, so
+    the partner and product rows are never joined against each other and
+    the cost does not depend on how many rows are listed. Adds:
+        partner_count, approved_partner_count
+        product_count, approved_product_count
+    """
+    return queryset.annotate(
+        partner_count=_count_subquery(ApplicationSupplyChainPartner),
+        approved_partner_count=_count_subquery(ApplicationSupplyChainPartner, Q(is_approved=True)),
+        product_count=_count_subquery(ApplicationProduct),
+        approved_product_count=_count_subquery(ApplicationProduct, Q(is_approved=True)),
+    )
+
+
+def _count_subquery(model, condition=None):
+    counts = model.objects.filter(application=OuterRef('pk')).order_by().values('application').annotate(
+        count=Count('pk', filter=condition)
+    ).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def is_fully_approved(application):
+    """Check an application annotated by ``annotate_approval_summary``."""
+    company_info = getattr(application, 'company_info', None)
+    return bool(
+        company_info and company_info.is_approved and
+        not application.has_unapproved_partners and
+        not application.has_unapproved_products
+    )
+
+
+def bulk_complete_applications(application_ids, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Complete or reject many in-review applications at once.
+
+    Approval summaries for every application are computed in one query.
+    Fully approved applications get their permanent records created with
+    the set-based completion, one transaction per chunk; the others are
+    rejected with one UPDATE per chunk. If a chunk fails, its applications are
+    retried one by one so a single bad application cannot block the rest.
+    Certificates of completed and rejected applications are queued for
+    background rendering.
+
+    Args:
+        application_ids: Iterable of Application ids
+        chunk_size: Number of applications completed or rejected per transaction
+
+    Returns:
+        list: One {'id', 'name', 'outcome', 'message'} dict per requested id,
+              in the order the ids were given
+    """
+    application_ids = list(dict.fromkeys(application_ids))
+    with span('bulk_complete_applications', requested=len(application_ids), chunk_size=chunk_size) as root:
+        outcomes = _bulk_complete(application_ids, chunk_size)
+        root.set(outcomes=lambda: _count_outcomes(outcomes.values()))
+    return [outcomes[application_id] for application_id in application_ids]
+
+
+def _bulk_complete(application_ids, chunk_size):
+    applications = {
+        application.id: application
+        for application in annotate_approval_summary(
+            Application.objects.filter(pk__in=application_ids)
+        )
+    }
+
+    outcomes = {}
+    approved, rejected = [], []
+    for application_id in application_ids:
+        application = applications.get(application_id)
+        if application is None:
+            outcomes[application_id] = _outcome(application_id, None, Outcome.SKIPPED, "Application not found")
+        elif application.status != Application.Status.IN_REVIEW:
+            outcomes[application_id] = _outcome(
+                application_id, application.name, Outcome.SKIPPED, "Application is not in review"
+            )
+        elif is_fully_approved(application):
+            approved.append(application)
+        else:
+            rejected.append(application)
+
+    for start in range(0, len(rejected), chunk_size):
+        chunk = rejected[start:start + chunk_size]
+        with span('bulk_complete_applications.reject', applications=len(chunk)):
+            outcomes.update(_reject(chunk))
+
+    for start in range(0, len(approved), chunk_size):
+        chunk = approved[start:start + chunk_size]
+        with span('bulk_complete_applications.chunk', applications=len(chunk)):
+            outcomes.update(_complete_chunk(chunk))
+
+    return outcomes
+
+
+def _reject(applications):
+    """Reject a chunk of applications with one conditional UPDATE, per row on conflict."""
+    with transaction.atomic():
+        updated = _claimed(applications).update(
+            status=Application.Status.REJECTED,
+            version=F('version') + 1,
+            revision=F('revision') + 1
+        )
+        if updated != len(applications):
+            # Someone else changed some of them; find out which ones row by row
+            transaction.set_rollback(True)
+
+    if updated == len(applications):
+        for application in applications:
+            render_certificate_async(application.id)
+        return {
+            application.id: _outcome(application.id, application.name, Outcome.REJECTED, "Not all components approved")
+            for application in applications
+        }
+
+    outcomes = {}
+    for application in applications:
+        if application.transition(Application.Status.IN_REVIEW, Application.Status.REJECTED):
+            render_certificate_async(application.id)
+            outcomes[application.id] = _outcome(
+                application.id, application.name, Outcome.REJECTED, "Not all components approved"
+            )
+        else:
+            outcomes[application.id] = _outcome(
+                application.id, application.name, Outcome.SKIPPED, "Application was changed by someone else"
+            )
+    return outcomes
+
+
+def _complete_chunk(applications):
+    """
+    Complete a chunk of fully approved applications in one transaction.
+    
+    The whole chunk is claimed with one conditional UPDATE first; if any
+    application was changed concurrently, or record creation fails, the
+    chunk is rolled back and its applications are finalized one by one.
+    """
+    try:
+        with transaction.atomic():
+            claimed = _claimed(applications).update(
+                status=Application.Status.COMPLETED,
+                version=F('version') + 1,
+                revision=F('revision') + 1
+            )
+            if claimed != len(applications):
+                raise ConcurrentChangeError(f"{len(applications) - claimed} applications changed concurrently")
+            create_permanent_records(applications)
+            for application in applications:
+                render_certificate_async(application.id)
+        return {
+            application.id: _outcome(application.id, application.name, Outcome.COMPLETED, "Application completed")
+            for application in applications
+        }
+    except Exception as e:
+        logger.error(f"Bulk completion chunk failed, retrying individually: {str(e)}")
+
+    messages = {
+        ReviewResult.COMPLETED: (Outcome.COMPLETED, "Application completed"),
+        ReviewResult.REJECTED: (Outcome.REJECTED, "Not all components approved"),
+        ReviewResult.INVALID: (Outcome.SKIPPED, "Application is not in review"),
+        ReviewResult.CONFLICT: (Outcome.SKIPPED, "Application was changed by someone else"),
+        ReviewResult.FAILED: (Outcome.FAILED, "Failed to create permanent records"),
+    }
+    outcomes = {}
+    for application in applications:
+        outcome, message = messages[finalize_application(application)]
+        outcomes[application.id] = _outcome(application.id, application.name, outcome, message)
+    return outcomes
+
+
+def _claimed(applications):
+    """
+    Match applications still in review at the version they were loaded with.
+    
+    Ids are grouped by version, so the condition has one ``pk__in`` term
+    per distinct version rather than one term per application.
+    """
+    ids_by_version = {}
+    for application in applications:
+        ids_by_version.setdefault(application.version, []).append(application.id)
+    condition = Q()
+    for version, ids in ids_by_version.items():
+        condition |= Q(version=version, pk__in=ids)
+    return Application.objects.filter(condition, status=Application.Status.IN_REVIEW)
+
+
+def _count_outcomes(outcomes):
+    counts = {}
+    for outcome in outcomes:
+        counts[outcome['outcome']] = counts.get(outcome['outcome'], 0) + 1
+    return counts
+
+
+def _outcome(application_id, name, outcome, message):
+    return {
+        'id': application_id,
+        'name': name,
+        'outcome': outcome,
+        'message': message,
+    }
@@ -0,0 +1,88 @@
+import csv
+from django.db.models import Count, Exists, IntegerField, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+from application.models import Application, ApplicationCompanyInfo
+from .bulk_complete_applications import annotate_review_counts
+
+SUMMARY_CHUNK_SIZE = 500
+SUMMARY_COLUMNS = (
+    'Application ID', 'Application', 'Imported', 'Status', 'Rejection reason',
+    'Approved partners', 'Partners', 'Approved products', 'Products'
+)
+
+
+def annotate_bulk_submission_outcomes(queryset):
+    """
+    Annotate bulk submissions with the number of their items per outcome.
+
+    An item is imported once its application form was processed (it has
+    company info); its review outcome is the application status. Like
+    ``annotate_review_counts``, each count is a correlated subquery with a
+    conditional aggregate, so the counts come with the listed rows and can
+    be sorted on. Adds:
+        item_count, imported_count, not_imported_count
+        in_review_count, completed_count, rejected_count
+    """
+    return queryset.annotate(
+        item_count=_item_count_subquery(),
+        imported_count=_item_count_subquery(Q(company_info__isnull=False)),
+        not_imported_count=_item_count_subquery(Q(company_info__isnull=True)),
+        in_review_count=_item_count_subquery(Q(status=Application.Status.IN_REVIEW)),
+        completed_count=_item_count_subquery(Q(status=Application.Status.COMPLETED)),
+        rejected_count=_item_count_subquery(Q(status=Application.Status.REJECTED)),
+    )
+
+
+def _item_count_subquery(condition=None):
+    counts = Application.objects.filter(bulk_submissions=OuterRef('pk')).order_by().values(
+        'bulk_submissions'
+    ).annotate(count=Count('pk', filter=condition)).values('count')
+    return Coalesce(Subquery(counts, output_field=IntegerField()), Value(0))
+
+
+def bulk_submission_items(bulk_submission, chunk_size=SUMMARY_CHUNK_SIZE):
+    """
+    Yield the items of a bulk submission with their outcome, one dict per application.
+
+    Rows are read with a server-side iterator and carry partner and product
+    review counts, so the whole batch is never loaded at once.
+    """
+    queryset = annotate_review_counts(
+        Application.objects.filter(bulk_submissions=bulk_submission)
+    ).annotate(
+        imported=Exists(ApplicationCompanyInfo.objects.filter(application=OuterRef('pk')))
+    ).order_by('pk').values(
+        'pk', 'name', 'status', 'rejection_reason', 'imported',
+        'partner_count', 'approved_partner_count', 'product_count', 'approved_product_count'
+    )
+    return queryset.iterator(chunk_size=chunk_size)
+
+
+class _Echo:
+    """File-like object whose write returns the line, so csv.writer can feed a stream."""
+
+    def write(self, value):
+        return value
+
+
+def stream_bulk_submission_summary(bulk_submission):
+    """
+    Stream the per-item outcomes of a bulk submission as CSV.
+
+    One line per application: whether its form was imported, its review
+    status and how many of its partners and products were approved.
+    """
+    writer = csv.writer(_Echo())
+    yield writer.writerow(SUMMARY_COLUMNS)
+    for item in bulk_submission_items(bulk_submission):
+        yield writer.writerow([
+            item['pk'],
+            item['name'],
+            'yes' if item['imported'] else 'no',
+            item['status'],
+            item['rejection_reason'] or '',
+            item['approved_partner_count'],
+            item['partner_count'],
+            item['approved_product_count'],
+            item['product_count'],
+        ])
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import logging
+from datetime import timedelta
+from django.core.files.base import ContentFile
+from django.db.models import Q
+from django.utils import timezone
+from application.models import Application, ApplicationCertificate, ApplicationCompanyInfo
+from .certificate_verification import certificate_digest, record_certificate_verification
+from .generate_pdf_certificate import (
+    CERTIFICATE_TEMPLATE_VERSION,
+    generate_pdf_certificate,
+    generate_pdf_certificates_parallel
+)
+from .pdf_backends import get_pdf_backend_path
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+RENDER_TIMEOUT = timedelta(minutes=10)
+
+STAGING_FIELDS = ['name', 'address', 'city', 'state', 'zip_code', 'country', 'is_approved', 'rejection_reason']
+PRODUCT_FIELDS = [
+    'supply_chain_partner_name_raw', 'product_name', 'product_category',
+    'raw_materials_list', 'is_approved', 'rejection_reason'
+]
+
+
+def certificate_content_key(application):
+    """
+    Derive the storage key of an application's certificate.
+    
+    Hashes the template version, the PDF backend and every field the
+    certificate shows, so the key changes whenever any approval or
+    rejection reason changes. Uses company info, partners and products
+    from the prefetch cache when present (see prefetch_certificate_data),
+    otherwise costs three small queries.
+    
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    content = {
+        'template_version': CERTIFICATE_TEMPLATE_VERSION,
+        'pdf_backend': get_pdf_backend_path(),
+        'application': [
+            application.id, application.name, application.description, application.status,
+            application.rejection_reason,
+            application.submission_date.isoformat() if application.submission_date else None,
+        ],
+        'company_info': _company_info_values(application),
+        'partners': _related_values(application, 'supply_chain_partners', STAGING_FIELDS),
+        'products': _related_values(application, 'products', PRODUCT_FIELDS),
+    }
+    serialized = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode('utf-8')).hexdigest()
+
+
+def _company_info_values(application):
+    if Application.company_info.is_cached(application):
+        company_info = getattr(application, 'company_info', None)
+        return [[getattr(company_info, field) for field in STAGING_FIELDS]] if company_info else []
+    return list(ApplicationCompanyInfo.objects.filter(application=application).values_list(*STAGING_FIELDS))
+
+
+def _related_values(application, related_name, fields):
+    if related_name in getattr(application, '_prefetched_objects_cache', {}):
+        return [
+            [item.id] + [getattr(item, field) for field in fields]
+            for item in sorted(getattr(application, related_name).all(), key=lambda item: item.id)
+        ]
+    return list(getattr(application, related_name).order_by('id').values_list('id', *fields))
+
+
+def get_or_create_certificates(applications, max_workers=None):
+    """
+    Return the stored certificates of many applications, rendering missing ones.
+    
+    Ready certificates are looked up in one query; the missing ones are
+    claimed and rendered in parallel with ``generate_pdf_certificates_parallel``.
+    Keys already being rendered by another worker are left to it.
+    
+    Returns:
+        dict: {application_id: ApplicationCertificate, or None if it is not
+               ready (rendering failed or in progress elsewhere)}
+    """
+    content_keys = {application.id: certificate_content_key(application) for application in applications}
+    with span('certificate_store.batch', applications=len(content_keys)) as root:
+        ready = {
+            certificate.content_key: certificate
+            for certificate in ApplicationCertificate.objects.filter(
+                content_key__in=content_keys.values(),
+                status=ApplicationCertificate.Status.READY
+            )
+        }
+        results = {application_id: ready.get(content_key) for application_id, content_key in content_keys.items()}
+        
+        claimed = {}
+        for application in applications:
+            if results[application.id] is None:
+                certificate = _claim_certificate(application, content_keys[application.id])
+                if certificate is not None and certificate.status == ApplicationCertificate.Status.READY:
+                    results[application.id] = certificate
+                elif certificate is not None:
+                    claimed[application.id] = (application, certificate)
+        root.set(hits=len(ready), rendered=len(claimed))
+        
+        if claimed:
+            pdfs = generate_pdf_certificates_parallel(
+                [application for application, _ in claimed.values()],
+                max_workers=max_workers
+            )
+            for application_id, (application, certificate) in claimed.items():
+                _save_rendered(application, certificate, pdfs.get(application_id))
+                if certificate.status == ApplicationCertificate.Status.READY:
+                    results[application_id] = certificate
+        
+        return results
+
+
+def render_certificate(application, content_key):
+    """
+    Render an application's certificate into its content-key row.
+    
+    The row is claimed with a conditional UPDATE so only one worker renders
+    a given key; progress is written to the row as rendering advances.
+    
+    Returns:
+        ApplicationCertificate: The row for the key, or None if another
+                                worker is already rendering it
+    """
+    certificate = _claim_certificate(application, content_key)
+    if certificate is None or certificate.status == ApplicationCertificate.Status.READY:
+        return certificate
+    
+    def on_progress(percent):
+        ApplicationCertificate.objects.filter(pk=certificate.pk).update(progress=percent, updated_at=timezone.now())
+    
+    pdf = generate_pdf_certificate(application, on_progress=on_progress)
+    _save_rendered(application, certificate, pdf)
+    return certificate
+
+
+def _claim_certificate(application, content_key):
+    """
+    Get or create the row for a content key and claim it for rendering.
+    
+    Returns the row if it is ready or now claimed by the caller, None if
+    another worker is rendering it.
+    """
+    certificate, _ = ApplicationCertificate.objects.get_or_create(
+        content_key=content_key,
+        defaults={'application': application}
+    )
+    if certificate.status == ApplicationCertificate.Status.READY:
+        return certificate
+    
+    claimed = ApplicationCertificate.objects.filter(
+        Q(status__in=[ApplicationCertificate.Status.PENDING, ApplicationCertificate.Status.FAILED]) |
+        # A render that stopped reporting progress was lost (e.g. a restart)
+        Q(status=ApplicationCertificate.Status.RENDERING, updated_at__lt=timezone.now() - RENDER_TIMEOUT),
+        pk=certificate.pk
+    ).update(status=ApplicationCertificate.Status.RENDERING, progress=0, error_message=None, updated_at=timezone.now())
+    if not claimed:
+        return None
+    
+    certificate.status = ApplicationCertificate.Status.RENDERING
+    return certificate
+
+
+def _save_rendered(application, certificate, pdf):
+    """
+    Store a rendered PDF on its claimed row, or mark the row failed.
+    
+    Also records the PDF's digest for public verification.
+    """
+    if not pdf:
+        certificate.status = ApplicationCertificate.Status.FAILED
+        certificate.progress = 0
+        certificate.error_message = "Failed to generate PDF"
+        certificate.save(update_fields=['status', 'progress', 'error_message', 'updated_at'])
+        return
+    
+    certificate.file.save(f"{certificate.content_key}.pdf", ContentFile(pdf), save=False)
+    certificate.digest = certificate_digest(pdf)
+    certificate.status = ApplicationCertificate.Status.READY
+    certificate.progress = 100
+    certificate.save(update_fields=['file', 'digest', 'status', 'progress', 'updated_at'])
+    
+    record_certificate_verification(application, certificate.digest)
+    _delete_stale_certificates(application, certificate.content_key)
+
+
+def _delete_stale_certificates(application, content_key):
+    """Remove certificates of earlier review states and their files."""
+    stale = application.certificates.exclude(content_key=content_key)
+    for certificate in stale:
+        if certificate.file:
+            certificate.file.delete(save=False)
+    stale.delete()
@@ -0,0 +1,72 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from application.models import CertificateVerification
+
+CACHE_PREFIX = 'certificate_verification:'
+
+
+def certificate_digest(pdf):
+    """SHA-256 of the PDF bytes; third parties compute the same over the file."""
+    return hashlib.sha256(pdf).hexdigest()
+
+
+def record_certificate_verification(application, digest):
+    """
+    Store the public verification record of a freshly rendered certificate.
+
+    Uses the application's prefetched products when present. Earlier
+    certificates of the application stay verifiable but are marked as
+    superseded.
+    """
+    approved_products = [
+        {
+            'product_name': product.product_name,
+            'product_category': product.product_category,
+            'supply_chain_partner': product.supply_chain_partner_name_raw,
+        }
+        for product in sorted(application.products.all(), key=lambda product: product.id)
+        if product.is_approved
+    ]
+    CertificateVerification.objects.update_or_create(
+        digest=digest,
+        defaults={
+            'application': application,
+            'application_name': application.name,
+            'status': application.status,
+            'approved_products': approved_products,
+            'is_current': True,
+            'issued_at': timezone.now(),
+        }
+    )
+
+    CertificateVerification.objects.filter(
+        application=application, is_current=True
+    ).exclude(digest=digest).update(is_current=False)
+
+
+def get_certificate_verification(digest):
+    """
+    Look up a certificate by digest, through the cache.
+
+    Verification data is cached by digest alone for
+    ``CERTIFICATE_VERIFICATION_CACHE_TIMEOUT`` seconds, the ``max_age`` the
+    public endpoint already gives downstream caches: a certificate marked
+    as superseded may still read as current for that long, and nothing is
+    deleted. A hit costs one cache read and a miss one indexed lookup.
+    Unknown digests are not cached.
+
+    Returns:
+        dict: Verification data, or None if no certificate has this digest
+    """
+    key = f"{CACHE_PREFIX}{digest}"
+    data = cache.get(key)
+    if data is None:
+        data = CertificateVerification.objects.filter(digest=digest).values(
+            'digest', 'application_name', 'status', 'approved_products', 'is_current', 'issued_at'
+        ).first()
+        if data is None:
+            return None
+        cache.set(key, data, getattr(settings, 'CERTIFICATE_VERIFICATION_CACHE_TIMEOUT', 300))
+    return data
@@ -1,10 +1,10 @@
 import logging
 from django.db import transaction
-from django.contrib.auth.models import User
+from application.models import ApplicationSupplyChainPartner, ApplicationProduct
 from customer.models import Address, Company, SupplyChainCompany
 from product.models import ProductCategory, ProductDetail, RawMaterial, Product
+from .tracing import span, trace
 
-# Set up detailed logging
 logger = logging.getLogger(__name__)
 
 def complete_application(application):
@@ -20,373 +20,251 @@ def complete_application(application):
     Returns:
         bool: True if successful, False if failed
     """
-    logger.info("🚀 STARTING application completion process for: %s (ID: %s)", 
-                application.name, application.id)
-    logger.info("📊 Application status: %s", application.status)
-    
-    try:
-        with transaction.atomic():
-            logger.info("🔒 Database transaction started - all changes will be atomic")
-            
-            # Validate that all required components exist and are approved
-            logger.info("📋 Step 1: Validating application components...")
-            if not _validate_application_components(application):
-                logger.error("❌ Application validation failed for: %s", application.name)
-                return False
-            logger.info("✅ Application validation passed")
-            
-            # Create company and address if approved
-            logger.info("🏢 Step 2: Creating company records...")
-            company = _create_company_from_application(application)
-            if not company:
-                logger.error("❌ Failed to create company for application: %s", application.name)
-                return False
-            logger.info("✅ Company created successfully: %s (ID: %s)", company.name, company.id)
-            
-            # Create supply chain partners if approved
-            logger.info("🔗 Step 3: Creating supply chain partners...")
-            supply_chain_companies = _create_supply_chain_partners(application)
-            logger.info("✅ Created %s supply chain partners", len(supply_chain_companies))
-            
-            # Create products and related entities if approved
-            logger.info("📦 Step 4: Creating products and related entities...")
-            products_created = _create_products_from_application(application, supply_chain_companies)
-            logger.info("✅ Created %s products", len(products_created))
-            
-            # Summary
-            logger.info("📈 COMPLETION SUMMARY for %s:", application.name)
-            logger.info("   • Company: %s (ID: %s)", company.name, company.id)
-            logger.info("   • Supply Chain Partners: %s", len(supply_chain_companies))
-            logger.info("   • Products: %s", len(products_created))
-            logger.info("   • Total database records created: %s", 
-                      1 + len(supply_chain_companies) + len(products_created))  # Company + partners + products
-            
-            logger.info("🎉 SUCCESS: Application %s completed successfully!", application.name)
-            return True
-            
-    except Exception as e:
-        logger.error("💥 CRITICAL ERROR in application completion for %s:", application.name)
-        logger.error("   Error type: %s", type(e).__name__)
-        logger.error("   Error message: %s", str(e))
-        logger.error("   Stack trace:", exc_info=True)
-        return False
+    with span('complete_application', application_id=application.id,
+              application_status=application.status) as root:
+        try:
+            with transaction.atomic():
+                # Validate that all required components exist and are approved
+                with span('complete_application.validate'):
+                    if not _validate_application_components(application):
+                        root.set(result='invalid')
+                        return False
+                
+                records = create_permanent_records([application])[application.id]
+                root.set(
+                    result='completed',
+                    company_id=records['company'].id,
+                    supply_chain_companies=len(records['supply_chain_companies']),
+                    products=len(records['products']),
+                )
+                return True
+                
+        except Exception as e:
+            logger.error("Application completion failed for %s (ID: %s): %s",
+                         application.name, application.id, e, exc_info=True)
+            root.set(result='error')
+            return False
 
 def _validate_application_components(application):
     """Validate that all required application components exist and are approved."""
-    logger.debug("🔍 Validating application components for: %s", application.name)
-    
     # Check if company info exists and is approved
     if not hasattr(application, 'company_info') or not application.company_info:
-        logger.error("❌ Application %s has no company info attached", application.name)
+        logger.error("Application %s has no company info attached", application.name)
         return False
     
-    company_info = application.company_info
-    logger.debug("   Company info: %s (Approved: %s)", 
-                company_info.name, company_info.is_approved)
-    
-    if not company_info.is_approved:
-        logger.error("❌ Application %s company info is not approved", application.name)
+    if not application.company_info.is_approved:
+        logger.error("Application %s company info is not approved", application.name)
         return False
     
-    # Check supply chain partners
-    all_partners = application.supply_chain_partners.all()
-    approved_partners = application.supply_chain_partners.filter(is_approved=True)
-    rejected_partners = application.supply_chain_partners.filter(is_approved=False)
+    # Per-item review details are only queried when DEBUG logging is enabled
+    partners = application.supply_chain_partners
+    products = application.products
+    trace(logging.DEBUG, "Supply Chain Partners for %s - Approved: %s, Rejected: %s",
+          application.name,
+          lambda: partners.filter(is_approved=True).count(),
+          lambda: partners.filter(is_approved=False).count(),
+          logger=logger)
+    trace(logging.DEBUG, "Products for %s - Approved: %s, Rejected: %s",
+          application.name,
+          lambda: products.filter(is_approved=True).count(),
+          lambda: products.filter(is_approved=False).count(),
+          logger=logger)
+    trace(logging.DEBUG, "Rejected items for %s: %s",
+          application.name,
+          lambda: [
+              (item.name, item.rejection_reason) for item in partners.filter(is_approved=False)
+          ] + [
+              (item.product_name, item.rejection_reason) for item in products.filter(is_approved=False)
+          ],
+          logger=logger)
     
-    logger.debug("   Supply Chain Partners - Total: %s, Approved: %s, Rejected: %s", 
-                all_partners.count(), approved_partners.count(), rejected_partners.count())
+    if not partners.filter(is_approved=True).exists():
+        logger.warning("Application %s has no approved supply chain partners", application.name)
+    if not products.filter(is_approved=True).exists():
+        logger.warning("Application %s has no approved products", application.name)
     
-    for partner in approved_partners:
-        logger.debug("     ✅ Approved: %s", partner.name)
-    for partner in rejected_partners:
-        logger.debug("     ❌ Rejected: %s - Reason: %s", 
-                    partner.name, partner.rejection_reason or "No reason provided")
+    return True
+
+def create_permanent_records(applications):
+    """
+    Create permanent records for a set of approved applications in bulk.
     
-    if not approved_partners.exists():
-        logger.warning("⚠️ Application %s has no approved supply chain partners", application.name)
+    Addresses, companies, supply chain companies, products and their raw
+    material links are written with one ``bulk_create`` per table, so the
+    cost stays flat no matter how many applications are completed together.
+    Must be called inside a transaction.
     
-    # Check products
-    all_products = application.products.all()
-    approved_products = application.products.filter(is_approved=True)
-    rejected_products = application.products.filter(is_approved=False)
+    Args:
+        applications: Iterable of Application instances with company info
+        
+    Returns:
+        dict: Application id -> {'company', 'supply_chain_companies', 'products'}
+    """
+    applications = list(applications)
+    records = {
+        application.id: {'company': None, 'supply_chain_companies': [], 'products': []}
+        for application in applications
+    }
     
-    logger.debug("   Products - Total: %s, Approved: %s, Rejected: %s", 
-                all_products.count(), approved_products.count(), rejected_products.count())
+    with span('complete_application.company', applications=len(applications)) as stage:
+        for application_id, company in _create_companies(applications).items():
+            records[application_id]['company'] = company
+        stage.set(created=len(applications))
     
-    for product in approved_products:
-        logger.debug("     ✅ Approved: %s", product.product_name)
-    for product in rejected_products:
-        logger.debug("     ❌ Rejected: %s - Reason: %s", 
-                    product.product_name, product.rejection_reason or "No reason provided")
+    with span('complete_application.partners', applications=len(applications)) as stage:
+        partners_created = _create_supply_chain_partners(applications)
+        for application_id, companies in partners_created.items():
+            records[application_id]['supply_chain_companies'] = companies
+        stage.set(created=lambda: sum(len(companies) for companies in partners_created.values()))
     
-    if not approved_products.exists():
-        logger.warning("⚠️ Application %s has no approved products", application.name)
+    with span('complete_application.products', applications=len(applications)) as stage:
+        products_created = _create_products(applications)
+        for application_id, products in products_created.items():
+            records[application_id]['products'] = products
+        stage.set(created=lambda: sum(len(products) for products in products_created.values()))
     
-    logger.info("✅ Application validation completed successfully")
-    return True
+    return records
 
-def _create_company_from_application(application):
-    """Create Company and Address from approved application company info."""
-    company_info = application.company_info
-    
-    logger.debug("🏢 Creating company from: %s", company_info.name)
-    logger.debug("   Address: %s, %s, %s %s, %s", 
-                company_info.address, company_info.city, 
-                company_info.state, company_info.zip_code, company_info.country)
+def _create_companies(applications):
+    """Create Company and Address records from approved company info."""
+    company_infos = [application.company_info for application in applications]
     
-    try:
-        # Create address first
-        logger.debug("   Creating address record...")
-        address = Address.objects.create(
-            address=company_info.address or '',
-            city=company_info.city or '',
-            state=company_info.state or '',
-            zip_code=company_info.zip_code or '',
-            country=company_info.country or ''
-        )
-        logger.debug("   ✅ Address created (ID: %s)", address.id)
-        
-        # Create company
-        logger.debug("   Creating company record...")
-        company = Company.objects.create(
-            name=company_info.name or f"Company-{application.id}",
+    addresses = Address.objects.bulk_create([
+        _address_from_staging(company_info) for company_info in company_infos
+    ])
+    companies = Company.objects.bulk_create([
+        Company(
+            name=company_info.name or f"Company-{company_info.application_id}",
             address=address
         )
-        logger.debug("   ✅ Company created (ID: %s)", company.id)
-        
-        # Note: Users would need to be associated later via admin or separate process
-        logger.info("🏢 Created company: %s (ID: %s) with address ID: %s", 
-                   company.name, company.id, address.id)
-        return company
-        
-    except Exception as e:
-        logger.error("❌ Failed to create company from application %s:", application.name)
-        logger.error("   Error: %s", str(e))
-        return None
+        for company_info, address in zip(company_infos, addresses)
+    ])
+    
+    # Note: Users would need to be associated later via admin or separate process
+    return {
+        company_info.application_id: company
+        for company_info, company in zip(company_infos, companies)
+    }
 
-def _create_supply_chain_partners(application):
+def _create_supply_chain_partners(applications):
     """Create SupplyChainCompany records from approved supply chain partners."""
-    approved_partners = application.supply_chain_partners.filter(is_approved=True)
-    created_companies = []
+    approved_partners = list(ApplicationSupplyChainPartner.objects.filter(
+        application__in=applications,
+        is_approved=True
+    ).order_by('application_id', 'id'))
     
-    logger.debug("🔗 Processing %s approved supply chain partners", approved_partners.count())
-    
-    for i, partner in enumerate(approved_partners, 1):
-        logger.debug("   [%s/%s] Creating supply chain partner: %s", 
-                    i, approved_partners.count(), partner.name)
-        
-        try:
-            # Create address for supply chain partner
-            logger.debug("      Creating address...")
-            address = Address.objects.create(
-                address=partner.address or '',
-                city=partner.city or '',
-                state=partner.state or '',
-                zip_code=partner.zip_code or '',
-                country=partner.country or ''
-            )
-            logger.debug("      ✅ Address created (ID: %s)", address.id)
-            
-            # Create supply chain company (mark as valid since they're approved)
-            logger.debug("      Creating supply chain company...")
-            supply_chain_company = SupplyChainCompany.objects.create(
-                name=partner.name or f"Partner-{partner.id}",
-                is_valid=True,  # Mark as valid since they passed approval
-                address=address
-            )
-            logger.debug("      ✅ Supply chain company created (ID: %s)", supply_chain_company.id)
-            
-            created_companies.append(supply_chain_company)
-            logger.info("🔗 Created supply chain company: %s (ID: %s)", 
-                       supply_chain_company.name, supply_chain_company.id)
-            
-        except Exception as e:
-            logger.error("❌ Failed to create supply chain partner %s:", partner.name)
-            logger.error("   Error: %s", str(e))
-            continue
+    addresses = Address.objects.bulk_create([
+        _address_from_staging(partner) for partner in approved_partners
+    ])
+    # Mark as valid since they passed approval
+    supply_chain_companies = SupplyChainCompany.objects.bulk_create([
+        SupplyChainCompany(
+            name=partner.name or f"Partner-{partner.id}",
+            is_valid=True,
+            address=address
+        )
+        for partner, address in zip(approved_partners, addresses)
+    ])
     
-    logger.info("🔗 Completed supply chain partner creation: %s successful, %s total attempted", 
-               len(created_companies), approved_partners.count())
-    return created_companies
+    created = {}
+    for partner, supply_chain_company in zip(approved_partners, supply_chain_companies):
+        created.setdefault(partner.application_id, []).append(supply_chain_company)
+    return created
 
-def _create_products_from_application(application, supply_chain_companies):
+def _create_products(applications):
     """Create Product records and related entities from approved products."""
-    approved_products = application.products.filter(is_approved=True)
-    created_products = []
+    # Products of a rejected partner are never created, whatever their own status
+    approved_products = list(ApplicationProduct.objects.filter(
+        application__in=applications,
+        is_approved=True
+    ).exclude(
+        supply_chain_partner__is_approved=False
+    ).order_by('application_id', 'id').prefetch_related('materials'))
     
-    logger.debug("📦 Processing %s approved products", approved_products.count())
+    categories = _get_or_create_by_code(ProductCategory, {
+        _make_code('CAT', app_product.product_category): app_product.product_category
+        for app_product in approved_products if app_product.product_category
+    })
+    product_details = _get_or_create_by_code(ProductDetail, {
+        _make_code('PROD', app_product.product_name): app_product.product_name
+        for app_product in approved_products if app_product.product_name
+    })
+    raw_materials = _get_or_create_by_code(RawMaterial, {
+        material.code: material.name
+        for app_product in approved_products for material in app_product.materials.all()
+    })
     
-    # Create a mapping of supply chain partner names to their created companies
-    partner_name_mapping = {company.name: company for company in supply_chain_companies}
-    logger.debug("   Available supply chain companies: %s", list(partner_name_mapping.keys()))
-    
-    for i, app_product in enumerate(approved_products, 1):
-        logger.debug("   [%s/%s] Creating product: %s", 
-                    i, approved_products.count(), app_product.product_name)
-        
-        try:
-            # Get or create product category
-            logger.debug("      Processing product category...")
-            category = _get_or_create_product_category(app_product)
-            if not category:
-                logger.warning("⚠️ Skipping product %s - could not create category", app_product.product_name)
-                continue
-            logger.debug("      ✅ Category: %s (ID: %s)", category.description, category.id)
-            
-            # Get or create product detail
-            logger.debug("      Processing product detail...")
-            product_detail = _get_or_create_product_detail(app_product)
-            if not product_detail:
-                logger.warning("⚠️ Skipping product %s - could not create product detail", app_product.product_name)
-                continue
-            logger.debug("      ✅ Product detail: %s (ID: %s)", product_detail.description, product_detail.id)
-            
-            # Create raw materials
-            logger.debug("      Processing raw materials...")
-            raw_materials = _create_raw_materials_from_product(app_product)
-            logger.debug("      ✅ Created %s raw materials", len(raw_materials))
-            
-            # Create the main product
-            logger.debug("      Creating main product record...")
-            product = Product.objects.create(
-                name=app_product.product_name,
-                detail=product_detail,
-                category=category
-            )
-            logger.debug("      ✅ Main product created (ID: %s)", product.id)
-            
-            # Add raw materials to the product
-            if raw_materials:
-                product.raw_materials.set(raw_materials)
-                logger.debug("      ✅ Associated %s raw materials with product", len(raw_materials))
-            
-            created_products.append(product)
-            logger.info("📦 Created product: %s (ID: %s) with %s raw materials", 
-                       product.name, product.id, len(raw_materials))
-            
-        except Exception as e:
-            logger.error("❌ Failed to create product %s:", app_product.product_name)
-            logger.error("   Error: %s", str(e))
+    # Products without a category or name cannot be created
+    creatable = []
+    for app_product in approved_products:
+        if not app_product.product_category or not app_product.product_name:
+            logger.warning("Skipping product %s - missing category or name", app_product.product_name)
             continue
+        creatable.append(app_product)
     
-    logger.info("📦 Completed product creation: %s successful, %s total attempted", 
-               len(created_products), approved_products.count())
-    return created_products
-
-def _get_or_create_product_category(app_product):
-    """Get or create ProductCategory from application product data."""
-    if not app_product.product_category:
-        logger.warning("⚠️ No product category specified for product: %s", app_product.product_name)
-        return None
-    
-    try:
-        # Create a code from the category name (simple slugification)
-        category_code = app_product.product_category.upper().replace(' ', '-').replace("'", "")[:50]
-        category_code = f"CAT-{category_code}"
-        
-        logger.debug("      Looking up/creating category: %s -> %s", 
-                    app_product.product_category, category_code)
-        
-        category, created = ProductCategory.objects.get_or_create(
-            code=category_code,
-            defaults={
-                'description': app_product.product_category,
-                'is_active': True
-            }
+    products = Product.objects.bulk_create([
+        Product(
+            name=app_product.product_name,
+            detail=product_details[_make_code('PROD', app_product.product_name)],
+            category=categories[_make_code('CAT', app_product.product_category)]
         )
-        
-        if created:
-            logger.debug("      ✅ Created NEW category: %s (ID: %s)", category_code, category.id)
-        else:
-            logger.debug("      ✅ Using EXISTING category: %s (ID: %s)", category_code, category.id)
-        
-        return category
-        
-    except Exception as e:
-        logger.error("❌ Failed to create product category for %s:", app_product.product_category)
-        logger.error("   Error: %s", str(e))
-        return None
-
-def _get_or_create_product_detail(app_product):
-    """Get or create ProductDetail from application product data."""
-    if not app_product.product_name:
-        logger.warning("⚠️ No product name specified for product")
-        return None
+        for app_product in creatable
+    ])
     
-    try:
-        # Create a code from the product name
-        detail_code = app_product.product_name.upper().replace(' ', '-').replace("'", "")[:50]
-        detail_code = f"PROD-{detail_code}"
-        
-        logger.debug("      Looking up/creating product detail: %s -> %s", 
-                    app_product.product_name, detail_code)
-        
-        product_detail, created = ProductDetail.objects.get_or_create(
-            code=detail_code,
-            defaults={
-                'description': app_product.product_name,
-                'is_active': True
-            }
+    # Add raw materials to the products
+    through_rows = []
+    for app_product, product in zip(creatable, products):
+        material_codes = {material.code for material in app_product.materials.all()}
+        through_rows.extend(
+            Product.raw_materials.through(product=product, rawmaterial=raw_materials[code])
+            for code in material_codes
         )
-        
-        if created:
-            logger.debug("      ✅ Created NEW product detail: %s (ID: %s)", detail_code, product_detail.id)
-        else:
-            logger.debug("      ✅ Using EXISTING product detail: %s (ID: %s)", detail_code, product_detail.id)
-        
-        return product_detail
-        
-    except Exception as e:
-        logger.error("❌ Failed to create product detail for %s:", app_product.product_name)
-        logger.error("   Error: %s", str(e))
-        return None
-
-def _create_raw_materials_from_product(app_product):
-    """Create RawMaterial records from product's raw materials list."""
-    if not app_product.raw_materials_list:
-        logger.debug("      No raw materials specified for product: %s", app_product.product_name)
-        return []
+    Product.raw_materials.through.objects.bulk_create(through_rows)
     
-    raw_materials = []
-    
-    logger.debug("      Processing raw materials list: %s", app_product.raw_materials_list)
+    created = {}
+    for app_product, product in zip(creatable, products):
+        created.setdefault(app_product.application_id, []).append(product)
+    return created
+
+def _address_from_staging(staging):
+    """Build an unsaved Address from a staged company info or partner."""
+    return Address(
+        address=staging.address or '',
+        city=staging.city or '',
+        state=staging.state or '',
+        zip_code=staging.zip_code or '',
+        country=staging.country or ''
+    )
+
+def _make_code(prefix, name):
+    """Create a catalog code from a name (simple slugification)."""
+    code = name.upper().replace(' ', '-').replace("'", "")[:50]
+    return f"{prefix}-{code}"
+
+def _get_or_create_by_code(model, descriptions_by_code):
+    """
+    Get or create catalog rows (categories, details, materials) by code.
     
-    try:
-        # Split the raw materials list (assuming comma-separated)
-        material_names = [material.strip() for material in app_product.raw_materials_list.split(',')]
-        logger.debug("      Found %s raw materials: %s", len(material_names), material_names)
-        
-        for j, material_name in enumerate(material_names, 1):
-            if not material_name:
-                logger.debug("      [%s/%s] Skipping empty material name", j, len(material_names))
-                continue
-                
-            # Create a code from the material name
-            material_code = material_name.upper().replace(' ', '-').replace("'", "")[:50]
-            material_code = f"MAT-{material_code}"
-            
-            logger.debug("      [%s/%s] Processing material: %s -> %s", 
-                        j, len(material_names), material_name, material_code)
-            
-            material, created = RawMaterial.objects.get_or_create(
-                code=material_code,
-                defaults={
-                    'description': material_name,
-                    'is_active': True
-                }
-            )
-            
-            raw_materials.append(material)
-            
-            if created:
-                logger.debug("      ✅ Created NEW raw material: %s (ID: %s)", material_code, material.id)
-            else:
-                logger.debug("      ✅ Using EXISTING raw material: %s (ID: %s)", material_code, material.id)
-        
-        logger.debug("      ✅ Completed processing %s raw materials", len(raw_materials))
+    Existing rows are fetched with one query and the missing ones are
+    inserted with one ``bulk_create``, keeping existing descriptions.
     
-    except Exception as e:
-        logger.error("❌ Failed to create raw materials for product %s:", app_product.product_name)
-        logger.error("   Error: %s", str(e))
+    Returns:
+        dict: Code -> model instance
+    """
+    if not descriptions_by_code:
+        return {}
     
-    return raw_materials
\ No newline at end of file
+    existing = {obj.code: obj for obj in model.objects.filter(code__in=descriptions_by_code)}
+    missing = [
+        model(code=code, description=description, is_active=True)
+        for code, description in descriptions_by_code.items()
+        if code not in existing
+    ]
+    if missing:
+        trace(logging.DEBUG, "Creating %s new %s rows", len(missing), model.__name__, logger=logger)
+        model.objects.bulk_create(missing, ignore_conflicts=True)
+        existing.update({
+            obj.code: obj
+            for obj in model.objects.filter(code__in=[obj.code for obj in missing])
+        })
+    return existing
@@ -0,0 +1,83 @@
+from django.db import transaction
+from application.models import (
+    Application,
+    ApplicationCompanyInfo,
+    ApplicationSupplyChainPartner,
+    ApplicationProduct,
+    ApplicationProductMaterial
+)
+from .search_index import queue_search_update
+
+CREATE_CHUNK_SIZE = 100
+
+
+def create_applications(items, chunk_size=CREATE_CHUNK_SIZE):
+    """
+    Create applications in review with their company info, partners and products.
+
+    All applications are created in one transaction: if any write fails,
+    none of them is saved, so a failed request can simply be retried.
+    They are written in chunks with one ``bulk_create`` per table and
+    chunk; a chunk therefore costs the same handful of queries however
+    many partners and products it holds.
+
+    Args:
+        items: Validated application data, as ApplicationSerializer validates it
+        chunk_size: Applications per chunk of ``bulk_create`` statements
+
+    Returns:
+        list: Created Application instances, in input order
+    """
+    applications = []
+    with transaction.atomic():
+        for start in range(0, len(items), chunk_size):
+            applications.extend(_create_chunk(items[start:start + chunk_size]))
+    return applications
+
+
+def _create_chunk(items):
+    applications = Application.objects.bulk_create([
+        Application(
+            **{
+                field: value for field, value in item.items()
+                if field not in ('company_info', 'supply_chain_partners')
+            },
+            status=Application.Status.IN_REVIEW
+        )
+        for item in items
+    ])
+
+    ApplicationCompanyInfo.objects.bulk_create([
+        ApplicationCompanyInfo(application=application, **item['company_info'])
+        for application, item in zip(applications, items)
+    ])
+
+    partners = []
+    products_data = []
+    for application, item in zip(applications, items):
+        for partner_data in item['supply_chain_partners']:
+            partner_data = dict(partner_data)
+            products_data.append(partner_data.pop('products', []))
+            partners.append(ApplicationSupplyChainPartner(application=application, **partner_data))
+    partners = ApplicationSupplyChainPartner.objects.bulk_create(partners)
+
+    products = ApplicationProduct.objects.bulk_create([
+        ApplicationProduct(
+            application=partner.application,
+            supply_chain_partner=partner,
+            **{'supply_chain_partner_name_raw': partner.name, **product_data}
+        )
+        for partner, partner_products_data in zip(partners, products_data)
+        for product_data in partner_products_data
+    ])
+
+    ApplicationProductMaterial.objects.bulk_create([
+        material
+        for product in products
+        for material in ApplicationProductMaterial.build_for(product)
+    ])
+    # bulk_create sends no signals; index the complete applications on commit
+    for application in applications:
+        queue_search_update(application.id)
+
+    return applications
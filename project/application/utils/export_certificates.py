@@ -0,0 +1,102 @@
+import logging
+import zipfile
+from django.utils.text import slugify
+from application.models import Application
+from .certificate_store import get_or_create_certificates
+from .generate_pdf_certificate import prefetch_certificate_data
+
+logger = logging.getLogger(__name__)
+
+EXPORT_CHUNK_SIZE = 50
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class _StreamBuffer:
+    """Write-only, unseekable file object that hands out what zipfile wrote."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def certificate_filename(application):
+    """File name of an application's certificate inside an export archive."""
+    return f"sustainability_certificate_{application.id}_{slugify(application.name) or 'application'}.pdf"
+
+
+def stream_certificates_zip(queryset, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    Yield a ZIP archive of the certificates of completed and rejected applications.
+
+    Applications are processed in chunks of ``chunk_size``: certificate data
+    for a chunk is prefetched, stored certificates are reused and missing
+    ones rendered in parallel. Each PDF is copied into the archive from
+    its file in 64 KiB blocks and the archive bytes are yielded as they are
+    written, so memory stays bounded by one chunk however many
+    certificates are exported. Applications whose certificate could not be
+    rendered are listed in ``missing.txt``.
+
+    Args:
+        queryset: Applications to export; other statuses are ignored
+        chunk_size: Number of applications loaded and rendered at a time
+
+    Yields:
+        bytes: Consecutive pieces of the ZIP archive
+    """
+    return (data for data in _stream_zip(queryset, chunk_size) if data)
+
+
+def _stream_zip(queryset, chunk_size):
+    application_ids = list(
+        queryset.filter(status__in=[Application.Status.COMPLETED, Application.Status.REJECTED])
+        .order_by('pk')
+        .values_list('pk', flat=True)
+    )
+
+    buffer = _StreamBuffer()
+    missing = []
+    # Entries are already compressed PDFs, so they are stored as is
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for start in range(0, len(application_ids), chunk_size):
+            chunk = list(
+                Application.objects.filter(pk__in=application_ids[start:start + chunk_size])
+                .select_related('company_info')
+                .order_by('pk')
+            )
+            prefetch_certificate_data(chunk)
+            try:
+                certificates = get_or_create_certificates(chunk)
+            except Exception as e:
+                logger.error(f"Failed to prepare certificates for export: {str(e)}")
+                certificates = {}
+
+            for application in chunk:
+                certificate = certificates.get(application.id)
+                if certificate is None:
+                    missing.append(application)
+                    continue
+
+                with certificate.file.open('rb') as source, archive.open(certificate_filename(application), 'w') as target:
+                    for block in iter(lambda: source.read(STREAM_BLOCK_SIZE), b''):
+                        target.write(block)
+                        yield buffer.take()
+                yield buffer.take()
+
+        if missing:
+            archive.writestr('missing.txt', '\n'.join(
+                f"{application.id}\t{application.name}\tcertificate could not be rendered"
+                for application in missing
+            ) + '\n')
+
+    yield buffer.take()
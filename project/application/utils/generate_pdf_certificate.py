@@ -1,57 +1,137 @@
 import logging
-import pdfkit
-from django.template.loader import render_to_string
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db.models import prefetch_related_objects
+from django.template.loader import get_template
 from django.utils import timezone
+from .pdf_backends import get_pdf_backend
+from .tracing import span
 
-def generate_pdf_certificate(application):
+# Bump whenever certificate_template.html or a PDF backend's output changes, so
+# stored certificates are re-rendered (see certificate_store.py)
+CERTIFICATE_TEMPLATE_VERSION = '1'
+
+CERTIFICATE_TEMPLATE = 'application/certificate_template.html'
+
+
+def prefetch_certificate_data(applications):
+    """
+    Load company info, partners and products for many applications.
+
+    Three queries in total however many applications or components there
+    are; ``render_certificate_html`` then runs no queries of its own.
+    """
+    prefetch_related_objects(list(applications), 'company_info', 'supply_chain_partners', 'products')
+
+
+def render_certificate_html(application, template=None):
+    """
+    Render the certificate HTML for an application.
+
+    Partners and products are loaded once (or taken from the prefetch
+    cache, see ``prefetch_certificate_data``) and split into approved and
+    rejected lists in Python.
+    """
+    company_info = application.company_info
+    partners = list(application.supply_chain_partners.all())
+    products = list(application.products.all())
+
+    context = {
+        'application': application,
+        'generation_date': timezone.now().strftime("%B %d, %Y at %H:%M %Z"),
+
+        # Approved items
+        'approved_company_info': [company_info] if company_info.is_approved else [],
+        'approved_partners': [partner for partner in partners if partner.is_approved],
+        'approved_products': [product for product in products if product.is_approved],
+
+        # Rejected items
+        'rejected_company_info': [company_info] if not company_info.is_approved else [],
+        'rejected_partners': [partner for partner in partners if not partner.is_approved],
+        'rejected_products': [product for product in products if not product.is_approved],
+    }
+    template = template or get_template(CERTIFICATE_TEMPLATE)
+    return template.render(context)
+
+
+def render_pdf(html_content):
+    """Convert certificate HTML to PDF bytes with the configured backend."""
+    return get_pdf_backend().render(html_content)
+
+
+def generate_pdf_certificate(application, on_progress=None):
     """
     Generate PDF certificate for approved or rejected applications.
-    
-    Note: In production, we could implement logic to store the generated certificate
-    as a file when the application is completed/rejected, rather than generating
-    it dynamically on each download request. This would improve performance and
-    ensure certificate consistency.
-    """
-    logging.info(f"Generating PDF certificate for application: {application.name}")
-    
-    try:
-        # Prepare context data for the template
-        context = {
-            'application': application,
-            'generation_date': timezone.now().strftime("%B %d, %Y at %H:%M %Z"),
-            
-            # Approved items
-            'approved_company_info': [application.company_info] if application.company_info.is_approved else [],
-            'approved_partners': application.supply_chain_partners.filter(is_approved=True),
-            'approved_products': application.products.filter(is_approved=True),
-            
-            # Rejected items
-            'rejected_company_info': [application.company_info] if not application.company_info.is_approved else [],
-            'rejected_partners': application.supply_chain_partners.filter(is_approved=False),
-            'rejected_products': application.products.filter(is_approved=False),
-        }
-        
-        # Render HTML template
-        html_content = render_to_string('application/certificate_template.html', context)
-        
-        # PDF generation options
-        options = {
-            'page-size': 'Letter',
-            'margin-top': '1in',
-            'margin-right': '1in',
-            'margin-bottom': '1in',
-            'margin-left': '1in',
-            'encoding': "UTF-8",
-            'no-outline': None,
-            'enable-local-file-access': None,
-        }
-        
-        # Generate PDF from HTML
-        pdf = pdfkit.from_string(html_content, False, options=options)
-        
-        logging.info(f"Successfully generated PDF for application: {application.name}")
-        return pdf
-        
-    except Exception as e:
-        logging.error(f"Failed to generate PDF for application {application.name}: {str(e)}")
-        return None
\ No newline at end of file
+
+    Downloads should go through render_certificate_async.request_certificate,
+    which queues certificate_store.render_certificate (storing the result)
+    only when no certificate exists for the current review state.
+    ``on_progress`` is called with a percentage after each rendering stage.
+    """
+    with span('generate_pdf_certificate', application_id=application.id) as root:
+        try:
+            with span('generate_pdf_certificate.render_html'):
+                html_content = render_certificate_html(application)
+            if on_progress:
+                on_progress(40)
+
+            with span('generate_pdf_certificate.render_pdf'):
+                pdf = render_pdf(html_content)
+            if on_progress:
+                on_progress(90)
+
+            root.set(size=len(pdf))
+            return pdf
+
+        except Exception as e:
+            logging.error(f"Failed to generate PDF for application {application.name}: {str(e)}")
+            return None
+
+
+def generate_pdf_certificates_parallel(applications, max_workers=None):
+    """
+    Generate PDF certificates for many applications in parallel.
+
+    Certificate data for all applications is prefetched with three queries,
+    the template is loaded once and all HTML is rendered in the calling
+    thread, which keeps database access out of the workers. PDFs are then
+    rendered on a bounded pool of ``max_workers`` threads (default
+    ``CERTIFICATE_RENDER_WORKERS``).
+
+    Each certificate is still one ``render_pdf`` call: with the pdfkit
+    backend that is one wkhtmltopdf process per certificate. The pool only
+    overlaps those processes; it does not remove their startup cost.
+
+    Returns:
+        dict: {application_id: PDF bytes, or None if rendering failed}
+    """
+    applications = list(applications)
+    max_workers = max_workers or getattr(settings, 'CERTIFICATE_RENDER_WORKERS', 2)
+    with span('generate_pdf_certificates_parallel', applications=len(applications), workers=max_workers) as root:
+        results = {}
+        html_contents = {}
+        with span('generate_pdf_certificates_parallel.render_html'):
+            prefetch_certificate_data(applications)
+            template = get_template(CERTIFICATE_TEMPLATE)
+            for application in applications:
+                try:
+                    html_contents[application.id] = render_certificate_html(application, template)
+                except Exception as e:
+                    logging.error(f"Failed to render certificate for application {application.name}: {str(e)}")
+                    results[application.id] = None
+
+        with span('generate_pdf_certificates_parallel.render_pdf'):
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='certificate-pdf') as pool:
+                futures = {
+                    application_id: pool.submit(render_pdf, html_content)
+                    for application_id, html_content in html_contents.items()
+                }
+                for application_id, future in futures.items():
+                    try:
+                        results[application_id] = future.result()
+                    except Exception as e:
+                        logging.error(f"Failed to generate PDF for application {application_id}: {str(e)}")
+                        results[application_id] = None
+
+        root.set(failed=lambda: sum(1 for pdf in results.values() if pdf is None))
+        return results
@@ -0,0 +1,43 @@
+from application.models import ApplicationProduct, ApplicationSupplyChainPartner
+from .response_cache import bump_application_revisions
+
+
+def partner_lookup_key(name):
+    """Normalize a partner name for matching raw product partner names."""
+    return str(name or '').strip()
+
+
+def link_products_to_partners(applications):
+    """
+    Link staged products to their staged partners by raw partner name.
+
+    Used for data created without the partner FK (e.g. dummy data). Runs
+    one query for partners, one for unlinked products and a batched
+    ``bulk_update``.
+
+    Args:
+        applications: Iterable of Application instances or ids
+
+    Returns:
+        int: Number of products linked
+    """
+    partner_ids = {}
+    for partner_id, application_id, name in ApplicationSupplyChainPartner.objects.filter(
+        application__in=applications
+    ).order_by('-pk').values_list('pk', 'application_id', 'name'):
+        # Ordered by descending pk so the first partner with a name wins
+        partner_ids[(application_id, partner_lookup_key(name))] = partner_id
+
+    linked = []
+    for product in ApplicationProduct.objects.filter(
+        application__in=applications,
+        supply_chain_partner__isnull=True
+    ).only('pk', 'application_id', 'supply_chain_partner_name_raw'):
+        key = (product.application_id, partner_lookup_key(product.supply_chain_partner_name_raw))
+        if key in partner_ids:
+            product.supply_chain_partner_id = partner_ids[key]
+            linked.append(product)
+
+    ApplicationProduct.objects.bulk_update(linked, ['supply_chain_partner'], batch_size=500)
+    bump_application_revisions({product.application_id for product in linked})
+    return len(linked)
@@ -0,0 +1,434 @@
+import abc
+import logging
+import re
+import threading
+import unicodedata
+import zlib
+from html.parser import HTMLParser
+import pdfkit
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PDF_BACKEND = 'application.utils.pdf_backends.PdfkitBackend'
+
+
+class PdfBackend(abc.ABC):
+    """Converts rendered certificate HTML to PDF bytes."""
+
+    @abc.abstractmethod
+    def render(self, html_content):
+        """Return the PDF bytes of ``html_content``."""
+
+
+class PdfkitBackend(PdfBackend):
+    """
+    Render with wkhtmltopdf through pdfkit.
+
+    Full CSS support, but needs the wkhtmltopdf binary and starts one
+    process per certificate.
+    """
+
+    options = {
+        'page-size': 'Letter',
+        'margin-top': '1in',
+        'margin-right': '1in',
+        'margin-bottom': '1in',
+        'margin-left': '1in',
+        'encoding': "UTF-8",
+        'no-outline': None,
+        'enable-local-file-access': None,
+    }
+
+    def __init__(self):
+        self._configuration = None
+        self._lock = threading.Lock()
+
+    def get_configuration(self):
+        """
+        Resolve the wkhtmltopdf binary once per process.
+
+        Without an explicit configuration pdfkit runs ``which wkhtmltopdf``
+        in a subprocess before every render.
+        """
+        with self._lock:
+            if self._configuration is None:
+                self._configuration = pdfkit.configuration()
+            return self._configuration
+
+    def render(self, html_content):
+        return pdfkit.from_string(
+            html_content, False,
+            options=self.options,
+            configuration=self.get_configuration()
+        )
+
+
+class SimplePdfBackend(PdfBackend):
+    """
+    Render in-process with the standard library only.
+
+    Lays out the text of the certificate template - headings, items,
+    details and rejection reasons - in Helvetica with the template's
+    colours, wrapping lines and breaking pages on a Letter page with 1in
+    margins. Backgrounds and borders are not drawn apart from the rules
+    under the header and section titles.
+
+    Styles are keyed to the template's class names (``STYLES``); classes
+    rendered with the inherited style are listed in ``UNSTYLED_CLASSES``.
+    The standard fonts only cover Windows-1252: other characters fall back
+    to their base letter (``ź`` -> ``z``) or ``?``, and a warning is logged.
+    Use PdfkitBackend for non-Latin scripts.
+    """
+
+    page_width = 612
+    page_height = 792
+    margin = 72
+
+    def render(self, html_content):
+        unsupported = sorted({char for char in html_content if not _encodable(char)})
+        if unsupported:
+            logger.warning(
+                f"SimplePdfBackend cannot draw {''.join(unsupported)!r}; replaced by base letters or '?'"
+            )
+        parser = _CertificateHTMLParser()
+        parser.feed(html_content)
+        parser.close()
+        pages = _layout(parser.blocks, self.page_width, self.page_height, self.margin)
+        return _write_pdf(pages, self.page_width, self.page_height)
+
+
+_backend = None
+_backend_path = None
+_backend_lock = threading.Lock()
+
+
+def get_pdf_backend():
+    """Return the backend configured by ``CERTIFICATE_PDF_BACKEND``."""
+    global _backend, _backend_path
+    path = get_pdf_backend_path()
+    with _backend_lock:
+        if _backend is None or _backend_path != path:
+            _backend = import_string(path)()
+            _backend_path = path
+        return _backend
+
+
+def get_pdf_backend_path():
+    return getattr(settings, 'CERTIFICATE_PDF_BACKEND', DEFAULT_PDF_BACKEND)
+
+
+# Layout for SimplePdfBackend
+
+FONTS = {
+    'regular': ('F1', 'Helvetica'),
+    'bold': ('F2', 'Helvetica-Bold'),
+    'oblique': ('F3', 'Helvetica-Oblique'),
+}
+
+# Glyph widths (1/1000 em) for ASCII 32-126 from the standard Type 1 font metrics
+_HELVETICA_WIDTHS = [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]
+_HELVETICA_BOLD_WIDTHS = [
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+]
+_WIDTHS = {
+    'regular': _HELVETICA_WIDTHS,
+    'bold': _HELVETICA_BOLD_WIDTHS,
+    'oblique': _HELVETICA_WIDTHS,
+}
+
+BASE_STYLE = {'size': 10.5, 'font': 'regular', 'color': '#333333', 'align': 'left', 'indent': 0, 'space': 4, 'rule': None}
+
+# Certificate template classes and tags, in points
+STYLES = {
+    'timestamp': {'size': 9, 'color': '#999999', 'align': 'right'},
+    'header': {'align': 'center', 'rule': '#2e8b57'},
+    'certificate-title': {'size': 20, 'font': 'bold', 'color': '#2e8b57', 'space': 10},
+    'status-badge': {'size': 14, 'font': 'bold', 'space': 10},
+    'status-approved': {'color': '#4caf50'},
+    'status-rejected': {'color': '#f44336'},
+    'company-info': {'space': 12},
+    'section': {'space': 14},
+    'section-title': {'size': 15, 'font': 'bold', 'color': '#2e8b57', 'space': 16, 'rule': '#e9ecef'},
+    'approved-items': {'indent': 10},
+    'rejected-items': {'indent': 10},
+    'item': {'indent': 10, 'space': 8},
+    'item-name': {'font': 'bold'},
+    'item-details': {'size': 9.5, 'color': '#666666', 'space': 2},
+    'rejection-reason': {'size': 9.5, 'font': 'oblique', 'color': '#d32f2f'},
+    'no-items': {'font': 'oblique', 'color': '#999999', 'align': 'center', 'space': 10},
+    'footer': {'size': 9, 'color': '#666666', 'align': 'center', 'space': 24},
+    'h3': {'size': 13, 'font': 'bold', 'space': 8},
+    'h4': {'size': 12, 'font': 'bold', 'space': 8},
+}
+
+# Certificate template classes rendered with the style they inherit
+UNSTYLED_CLASSES = {'item-approved', 'item-rejected'}
+
+BLOCK_TAGS = {'div', 'p', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'li'}
+SKIPPED_TAGS = {'head', 'style', 'script', 'title'}
+
+
+class _Block:
+    def __init__(self, style):
+        self.style = style
+        self.runs = []
+
+
+class _CertificateHTMLParser(HTMLParser):
+    """Flatten certificate HTML into styled blocks of (font, text) runs."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.blocks = []
+        self._styles = [dict(BASE_STYLE)]
+        self._elements = []
+        self._bold = 0
+        self._skip = 0
+        self._current = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIPPED_TAGS:
+            self._skip += 1
+        elif tag == 'br':
+            self._flush()
+        elif tag in ('strong', 'b'):
+            self._bold += 1
+        elif tag in BLOCK_TAGS:
+            attrs = dict(attrs)
+            names = [tag] + (attrs.get('class') or '').split()
+            parent = self._styles[-1]
+            style = dict(parent, space=BASE_STYLE['space'], rule=None)
+            for name in names:
+                style.update(STYLES.get(name, {}))
+            style['indent'] = parent['indent'] + sum(STYLES.get(name, {}).get('indent', 0) for name in names)
+            style.update(_inline_style(attrs.get('style') or ''))
+            self._styles.append(style)
+            self._elements.append(tag)
+            self._current = _Block(style)
+            self.blocks.append(self._current)
+
+    def handle_endtag(self, tag):
+        if tag in SKIPPED_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag in ('strong', 'b'):
+            self._bold = max(self._bold - 1, 0)
+        elif tag in BLOCK_TAGS and tag in self._elements:
+            self._flush()
+            while self._elements:
+                element = self._elements.pop()
+                style = self._styles.pop()
+                if style['rule']:
+                    rule = _Block(dict(style, space=4))
+                    rule.runs = None
+                    self.blocks.append(rule)
+                if element == tag:
+                    break
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        text = re.sub(r'\s+', ' ', data)
+        if not text.strip() and not (self._current and self._current.runs):
+            return
+        if self._current is None:
+            self._current = _Block(dict(self._styles[-1], space=0))
+            self.blocks.append(self._current)
+        font = 'bold' if self._bold else self._styles[-1]['font']
+        self._current.runs.append((font, text))
+
+    def _flush(self):
+        self._current = None
+
+
+def _inline_style(value):
+    style = {}
+    color = re.search(r'(?<![-\w])color:\s*(#[0-9a-fA-F]{3,6})', value)
+    if color:
+        style['color'] = color.group(1)
+    size = re.search(r'font-size:\s*([\d.]+)px', value)
+    if size:
+        style['size'] = float(size.group(1)) * 0.75
+    return style
+
+
+def _encodable(char):
+    try:
+        char.encode('cp1252')
+        return True
+    except UnicodeEncodeError:
+        return False
+
+
+def _fallback(char):
+    """Base letter of an accented character (``ź`` -> ``z``), else ``?``."""
+    base = ''.join(part for part in unicodedata.normalize('NFKD', char) if not unicodedata.combining(part))
+    return base if base and base != char and all(_encodable(part) for part in base) else '?'
+
+
+def _encode(text):
+    return ''.join(char if _encodable(char) else _fallback(char) for char in text).encode('cp1252')
+
+
+def _text_width(font, text, size):
+    widths = _WIDTHS[font]
+    total = 0
+    for char in text:
+        code = ord(char)
+        total += widths[code - 32] if 32 <= code <= 126 else 556
+    return total * size / 1000
+
+
+def _wrap(runs, size, width):
+    """Greedy word wrap of (font, text) runs into lines of (font, text) runs."""
+    lines, line, line_width = [], [], 0
+    for font, text in runs:
+        for token in re.findall(r'\s*\S+\s*', _encode(text).decode('cp1252')):
+            if token[0].isspace() and line and not line[-1][1].endswith(' '):
+                # Keep the space between runs, e.g. after a bold label
+                line[-1] = (line[-1][0], line[-1][1] + ' ')
+                line_width += _text_width(line[-1][0], ' ', size)
+            word = token.strip() + (' ' if token[-1].isspace() else '')
+            word_width = _text_width(font, word.rstrip(), size)
+            if line and line_width + word_width > width:
+                lines.append(line)
+                line, line_width = [], 0
+            if line and line[-1][0] == font:
+                line[-1] = (font, line[-1][1] + word)
+            else:
+                line.append((font, word))
+            line_width += _text_width(font, word, size)
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _rgb(color):
+    color = color.lstrip('#')
+    if len(color) == 3:
+        color = ''.join(c * 2 for c in color)
+    return ' '.join(f"{int(color[i:i + 2], 16) / 255:.3f}" for i in (0, 2, 4))
+
+
+def _escape(data):
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def _layout(blocks, page_width, page_height, margin):
+    """Lay blocks out into pages of PDF content stream operators."""
+    pages = [[]]
+    top = page_height - margin
+    y = top
+    # Spacing of blocks without text of their own collapses into the next line
+    pending_space = 0
+
+    def new_page():
+        nonlocal y
+        pages.append([])
+        y = top
+
+    for block in blocks:
+        style = block.style
+        pending_space = max(pending_space, style['space'])
+        if block.runs is None:
+            y -= pending_space
+            pending_space = 0
+            if y < margin:
+                new_page()
+            pages[-1].append(
+                f"{_rgb(style['rule'])} RG 1 w {margin + style['indent']} {y:.2f} m "
+                f"{page_width - margin} {y:.2f} l S".encode()
+            )
+            continue
+
+        size = style['size']
+        leading = size * 1.4
+        left = margin + style['indent']
+        width = page_width - margin - left
+        lines = _wrap(block.runs, size, width)
+        if not lines:
+            continue
+
+        y -= pending_space
+        pending_space = 0
+        for line in lines:
+            if y - leading < margin:
+                new_page()
+            y -= leading
+            line_width = sum(_text_width(font, text, size) for font, text in line[:-1])
+            line_width += _text_width(line[-1][0], line[-1][1].rstrip(), size)
+            if style['align'] == 'center':
+                x = left + (width - line_width) / 2
+            elif style['align'] == 'right':
+                x = left + width - line_width
+            else:
+                x = left
+
+            operators = [f"BT {_rgb(style['color'])} rg 1 0 0 1 {x:.2f} {y:.2f} Tm".encode()]
+            for font, text in line:
+                operators.append(f"/{FONTS[font][0]} {size:g} Tf (".encode() + _escape(_encode(text)) + b") Tj")
+            operators.append(b"ET")
+            pages[-1].append(b" ".join(operators))
+    return pages
+
+
+def _write_pdf(pages, page_width, page_height):
+    """Serialize pages of content stream operators as a PDF document."""
+    objects = []
+
+    def add(body):
+        objects.append(body)
+        return len(objects)
+
+    catalog = add(None)
+    pages_id = add(None)
+    fonts = {
+        key: add(
+            f"<< /Type /Font /Subtype /Type1 /BaseFont /{base} /Encoding /WinAnsiEncoding >>".encode()
+        )
+        for key, (_, base) in FONTS.items()
+    }
+    font_resources = ' '.join(f"/{name} {fonts[key]} 0 R" for key, (name, _) in FONTS.items())
+
+    page_ids = []
+    for operators in pages:
+        content = zlib.compress(b"\n".join(operators))
+        stream = add(
+            f"<< /Length {len(content)} /Filter /FlateDecode >>\nstream\n".encode() + content + b"\nendstream"
+        )
+        page_ids.append(add(
+            f"<< /Type /Page /Parent {pages_id} 0 R /MediaBox [0 0 {page_width} {page_height}] "
+            f"/Resources << /Font << {font_resources} >> >> /Contents {stream} 0 R >>".encode()
+        ))
+
+    objects[catalog - 1] = f"<< /Type /Catalog /Pages {pages_id} 0 R >>".encode()
+    objects[pages_id - 1] = (
+        f"<< /Type /Pages /Kids [{' '.join(f'{page_id} 0 R' for page_id in page_ids)}] "
+        f"/Count {len(page_ids)} >>".encode()
+    )
+
+    output = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f"{number} 0 obj\n".encode() + body + b"\nendobj\n"
+
+    xref = len(output)
+    output += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    for offset in offsets:
+        output += f"{offset:010d} 00000 n \n".encode()
+    output += f"trailer\n<< /Size {len(objects) + 1} /Root {catalog} 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    return bytes(output)
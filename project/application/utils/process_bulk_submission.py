@@ -1,4 +1,5 @@
 from . import process_xlsx_application_form
+from .tracing import span
 import logging
 import time
 
@@ -17,37 +18,38 @@ def process_bulk_submission(bulk_submission):
     Returns:
         bool: True if all applications processed successfully, False otherwise
     """
-    try:
-        applications = bulk_submission.applications.all()
-        successful_processing = 0
-        failed_processing = 0
-        
-        for application in applications:
-            try:
-                if application.file:
-                    success = process_xlsx_application_form(application)
-                    if success:
-                        successful_processing += 1
+    with span('process_bulk_submission', bulk_submission_id=bulk_submission.id) as root:
+        try:
+            applications = bulk_submission.applications.all()
+            successful_processing = 0
+            failed_processing = 0
+            
+            for application in applications:
+                try:
+                    if application.file:
+                        success = process_xlsx_application_form(application)
+                        if success:
+                            successful_processing += 1
+                        else:
+                            failed_processing += 1
                     else:
-                        failed_processing += 1
-                else:
-                    failed_processing += 1  
-                    
-            except Exception as e:
-                logger.error(f"Failed to process application {application.name}: {str(e)}")
-                failed_processing += 1
+                        failed_processing += 1  
+                        
+                except Exception as e:
+                    logger.error(f"Failed to process application {application.name}: {str(e)}")
+                    failed_processing += 1
 
-            # Simulate this takes a some time
-            WAIT_SECONDS = 15
-            for second in range(WAIT_SECONDS):
-                logger.info(f"Waiting {WAIT_SECONDS-second} seconds before processing next application...")
-                time.sleep(1)
-        
-        return failed_processing == 0 and successful_processing > 0
-        
-    except Exception as e:
-        logger.error(f"Error processing bulk submission {bulk_submission.name}: {str(e)}")
-        return False
+                # Simulate this takes a some time
+                WAIT_SECONDS = 15
+                with span('process_bulk_submission.wait', seconds=WAIT_SECONDS):
+                    time.sleep(WAIT_SECONDS)
+            
+            root.set(successful=successful_processing, failed=failed_processing)
+            return failed_processing == 0 and successful_processing > 0
+            
+        except Exception as e:
+            logger.error(f"Error processing bulk submission {bulk_submission.name}: {str(e)}")
+            return False
     
 def process_bulk_submission_async(bulk_submission_id):
     """Process in background thread"""
@@ -4,8 +4,13 @@ from application.models import (
     Application,
     ApplicationCompanyInfo,
     ApplicationSupplyChainPartner,
-    ApplicationProduct
+    ApplicationProduct,
+    ApplicationProductMaterial
 )
+from .link_products_to_partners import partner_lookup_key
+from .response_cache import bump_application_revisions
+from .search_index import queue_search_update
+from .tracing import span, trace
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -27,53 +32,74 @@ def process_xlsx_application_form(application_form):
     """
     file_path = application_form.file.path
     
-    try:
-        logger.info(f"Starting processing of application form: {application_form.name}")
-        
-        # Load and validate Excel file structure
-        excel_file = pd.ExcelFile(file_path)
-        required_sheets = ['info', 'supply chain company', 'product']
-        missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_file.sheet_names]
-        
-        if missing_sheets:
-            error_msg = f"Missing required sheets: {missing_sheets}. Found sheets: {excel_file.sheet_names}"
-            logger.error(error_msg)
-            raise ValueError(error_msg)
-        
-        logger.info("All required sheets found, reading data from Excel file")
-        
-        # Read data from each sheet
-        company_df = pd.read_excel(file_path, sheet_name='info')
-        supply_chain_df = pd.read_excel(file_path, sheet_name='supply chain company')
-        products_df = pd.read_excel(file_path, sheet_name='product')
-        
-        # Retrieve the main application instance
-        application = Application.objects.get(name=application_form.name)
-        logger.info(f"Retrieved application: {application_form.name}")
-        
-        # Extract and process data from each sheet
-        company_data = _extract_company_info(company_df)
-        supply_chain_data = _extract_supply_chain_partners(supply_chain_df)
-        products_data = _extract_products(products_df)
-        
-        # Create database records
-        ApplicationCompanyInfo.objects.create(application=application, **company_data)
-        logger.info("Created company info record")
-        
-        for partner_data in supply_chain_data:
-            ApplicationSupplyChainPartner.objects.create(application=application, **partner_data)
-        logger.info(f"Created {len(supply_chain_data)} supply chain partner records")
-        
-        for product_data in products_data:
-            ApplicationProduct.objects.create(application=application, **product_data)
-        logger.info(f"Created {len(products_data)} product records")
-        
-        logger.info("Application form processing completed successfully")
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error processing application form {application_form.name}: {str(e)}")
-        raise e
+    with span('process_xlsx_application_form', application=application_form.name) as root:
+        try:
+            # Load and validate Excel file structure
+            with span('process_xlsx_application_form.read'):
+                excel_file = pd.ExcelFile(file_path)
+                required_sheets = ['info', 'supply chain company', 'product']
+                missing_sheets = [sheet for sheet in required_sheets if sheet not in excel_file.sheet_names]
+                
+                if missing_sheets:
+                    error_msg = f"Missing required sheets: {missing_sheets}. Found sheets: {excel_file.sheet_names}"
+                    logger.error(error_msg)
+                    raise ValueError(error_msg)
+                
+                # Read data from each sheet
+                company_df = pd.read_excel(file_path, sheet_name='info')
+                supply_chain_df = pd.read_excel(file_path, sheet_name='supply chain company')
+                products_df = pd.read_excel(file_path, sheet_name='product')
+            
+            # Retrieve the main application instance
+            application = Application.objects.get(name=application_form.name)
+            
+            # Extract and process data from each sheet
+            with span('process_xlsx_application_form.extract') as stage:
+                company_data = _extract_company_info(company_df)
+                supply_chain_data = _extract_supply_chain_partners(supply_chain_df)
+                products_data = _extract_products(products_df)
+                stage.set(partners=len(supply_chain_data), products=len(products_data))
+            
+            # Create database records
+            with span('process_xlsx_application_form.create'):
+                ApplicationCompanyInfo.objects.create(application=application, **company_data)
+                
+                partners = ApplicationSupplyChainPartner.objects.bulk_create([
+                    ApplicationSupplyChainPartner(application=application, **partner_data)
+                    for partner_data in supply_chain_data
+                ])
+                
+                # Link products to their partner by name; the first partner with a name wins
+                partners_by_name = {}
+                for partner in partners:
+                    partners_by_name.setdefault(partner_lookup_key(partner.name), partner)
+                
+                products = ApplicationProduct.objects.bulk_create([
+                    ApplicationProduct(
+                        application=application,
+                        supply_chain_partner=partners_by_name.get(
+                            partner_lookup_key(product_data['supply_chain_partner_name_raw'])
+                        ),
+                        **product_data
+                    )
+                    for product_data in products_data
+                ])
+                
+                ApplicationProductMaterial.objects.bulk_create([
+                    material
+                    for product in products
+                    for material in ApplicationProductMaterial.build_for(product)
+                ])
+                # bulk_create sends no signals; index the complete application
+                queue_search_update(application.id)
+                bump_application_revisions([application.id])
+            
+            root.set(result='processed')
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error processing application form {application_form.name}: {str(e)}")
+            raise e
 
 
 def _extract_company_info(company_df):
@@ -99,7 +125,7 @@ def _extract_company_info(company_df):
             'zip_code': _get_cell_value(company_df, 6, 2)
         }
         
-        logger.info(f"Extracted company info for: {company_data['name']}")
+        trace(logging.DEBUG, "Extracted company info for: %s", company_data['name'], logger=logger)
         return company_data
         
     except Exception as e:
@@ -172,7 +198,6 @@ def _extract_supply_chain_partners(supply_chain_df):
     df = df[df.astype(str).apply(lambda x: x.str.strip()).any(axis=1)]
     
     partners_data = df.to_dict('records')
-    logger.info(f"Extracted {len(partners_data)} supply chain partners")
     
     return partners_data
 
@@ -216,6 +241,4 @@ def _extract_products(product_df):
     products_group.rename(columns=product_column_mapping, inplace=True)
     products_data = products_group.to_dict('records')
     
-    logger.info(f"Extracted {len(products_data)} products")
-    
     return products_data
\ No newline at end of file
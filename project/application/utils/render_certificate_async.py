@@ -0,0 +1,94 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+from application.models import Application, ApplicationCertificate
+from .certificate_store import RENDER_TIMEOUT, certificate_content_key, render_certificate
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor():
+    """Shared worker pool, sized by ``CERTIFICATE_RENDER_WORKERS``."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=getattr(settings, 'CERTIFICATE_RENDER_WORKERS', 2),
+                thread_name_prefix='certificate-render'
+            )
+        return _executor
+
+
+def render_certificate_async(application_id):
+    """
+    Pre-render an application's certificate in a background thread.
+
+    Queued once the current transaction commits, so workers always see the
+    final review state. Renders run on a small shared pool so bulk
+    completion cannot start one thread per application.
+    """
+    transaction.on_commit(lambda: _get_executor().submit(_render, application_id))
+
+
+def request_certificate(application):
+    """
+    Return the certificate row for an application's current review state.
+
+    Never renders in the calling thread: if no rendered file exists yet, a
+    pending row is created (or a failed/lost one reset) and rendering is
+    queued. Callers check ``status`` and ``progress`` on the result.
+
+    Returns:
+        ApplicationCertificate: Ready, pending, rendering or failed row
+    """
+    content_key = certificate_content_key(application)
+    certificate, created = ApplicationCertificate.objects.get_or_create(
+        content_key=content_key,
+        defaults={'application': application}
+    )
+
+    if created or _needs_render(certificate):
+        if certificate.status == ApplicationCertificate.Status.FAILED:
+            ApplicationCertificate.objects.filter(
+                pk=certificate.pk, status=ApplicationCertificate.Status.FAILED
+            ).update(status=ApplicationCertificate.Status.PENDING, progress=0, updated_at=timezone.now())
+            certificate.status = ApplicationCertificate.Status.PENDING
+            certificate.progress = 0
+        render_certificate_async(application.id)
+
+    return certificate
+
+
+def _needs_render(certificate):
+    if certificate.status == ApplicationCertificate.Status.FAILED:
+        return True
+    if certificate.status == ApplicationCertificate.Status.READY:
+        return False
+    # Pending or rendering rows are already queued unless their worker was lost
+    return certificate.updated_at < timezone.now() - RENDER_TIMEOUT
+
+
+def _render(application_id):
+    try:
+        with span('render_certificate_async', application_id=application_id) as root:
+            application = Application.objects.select_related('company_info').prefetch_related(
+                'supply_chain_partners', 'products'
+            ).get(pk=application_id)
+            if application.status not in (Application.Status.COMPLETED, Application.Status.REJECTED):
+                root.set(skipped='status')
+                return
+
+            certificate = render_certificate(application, certificate_content_key(application))
+            root.set(status=lambda: certificate.status if certificate else 'claimed elsewhere')
+
+    except Exception as e:
+        logger.error(f"Error rendering certificate for application {application_id}: {str(e)}")
+    finally:
+        close_old_connections()
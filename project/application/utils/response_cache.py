@@ -0,0 +1,54 @@
+import hashlib
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils.http import quote_etag
+from application.models import Application
+
+CACHE_PREFIX = 'application_response:'
+
+
+def bump_application_revisions(application_ids):
+    """
+    Mark applications as changed with one UPDATE.
+
+    Used after writes that send no signals (``bulk_create``, ``update``).
+    Accepts ids or a subquery of ids.
+    """
+    Application.objects.filter(pk__in=application_ids).update(revision=F('revision') + 1)
+
+
+def response_variant(*parts):
+    """Short digest of everything besides the revision that shapes a response (fieldset, host, ...)."""
+    return hashlib.sha256(repr(parts).encode()).hexdigest()[:16]
+
+
+def application_etag(application_id, revision, variant):
+    """Strong ETag of an application response."""
+    return quote_etag(f"{application_id}-{revision}-{variant}")
+
+
+def get_cached_application_payload(application_id, revision, variant, build):
+    """
+    Return the serialized payload of an application, through the cache.
+
+    Payloads are keyed by (id, revision, variant). A change to the
+    application bumps its revision, so entries are never invalidated; old
+    ones simply stop being read and expire after
+    ``APPLICATION_RESPONSE_CACHE_TIMEOUT`` seconds.
+
+    Args:
+        application_id: Application id
+        revision: Revision of the application the payload is for
+        variant: Digest of the request parameters shaping the payload
+        build: Callable returning the payload on a miss
+
+    Returns:
+        dict: Serialized application
+    """
+    key = f"{CACHE_PREFIX}{application_id}:{revision}:{variant}"
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, getattr(settings, 'APPLICATION_RESPONSE_CACHE_TIMEOUT', 3600))
+    return payload
@@ -0,0 +1,89 @@
+import logging
+from django.db import transaction
+from django.utils import timezone
+from application.models import Application
+from .complete_application import complete_application
+from .render_certificate_async import render_certificate_async
+from .tracing import span
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewResult:
+    """Results of a review workflow step."""
+    SUBMITTED = 'submitted'
+    COMPLETED = 'completed'
+    REJECTED = 'rejected'
+    INVALID = 'invalid'
+    CONFLICT = 'conflict'
+    FAILED = 'failed'
+
+
+def submit_application(application):
+    """
+    Move a pending application to review.
+
+    Returns:
+        str: ReviewResult.SUBMITTED, INVALID if it is not pending, or
+             CONFLICT if another request changed it first
+    """
+    if application.status != Application.Status.PENDING:
+        return ReviewResult.INVALID
+
+    submitted = application.transition(
+        Application.Status.PENDING,
+        Application.Status.IN_REVIEW,
+        submission_date=timezone.now()
+    )
+    return ReviewResult.SUBMITTED if submitted else ReviewResult.CONFLICT
+
+
+def finalize_application(application):
+    """
+    Complete or reject an in-review application based on component approvals.
+    Either way its certificate is pre-rendered in the background.
+
+    The status transition is claimed with a conditional UPDATE before any
+    permanent records are created, in the same transaction, so a second
+    reviewer or a retry is rejected instead of duplicating companies and
+    products.
+
+    Returns:
+        str: ReviewResult.COMPLETED, REJECTED, INVALID, CONFLICT or FAILED
+    """
+    if application.status != Application.Status.IN_REVIEW:
+        return ReviewResult.INVALID
+
+    company_info = getattr(application, 'company_info', None)
+    all_approved = (
+        company_info is not None and company_info.is_approved and
+        not application.supply_chain_partners.filter(is_approved=False).exists() and
+        not application.products.filter(is_approved=False).exists()
+    )
+
+    with span('finalize_application', application_id=application.id, all_approved=all_approved) as root:
+        if not all_approved:
+            rejected = application.transition(Application.Status.IN_REVIEW, Application.Status.REJECTED)
+            result = ReviewResult.REJECTED if rejected else ReviewResult.CONFLICT
+            if rejected:
+                render_certificate_async(application.id)
+            root.set(result=result)
+            return result
+
+        version = application.version
+        with transaction.atomic():
+            if not application.transition(Application.Status.IN_REVIEW, Application.Status.COMPLETED):
+                root.set(result=ReviewResult.CONFLICT)
+                return ReviewResult.CONFLICT
+
+            if not complete_application(application):
+                # Undo the claimed transition together with any partial records
+                transaction.set_rollback(True)
+                application.status = Application.Status.IN_REVIEW
+                application.version = version
+                root.set(result=ReviewResult.FAILED)
+                return ReviewResult.FAILED
+
+        render_certificate_async(application.id)
+        root.set(result=ReviewResult.COMPLETED)
+        return ReviewResult.COMPLETED
@@ -0,0 +1,28 @@
+from application.models import Application
+from .response_cache import bump_application_revisions
+
+
+def bulk_review_components(queryset, approve, rejection_reason=None):
+    """
+    Approve or reject staged partners or products in a single UPDATE.
+
+    Only rows of applications that are in review are changed. Approving
+    clears the rejection reason; rejecting sets the shared reason on every
+    row in the same statement.
+
+    Args:
+        queryset: ApplicationSupplyChainPartner or ApplicationProduct queryset
+        approve: True to approve, False to reject
+        rejection_reason: Reason stored on rejected rows
+
+    Returns:
+        int: Number of rows updated
+    """
+    queryset = queryset.filter(application__status=Application.Status.IN_REVIEW)
+    updated = queryset.update(
+        is_approved=approve,
+        rejection_reason=None if approve else rejection_reason
+    )
+    if updated:
+        bump_application_revisions(queryset.values('application_id'))
+    return updated
@@ -0,0 +1,244 @@
+import logging
+import threading
+from django.conf import settings
+from django.db import DatabaseError, connection, transaction
+from django.db.models import Aggregate, Exists, F, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Concat
+from django.utils.module_loading import import_string
+from application.models import Application
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEARCH_BACKEND = 'application.utils.search_index.Fts5SearchBackend'
+SEARCH_TABLE = 'application_search'
+UPDATE_CHUNK_SIZE = 500
+
+_backend = None
+_backend_path = None
+_backend_lock = threading.Lock()
+_pending = threading.local()
+
+# Indexed fields per FTS column, as lookups from Application. Both backends
+# search exactly these fields.
+SEARCH_COLUMNS = {
+    'name': ('name',),
+    'description': ('description',),
+    'company': (
+        'company_info__name',
+        'company_info__city',
+        'company_info__state',
+        'company_info__country',
+    ),
+    'partners': ('supply_chain_partners__name',),
+    'products': ('products__product_name', 'products__product_category'),
+    'materials': ('products__materials__name', 'products__materials__code'),
+}
+
+
+class GroupConcat(Aggregate):
+    """SQLite ``group_concat`` of a text expression, space separated."""
+    function = 'group_concat'
+    output_field = TextField()
+
+    def __init__(self, expression, **extra):
+        super().__init__(expression, Value(' '), **extra)
+
+
+class SearchBackend:
+    """
+    Full-text index over applications and their staged data.
+
+    Indexed per application: name and description, company info, partner
+    names, product names and categories, and raw material names and codes.
+    """
+
+    def is_available(self):
+        return True
+
+    def update(self, application_ids):
+        """Re-index (or drop, if deleted) the given applications."""
+
+    def rebuild(self):
+        """Re-index every application."""
+
+    def filter(self, queryset, query):
+        """Limit ``queryset`` to applications matching every term of ``query``."""
+        raise NotImplementedError
+
+
+class IcontainsSearchBackend(SearchBackend):
+    """
+    Index-free fallback for databases without a full-text backend.
+
+    Every term must be contained in one of the indexed fields. Related
+    rows are matched with EXISTS subqueries, so applications are never
+    duplicated.
+    """
+
+    def filter(self, queryset, query):
+        for term in query.split():
+            condition = Q()
+            for lookups in SEARCH_COLUMNS.values():
+                matches = Q()
+                for lookup in lookups:
+                    matches |= Q(**{f'{lookup}__icontains': term})
+                if any('__' in lookup for lookup in lookups):
+                    matches = Q(Exists(Application.objects.filter(matches, pk=OuterRef('pk'))))
+                condition |= matches
+            queryset = queryset.filter(condition)
+        return queryset
+
+
+class Fts5SearchBackend(SearchBackend):
+    """
+    SQLite FTS5 index, one row per application (rowid = application id).
+
+    A document is built from SEARCH_COLUMNS in SQL with one
+    ``INSERT ... SELECT`` per chunk of applications, so updating the index
+    never loads rows into Python.
+    Terms are prefix-matched and combined with AND.
+    """
+
+    @staticmethod
+    def document_queryset():
+        """Return ``(id, *SEARCH_COLUMNS)`` rows, one per application, built by the database."""
+        columns = {}
+        for column, lookups in SEARCH_COLUMNS.items():
+            if any('__' in lookup for lookup in lookups):
+                parts = []
+                for lookup in lookups:
+                    parts += [F(lookup), Value(' ')]
+                text = Concat(*parts[:-1], output_field=TextField()) if len(lookups) > 1 else F(lookups[0])
+                columns[f'search_{column}'] = Subquery(
+                    Application.objects.filter(pk=OuterRef('pk'))
+                    .order_by()
+                    .values('pk')
+                    .annotate(text=GroupConcat(text))
+                    .values('text')
+                )
+            else:
+                columns[f'search_{column}'] = F(lookups[0])
+        return Application.objects.order_by().annotate(**columns).values_list('pk', *columns)
+
+    def _insert_documents(self, cursor, queryset):
+        sql, params = queryset.query.sql_with_params()
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, {', '.join(SEARCH_COLUMNS)}) {sql}", params
+        )
+
+    def __init__(self):
+        self._available = None
+
+    def is_available(self):
+        if connection.vendor != 'sqlite':
+            return False
+        if self._available is None:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [SEARCH_TABLE]
+                )
+                self._available = cursor.fetchone() is not None
+        return self._available
+
+    def update(self, application_ids):
+        application_ids = sorted(set(application_ids))
+        with connection.cursor() as cursor:
+            for start in range(0, len(application_ids), UPDATE_CHUNK_SIZE):
+                chunk = application_ids[start:start + UPDATE_CHUNK_SIZE]
+                placeholders = ', '.join(['%s'] * len(chunk))
+                cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid IN ({placeholders})", chunk)
+                self._insert_documents(cursor, self.document_queryset().filter(pk__in=chunk))
+
+    def rebuild(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+            self._insert_documents(cursor, self.document_queryset())
+
+    def filter(self, queryset, query):
+        match = self.match_expression(query)
+        if not match:
+            return queryset
+        return queryset.filter(pk__in=RawSQL(
+            f"SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s", (match,)
+        ))
+
+    @staticmethod
+    def match_expression(query):
+        """Quote each term as an FTS5 prefix phrase so user input is never parsed as syntax."""
+        return ' AND '.join('"' + term.replace('"', '""') + '"*' for term in query.split())
+
+
+def get_search_backend():
+    """
+    Return the backend configured by ``APPLICATION_SEARCH_BACKEND``.
+
+    Falls back to IcontainsSearchBackend when the configured backend is
+    not available (e.g. FTS5 on a database other than SQLite).
+    """
+    global _backend, _backend_path
+    path = getattr(settings, 'APPLICATION_SEARCH_BACKEND', DEFAULT_SEARCH_BACKEND)
+    with _backend_lock:
+        if _backend is None or _backend_path != path:
+            _backend = import_string(path)()
+            _backend_path = path
+        backend = _backend
+    return backend if backend.is_available() else IcontainsSearchBackend()
+
+
+def search_applications(queryset, query):
+    """
+    Filter applications by a search query.
+
+    Matches application name and description, company info, partner names,
+    product names and categories, and raw materials.
+
+    Args:
+        queryset: Application queryset to filter
+        query: Search terms; all of them must match
+
+    Returns:
+        QuerySet: Matching applications
+    """
+    if not query or not query.strip():
+        return queryset
+    return get_search_backend().filter(queryset, query)
+
+
+def update_search_index(application_ids):
+    """Re-index the given applications now; deleted ones are dropped from the index."""
+    application_ids = list(application_ids)
+    if not application_ids:
+        return
+    try:
+        get_search_backend().update(application_ids)
+    except DatabaseError as e:
+        # A stale index only affects search results; never fail the write
+        logger.error(f"Failed to update search index for applications {application_ids}: {str(e)}")
+
+
+def rebuild_search_index():
+    """Re-index every application."""
+    get_search_backend().rebuild()
+
+
+def queue_search_update(application_id):
+    """
+    Re-index an application once the current transaction commits.
+
+    Applications queued in the same transaction are indexed together, once
+    each, after the last write. Outside a transaction the update runs
+    immediately.
+    """
+    ids = getattr(_pending, 'ids', None)
+    if ids is None:
+        ids = _pending.ids = set()
+    ids.add(application_id)
+    transaction.on_commit(_flush_search_updates)
+
+
+def _flush_search_updates():
+    ids = getattr(_pending, 'ids', None)
+    if ids:
+        _pending.ids = set()
+        update_search_index(ids)
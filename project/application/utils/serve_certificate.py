@@ -0,0 +1,120 @@
+import re
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe, quote_etag
+
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+STREAM_BLOCK_SIZE = 64 * 1024
+
+
+class _UnsatisfiableRange(Exception):
+    pass
+
+
+def serve_certificate(request, certificate, filename):
+    """
+    Serve a stored certificate with validators and byte-range support.
+
+    The content key is the strong ETag and the time the file was written
+    is Last-Modified, so a matching If-None-Match or If-Modified-Since gets
+    a 304 without touching the file. A single ``Range: bytes=...`` is
+    answered with 206 (or 416 if it is outside the file), unless an
+    If-Range validator no longer matches. The PDF is always streamed from
+    its file handle rather than read into memory.
+
+    Args:
+        request: The download request
+        certificate: A ready ApplicationCertificate
+        filename: Download file name for Content-Disposition
+
+    Returns:
+        HttpResponse: 200, 206, 304, 412 or 416 response
+    """
+    etag = quote_etag(certificate.content_key)
+    last_modified = int(certificate.updated_at.timestamp())
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        size = certificate.file.size
+        try:
+            byte_range = _requested_range(request, etag, last_modified, size)
+        except _UnsatisfiableRange:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f"bytes */{size}"
+        else:
+            if byte_range is None:
+                response = FileResponse(
+                    certificate.file.open('rb'),
+                    as_attachment=True,
+                    filename=filename,
+                    content_type='application/pdf'
+                )
+            else:
+                start, end = byte_range
+                response = StreamingHttpResponse(
+                    _read_range(certificate.file.open('rb'), start, end),
+                    status=206,
+                    content_type='application/pdf'
+                )
+                response['Content-Length'] = str(end - start + 1)
+                response['Content-Range'] = f"bytes {start}-{end}/{size}"
+                response['Content-Disposition'] = content_disposition_header(True, filename)
+
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    response['Accept-Ranges'] = 'bytes'
+    # Certificates are only downloaded by signed-in users; let browsers
+    # keep them but always revalidate
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _requested_range(request, etag, last_modified, size):
+    """
+    Parse a single byte range from the request.
+
+    Returns (start, end) inclusive, or None to serve the whole file (no
+    Range, multiple ranges, malformed header or stale If-Range).
+    """
+    header = request.headers.get('Range')
+    if not header or request.method not in ('GET', 'HEAD'):
+        return None
+
+    if_range = request.headers.get('If-Range')
+    if if_range and if_range != etag and parse_http_date_safe(if_range) != last_modified:
+        return None
+
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise _UnsatisfiableRange()
+        return max(size - length, 0), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        raise _UnsatisfiableRange()
+    return start, end
+
+
+def _read_range(file, start, end):
+    """Yield bytes start..end (inclusive) of an open file, then close it."""
+    try:
+        file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            block = file.read(min(STREAM_BLOCK_SIZE, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            yield block
+    finally:
+        file.close()
@@ -0,0 +1,171 @@
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from django.conf import settings
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+_local = threading.local()
+
+
+class Span:
+    """
+    A timed stage of work with its query count and attributes.
+
+    Attribute values may be callables; they are only evaluated when the
+    span is actually recorded (exported or logged at DEBUG level).
+    """
+
+    def __init__(self, name, trace_id, parent_id, attributes):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.attributes = attributes
+        self.query_count = 0
+        self.status = 'ok'
+        self.error = None
+        self.started_at = time.time()
+        self.duration_ms = None
+        self._start = time.perf_counter()
+
+    def set(self, **attributes):
+        """Add attributes to the span; callables are evaluated lazily."""
+        self.attributes.update(attributes)
+
+    def finish(self):
+        self.duration_ms = round((time.perf_counter() - self._start) * 1000, 3)
+
+    def to_dict(self):
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'name': self.name,
+            'started_at': self.started_at,
+            'duration_ms': self.duration_ms,
+            'query_count': self.query_count,
+            'status': self.status,
+            'error': self.error,
+            'attributes': {
+                key: value() if callable(value) else value
+                for key, value in self.attributes.items()
+            },
+        }
+
+
+class JsonlSpanExporter:
+    """Append finished spans to a local JSONL file, one span per line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, span_data):
+        line = json.dumps(span_data, default=str)
+        with self._lock:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+
+
+_exporter = None
+_exporter_path = None
+
+
+def get_exporter():
+    """Return the exporter configured by ``APPLICATION_TRACE_FILE``, if any."""
+    global _exporter, _exporter_path
+    path = getattr(settings, 'APPLICATION_TRACE_FILE', None)
+    if not path:
+        return None
+    if _exporter is None or _exporter_path != path:
+        _exporter = JsonlSpanExporter(path)
+        _exporter_path = path
+    return _exporter
+
+
+def _stack():
+    if not hasattr(_local, 'stack'):
+        _local.stack = []
+    return _local.stack
+
+
+@contextmanager
+def span(name, **attributes):
+    """
+    Trace a stage of work.
+
+    Records the duration and number of SQL queries run inside the block.
+    When no exporter is configured and DEBUG logging is off the span is
+    a no-op apart from timing, so it is safe to use in hot paths.
+
+    Usage:
+        with span('complete_application.products', application_id=app.id) as s:
+            ...
+            s.set(created=lambda: len(products))
+    """
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    current = Span(
+        name,
+        trace_id=parent.trace_id if parent else uuid.uuid4().hex,
+        parent_id=parent.span_id if parent else None,
+        attributes=attributes,
+    )
+    exporter = get_exporter()
+    recording = exporter is not None or logger.isEnabledFor(logging.DEBUG)
+
+    def count_queries(execute, sql, params, many, context):
+        current.query_count += 1
+        return execute(sql, params, many, context)
+
+    stack.append(current)
+    try:
+        if recording:
+            with connection.execute_wrapper(count_queries):
+                yield current
+        else:
+            yield current
+    except Exception as e:
+        current.status = 'error'
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        stack.pop()
+        current.finish()
+        if recording:
+            _record(current, exporter)
+
+
+def _record(current, exporter):
+    try:
+        span_data = current.to_dict()
+    except Exception as e:
+        logger.warning("Failed to evaluate attributes for span %s: %s", current.name, e)
+        return
+
+    trace(logging.DEBUG, "span %s %.1fms queries=%s status=%s %s",
+          current.name, current.duration_ms, current.query_count, current.status,
+          lambda: span_data['attributes'])
+    if exporter is not None:
+        try:
+            exporter.export(span_data)
+        except OSError as e:
+            logger.warning("Failed to export span %s: %s", current.name, e)
+
+
+def trace(level, message, *args, logger=logger):
+    """
+    Log a message only if ``level`` is enabled for ``logger``.
+
+    Callable arguments are evaluated only when the message is emitted,
+    so expensive values (e.g. ``queryset.count``) cost nothing when the
+    level is disabled.
+    """
+    if not logger.isEnabledFor(level):
+        return
+    logger.log(level, message, *(arg() if callable(arg) else arg for arg in args))
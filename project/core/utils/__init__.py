@@ -2,6 +2,16 @@
 from .roles_utils import setup_roles, setup_customer_service_role, setup_reviewer_role
 from .users_utils import setup_users, setup_admin_user, setup_customer_service_user, setup_reviewer_user
 from .dummy_data_utils import create_dummy_data
+from .user_roles_utils import get_user_roles, is_customer, is_customer_service, is_reviewer
+from .admin_utils import (
+    PaginatedInlineFormSet,
+    PaginatedInlineMixin,
+    inline_page_data,
+    EstimatedCountPaginator,
+    KeysetChangeList,
+    LargeTableAdminMixin,
+    estimate_table_rows
+)
 
 __all__ = [
     'setup_roles',
@@ -11,5 +21,16 @@ __all__ = [
     'setup_admin_user',
     'setup_customer_service_user',
     'setup_reviewer_user',
-    'create_dummy_data'
+    'create_dummy_data',
+    'get_user_roles',
+    'is_customer',
+    'is_customer_service',
+    'is_reviewer',
+    'PaginatedInlineFormSet',
+    'PaginatedInlineMixin',
+    'inline_page_data',
+    'EstimatedCountPaginator',
+    'KeysetChangeList',
+    'LargeTableAdminMixin',
+    'estimate_table_rows'
 ]
\ No newline at end of file
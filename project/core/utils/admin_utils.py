@@ -0,0 +1,398 @@
+import base64
+import datetime
+import decimal
+import hashlib
+import json
+import uuid
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import PAGE_VAR, ChangeList
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import F, Q, QuerySet
+from django.db.models.expressions import OrderBy
+from django.forms import HiddenInput, ModelChoiceField
+from django.forms.models import BaseInlineFormSet, _get_foreign_key
+from django.http import QueryDict
+from django.urls import reverse
+from django.utils.functional import cached_property
+
+INLINE_PER_PAGE = 25
+
+# Changelists with more rows than this show an estimated or cached count
+COUNT_THRESHOLD = 10000
+COUNT_CACHE_TIMEOUT = 300
+CURSOR_VAR = 'cursor'
+
+
+class PaginatedInlineFormSet(BaseInlineFormSet):
+    """
+    Inline formset that only builds forms for one page of related rows.
+
+    The page is taken from the ``<prefix>-page`` query parameter. A bound
+    formset is limited to the rows that were posted instead, so a row
+    added or deleted by someone else between rendering and saving does not
+    shift the page under the submitted forms. Unchanged forms are not
+    saved (ModelFormSet only saves changed forms).
+
+    Choices of model choice fields (e.g. a partner select) are loaded once
+    per formset instead of once per form.
+    """
+    per_page = INLINE_PER_PAGE
+    page_number = 1
+    query_params = None
+    data_url = None
+
+    def get_queryset(self):
+        if not hasattr(self, '_page_queryset'):
+            queryset = super().get_queryset()
+            if self.is_bound:
+                self._page = None
+                self._page_queryset = queryset.filter(pk__in=self._posted_pks())
+            else:
+                self._page = Paginator(queryset, self.per_page).get_page(self.page_number)
+                self._page_queryset = self._page.object_list
+        return self._page_queryset
+
+    def _posted_pks(self):
+        pk_name = self.model._meta.pk.name
+        pks = []
+        for i in range(self.initial_form_count()):
+            pk = self.data.get(self.add_prefix(i) + '-' + pk_name)
+            if pk:
+                pks.append(pk)
+        return pks
+
+    @property
+    def page(self):
+        """The rendered Page, or None for a bound formset."""
+        self.get_queryset()
+        return self._page
+
+    def page_links(self):
+        """(label, query string) pairs for the first/previous/next/last pages."""
+        page = self.page
+        if page is None or not page.has_other_pages():
+            return []
+
+        links = []
+        if page.has_previous():
+            links.append(('« First', self._page_query(1)))
+            links.append(('‹ Previous', self._page_query(page.previous_page_number())))
+        if page.has_next():
+            links.append(('Next ›', self._page_query(page.next_page_number())))
+            links.append(('Last »', self._page_query(page.paginator.num_pages)))
+        return links
+
+    def _page_query(self, number):
+        params = self.query_params.copy() if self.query_params is not None else QueryDict(mutable=True)
+        params[self.prefix + '-page'] = number
+        return '?' + params.urlencode()
+
+    def _construct_form(self, i, **kwargs):
+        form = super()._construct_form(i, **kwargs)
+        # Every row belongs to the parent; share it instead of loading it per row (e.g. in __str__)
+        if self.instance.pk is not None:
+            self.fk.set_cached_value(form.instance, self.instance)
+        return form
+
+    def add_fields(self, form, index):
+        super().add_fields(form, index)
+        if not hasattr(self, '_shared_choices'):
+            self._shared_choices = {}
+        for name, field in form.fields.items():
+            if isinstance(field, ModelChoiceField) and not isinstance(field.widget, HiddenInput):
+                if name not in self._shared_choices:
+                    self._shared_choices[name] = list(field.choices)
+                field.choices = self._shared_choices[name]
+
+
+class PaginatedInlineMixin:
+    """
+    Render an inline one page at a time.
+
+    The change form only builds ``per_page`` forms, so its size no longer
+    grows with the number of related rows. Other pages are reached with
+    the pagination links. When ``data_url_name`` is set, the remaining rows
+    are listed lazily from that JSON endpoint (see ``inline_page_data``),
+    showing ``overview_fields``.
+    """
+    formset = PaginatedInlineFormSet
+    template = 'admin/edit_inline/paginated_stacked.html'
+    per_page = INLINE_PER_PAGE
+    overview_fields = ()
+    data_url_name = None
+
+    def get_formset(self, request, obj=None, **kwargs):
+        formset = super().get_formset(request, obj, **kwargs)
+        prefix = formset.get_default_prefix()
+        formset.per_page = self.per_page
+        formset.page_number = request.GET.get(prefix + '-page', 1)
+        formset.query_params = request.GET
+        if obj is not None and self.data_url_name and self.overview_fields:
+            formset.data_url = reverse(self.data_url_name, args=[obj.pk, prefix])
+        return formset
+
+    def get_page_queryset(self, request, obj):
+        """Related rows of ``obj`` listed by the JSON endpoint."""
+        fk = _get_foreign_key(self.parent_model, self.model, fk_name=self.fk_name)
+        return self.get_queryset(request).filter(**{fk.name: obj}).order_by('pk')
+
+
+def inline_page_data(inline, request, obj, page_number):
+    """
+    One page of an inline's rows as JSON-serialisable data.
+
+    Only the ``overview_fields`` of the rows on the page are loaded.
+
+    Returns:
+        dict: ``page``, ``num_pages``, ``count``, ``columns`` and ``results``
+    """
+    queryset = inline.get_page_queryset(request, obj).values('pk', *inline.overview_fields)
+    page = Paginator(queryset, inline.per_page).get_page(page_number)
+    return {
+        'page': page.number,
+        'num_pages': page.paginator.num_pages,
+        'count': page.paginator.count,
+        'columns': [
+            str(inline.opts.get_field(field).verbose_name).capitalize() for field in inline.overview_fields
+        ],
+        'results': list(page.object_list),
+    }
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that never runs an unbounded COUNT(*) on large tables.
+
+    The count is first taken over at most ``threshold + 1`` rows. Below the
+    threshold it is exact. Above it, an unfiltered changelist uses the
+    database's row estimate for the table; a filtered one is counted once
+    and the result cached for ``cache_timeout`` seconds. ``estimated`` tells
+    whether the count shown is approximate.
+    """
+
+    def __init__(self, *args, threshold=COUNT_THRESHOLD, cache_timeout=COUNT_CACHE_TIMEOUT, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threshold = threshold
+        self.cache_timeout = cache_timeout
+        self.estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+
+        queryset = queryset.order_by()
+        count = queryset[:self.threshold + 1].count()
+        if count <= self.threshold:
+            return count
+
+        sql, params = queryset.query.sql_with_params()
+        key = 'changelist_count:' + hashlib.sha256(
+            repr((queryset.db, sql, params)).encode()
+        ).hexdigest()
+        cached = cache.get(key)
+        if cached is None:
+            estimate = None if queryset.query.where else estimate_table_rows(queryset.model, queryset.db)
+            cached = (estimate, True) if estimate else (queryset.count(), False)
+            cache.set(key, cached, self.cache_timeout)
+
+        count, self.estimated = cached
+        # An estimate is never allowed to claim fewer rows than were just counted
+        return max(count, self.threshold + 1)
+
+
+def estimate_table_rows(model, using='default'):
+    """
+    The database's estimate of a table's row count, without scanning it.
+
+    Uses pg_class on PostgreSQL, information_schema on MySQL and
+    sqlite_stat1 (filled by ANALYZE) on SQLite.
+
+    Returns:
+        int: Estimated number of rows, or None if no estimate is available
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+    queries = {
+        'postgresql': ("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", [table]),
+        'mysql': (
+            "SELECT table_rows FROM information_schema.tables "
+            "WHERE table_schema = DATABASE() AND table_name = %s", [table]
+        ),
+        'sqlite': ("SELECT stat FROM sqlite_stat1 WHERE tbl = %s LIMIT 1", [table]),
+    }
+    if connection.vendor not in queries:
+        return None
+
+    sql, params = queries[connection.vendor]
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+    if row is None or row[0] is None:
+        return None
+    # sqlite_stat1.stat starts with the row count ("<rows> <rows per key> ...")
+    rows = int(str(row[0]).split()[0])
+    return rows if rows > 0 else None
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Changelist that pages through large result sets with a keyset cursor.
+
+    Above the paginator's threshold the changelist links to the next page
+    with ``?cursor=``, the ordering values of the last row shown. The next
+    page is then selected with a WHERE on those values instead of an
+    OFFSET, so deep pages cost the same as the first one. Only orderings on
+    the model's own fields can be used as a keyset; other orderings (e.g.
+    on related fields or annotations) keep the normal numbered pages.
+
+    Nullable ordering fields are sorted with NULLs first ascending and
+    last descending on every database, so the keyset is well defined.
+    """
+
+    def get_filters_params(self, params=None):
+        lookup_params = super().get_filters_params(params)
+        lookup_params.pop(CURSOR_VAR, None)
+        return lookup_params
+
+    def get_query_string(self, new_params=None, remove=None):
+        # Sorting, filtering and paging links always start again from the top
+        if not new_params or CURSOR_VAR not in new_params:
+            remove = list(remove or []) + [CURSOR_VAR]
+        return super().get_query_string(new_params, remove)
+
+    def get_ordering(self, request, queryset):
+        ordering = []
+        for field in super().get_ordering(request, queryset):
+            if isinstance(field, str) and field.lstrip('-') != '?':
+                name = field.lstrip('-')
+                try:
+                    model_field = self.lookup_opts.get_field(name)
+                except FieldDoesNotExist:
+                    model_field = None
+                if model_field is not None and getattr(model_field, 'null', False):
+                    field = F(name).desc(nulls_last=True) if field.startswith('-') else F(name).asc(nulls_first=True)
+            ordering.append(field)
+        return ordering
+
+    def get_results(self, request):
+        super().get_results(request)
+        self.count_estimated = getattr(self.paginator, 'estimated', False)
+        self.keyset_fields = self._keyset_fields()
+        self.keyset = (
+            self.keyset_fields is not None and
+            self.result_count > getattr(self.paginator, 'threshold', COUNT_THRESHOLD) and
+            not self.show_all
+        )
+        self.cursor_page = False
+
+        cursor = request.GET.get(CURSOR_VAR)
+        if cursor and self.keyset:
+            values = _decode_cursor(cursor, self.keyset_fields)
+            self.result_list = self.queryset.filter(self._after(values))[:self.list_per_page]
+            self.multi_page = True
+            self.cursor_page = True
+
+    def _keyset_fields(self):
+        """(field, descending) pairs of the ordering, or None if it cannot be a keyset."""
+        fields = []
+        for item in self.queryset.query.order_by:
+            if isinstance(item, str):
+                name, descending = item.lstrip('-'), item.startswith('-')
+            elif isinstance(item, OrderBy) and isinstance(item.expression, F):
+                name, descending = item.expression.name, item.descending
+            else:
+                return None
+            try:
+                field = self.lookup_opts.pk if name == 'pk' else self.lookup_opts.get_field(name)
+            except FieldDoesNotExist:
+                return None
+            if not field.concrete or field.is_relation:
+                return None
+            fields.append((field, descending))
+        return fields or None
+
+    def _after(self, values):
+        """Rows that sort after the given ordering values."""
+        condition = None
+        equal = Q()
+        for (field, descending), value in zip(self.keyset_fields, values):
+            if value is None:
+                # NULLs sort first ascending and last descending
+                after = Q(**{f'{field.name}__isnull': False}) if not descending else None
+                same = Q(**{f'{field.name}__isnull': True})
+            else:
+                after = Q(**{f"{field.name}__{'lt' if descending else 'gt'}": value})
+                if descending and field.null:
+                    after |= Q(**{f'{field.name}__isnull': True})
+                same = Q(**{field.name: value})
+            if after is not None:
+                condition = equal & after if condition is None else condition | (equal & after)
+            equal &= same
+        return condition if condition is not None else Q(pk__in=[])
+
+    def next_page_url(self):
+        """Keyset link to the page after this one, or None on the last page."""
+        if not self.keyset:
+            return None
+        results = list(self.result_list)
+        if len(results) < self.list_per_page:
+            return None
+        last = results[-1]
+        values = [getattr(last, field.attname) for field, _ in self.keyset_fields]
+        return self.get_query_string({CURSOR_VAR: _encode_cursor(values)}, remove=[PAGE_VAR])
+
+    def first_page_url(self):
+        return self.get_query_string()
+
+
+def _encode_cursor(values):
+    values = [
+        value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else
+        str(value) if isinstance(value, (decimal.Decimal, uuid.UUID)) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(values).encode()).decode().rstrip('=')
+
+
+def _decode_cursor(cursor, keyset_fields):
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)))
+        if not isinstance(values, list) or len(values) != len(keyset_fields):
+            raise ValueError('Invalid cursor')
+        return [
+            None if value is None else field.to_python(value)
+            for (field, _), value in zip(keyset_fields, values)
+        ]
+    except (ValueError, TypeError, ValidationError) as e:
+        raise IncorrectLookupParameters(e) from e
+
+
+class LargeTableAdminMixin:
+    """
+    Changelist settings for tables with millions of rows.
+
+    Uses EstimatedCountPaginator, skips the unfiltered total count
+    (``show_full_result_count``) and pages deep results with a keyset
+    cursor (KeysetChangeList). Only these changelists render the First /
+    Next paginator; every other admin keeps Django's own pagination.
+    """
+    change_list_template = 'admin/large_table_change_list.html'
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    count_threshold = COUNT_THRESHOLD
+
+    def get_paginator(self, request, queryset, per_page, orphans=0, allow_empty_first_page=True):
+        return self.paginator(
+            queryset, per_page, orphans, allow_empty_first_page, threshold=self.count_threshold
+        )
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
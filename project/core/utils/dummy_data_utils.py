@@ -7,6 +7,7 @@ from application.models import (
     ApplicationProduct, 
     BulkSubmission
 )
+from application.utils import link_products_to_partners
 from customer.models import Company, Address, SupplyChainCompany, CertificationBody, CustomerProfile
 
 def create_company_info():
@@ -463,6 +464,7 @@ def create_dummy_data():
     submitted_app = create_to_be_submitted_application()
     approved_app = create_to_be_approved_application()
     rejected_app = create_to_be_rejected_application()
+    link_products_to_partners([submitted_app, approved_app, rejected_app])
     bulk_submissions = create_dummy_bulk_submissions()
     
     return {
@@ -0,0 +1,43 @@
+CUSTOMER = 'Customer'
+CUSTOMER_SERVICE = 'Customer Service'
+REVIEWER = 'Reviewer'
+
+
+def get_user_roles(user):
+    """
+    Get the names of the groups (roles) a user belongs to.
+
+    The names are loaded with one query and cached on the user object,
+    like Django's own permission cache. ``request.user`` is created per
+    request, so role checks cost one query per request however often
+    they run.
+
+    Args:
+        user: User instance (or AnonymousUser)
+
+    Returns:
+        frozenset: Group names of the user
+    """
+    roles = getattr(user, '_role_cache', None)
+    if roles is None:
+        if user.is_authenticated:
+            roles = frozenset(user.groups.values_list('name', flat=True))
+        else:
+            roles = frozenset()
+        user._role_cache = roles
+    return roles
+
+
+def is_customer(user):
+    """Check if the user has the Customer role."""
+    return CUSTOMER in get_user_roles(user)
+
+
+def is_customer_service(user):
+    """Check if the user has the Customer Service role."""
+    return CUSTOMER_SERVICE in get_user_roles(user)
+
+
+def is_reviewer(user):
+    """Check if the user has the Reviewer role."""
+    return REVIEWER in get_user_roles(user)
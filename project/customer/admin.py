@@ -1,4 +1,5 @@
 from django.contrib import admin
+from core.utils import LargeTableAdminMixin
 from .models import (
     Address, 
     Company, 
@@ -6,7 +7,12 @@ from .models import (
     CertificationBody
 )
 
-admin.site.register(Address)
+
+class AddressAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    """Address admin with estimated counts and keyset paging for large tables."""
+
+
+admin.site.register(Address, AddressAdmin)
 admin.site.register(Company)
 admin.site.register(SupplyChainCompany)
 admin.site.register(CertificationBody)
\ No newline at end of file
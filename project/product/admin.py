@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.db.models import Count, Exists, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from core.utils import LargeTableAdminMixin
 
 from .forms import (
     ProductModelForm, 
@@ -12,6 +15,30 @@ from .models import (
     RawMaterial
 )
 
+class RawMaterialFilter(admin.SimpleListFilter):
+    """
+    Filter products by raw material.
+
+    Looks the products up in the product/material through table by its
+    indexed material column instead of joining every product's materials.
+    Only materials used by at least one product are offered, so the
+    sidebar does not list the whole material catalogue.
+    """
+    title = 'raw material'
+    parameter_name = 'material'
+
+    def lookups(self, request, model_admin):
+        used = Product.raw_materials.through.objects.filter(rawmaterial_id=OuterRef('pk'))
+        return RawMaterial.objects.filter(Exists(used)).order_by('code').values_list('pk', 'description')
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(pk__in=Product.raw_materials.through.objects.filter(
+                rawmaterial_id=self.value()
+            ).values('product_id'))
+        return queryset
+
+
 class RawMaterialInline(admin.TabularInline):
     """
     Inline editor for managing raw materials associated with products.
@@ -20,12 +47,17 @@ class RawMaterialInline(admin.TabularInline):
     - Displays raw materials as tabular inline entries
     - Uses DAL autocomplete for efficient material selection
     - Allows adding/removing materials without page navigation
+    - Loads the materials with their rows, so large bills of materials
+      render in a constant number of queries
     """
     model = Product.raw_materials.through 
     form = RawMaterialInlineForm
     extra = 1 
 
-class ProductAdmin(admin.ModelAdmin):
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('rawmaterial')
+
+class ProductAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     """
     Custom admin interface for Product management.
     
@@ -34,15 +66,32 @@ class ProductAdmin(admin.ModelAdmin):
     - Inline raw material management
     - Search functionality across related fields
     - Clean form interface with excluded duplicate fields
+    - Estimated counts and keyset paging for large tables
+    - Raw material count column and raw material filter
     """
     form = ProductModelForm
     inlines = [RawMaterialInline]
 
-    list_display = ('name', 'detail__description', 'category__description')
+    list_display = ('name', 'detail__description', 'category__description', 'material_count')
+    list_select_related = ('detail', 'category')
+    list_filter = (RawMaterialFilter,)
     search_fields = ['name', 'detail__description', 'category__description']
     exclude  = ['raw_materials']
     ordering = ['name']
 
+    def get_queryset(self, request):
+        """Annotate the number of raw materials with a correlated count on the through table."""
+        material_counts = Product.raw_materials.through.objects.filter(
+            product=OuterRef('pk')
+        ).order_by().values('product').annotate(count=Count('pk')).values('count')
+        return super().get_queryset(request).annotate(
+            material_count=Coalesce(Subquery(material_counts, output_field=IntegerField()), Value(0))
+        )
+
+    @admin.display(description='Raw materials', ordering='material_count')
+    def material_count(self, obj):
+        return obj.material_count
+
 
 admin.site.register(Product, ProductAdmin)
 admin.site.register(ProductCategory)
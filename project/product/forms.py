@@ -4,6 +4,24 @@ from django import forms
 from .models import Product
 
 
+class PreloadedModelSelect2(autocomplete.ModelSelect2):
+    """
+    Autocomplete select that renders its selected option from a preloaded object.
+
+    ModelSelect2 queries the selected option for every rendered widget; when
+    ``selected_object`` is set (e.g. from a select_related row) it is used
+    instead, so an inline of N rows renders without N queries.
+    """
+    selected_object = None
+
+    def filter_choices_to_render(self, selected_choices):
+        selected = self.selected_object
+        if selected is not None and [str(selected.pk)] == [c for c in selected_choices if c]:
+            self.choices = [(selected.pk, str(selected))]
+        else:
+            super().filter_choices_to_render(selected_choices)
+
+
 class RawMaterialInlineForm(forms.ModelForm):
     """
     Form for inline raw material entries with autocomplete.
@@ -11,14 +29,23 @@ class RawMaterialInlineForm(forms.ModelForm):
     Enables:
     - Quick search and selection of raw materials
     - Validation through the through model
+    - Rendering the selected material from the inline's prefetched rows
     """
     class Meta:
         model = Product.raw_materials.through 
         fields = '__all__'
         widgets = {
-            "rawmaterial": autocomplete.ModelSelect2(url="raw_material_autocomplete"), 
+            "rawmaterial": PreloadedModelSelect2(url="raw_material_autocomplete"), 
         }
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        field = self.fields.get('rawmaterial')
+        if field is not None and self.instance.rawmaterial_id:
+            # The admin wraps the widget (add/change links)
+            widget = getattr(field.widget, 'widget', field.widget)
+            widget.selected_object = self.instance.rawmaterial
+
 
 class ProductModelForm(forms.ModelForm):
     """
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -98,6 +99,21 @@ DATABASES = {
     }
 }
 
+# The cache must be shared by every worker process: cached API responses,
+# certificate verifications and admin row counts are read across processes.
+# Uses Redis when REDIS_URL is set, otherwise the database cache table
+# (created by `migrate`). Never use a per-process cache (LocMemCache).
+REDIS_URL = os.environ.get('REDIS_URL')
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+    } if REDIS_URL else {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+    }
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -160,6 +176,29 @@ LOGGING = {
     },
 }
 
+# Structured tracing for application utils (see application/utils/tracing.py).
+# Spans are appended to this JSONL file; set to None to disable the exporter.
+APPLICATION_TRACE_FILE = BASE_DIR / 'application_traces.jsonl' if DEBUG else None
+
+# Background threads rendering certificates after completion or rejection
+CERTIFICATE_RENDER_WORKERS = 2
+
+# PDF backend for certificates (see application/utils/pdf_backends.py).
+# SimplePdfBackend renders in-process and does not need wkhtmltopdf.
+CERTIFICATE_PDF_BACKEND = 'application.utils.pdf_backends.PdfkitBackend'
+
+# Full-text search backend for applications (see application/utils/search_index.py).
+# Falls back to icontains lookups where the backend is not available.
+APPLICATION_SEARCH_BACKEND = 'application.utils.search_index.Fts5SearchBackend'
+
+# Seconds public certificate verifications are cached for, in the server
+# cache (keyed by digest) and by clients/proxies via Cache-Control
+CERTIFICATE_VERIFICATION_CACHE_TIMEOUT = 300
+
+# Seconds serialized application responses are kept in the server cache.
+# Entries are keyed by the application's revision, so they never go stale.
+APPLICATION_RESPONSE_CACHE_TIMEOUT = 3600
+
 
 # URL prefix for media files 
 MEDIA_URL = '/media/'